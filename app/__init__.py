@@ -18,6 +18,7 @@ from .api.note_routes import note_routes
 from .api.comment_routes import comment_routes
 from .api.search_routes import search_routes
 from .api.aws_routes import aws_routes
+from .api.admin_routes import admin_routes
 
 from .config import Config
 
@@ -78,6 +79,7 @@ app.register_blueprint(note_routes,url_prefix='/api/note')
 app.register_blueprint(comment_routes,url_prefix='/api/comment')
 app.register_blueprint(search_routes,url_prefix='/api/search')
 app.register_blueprint(aws_routes,url_prefix='/api/aws')
+app.register_blueprint(admin_routes,url_prefix='/api/admin')
 
 # Initialize CLI commands
 cli.init_app(app)
@@ -0,0 +1,33 @@
+from flask import Blueprint, current_app, request
+import hmac
+from ..utils.api_utils import error_response, success_response
+from ..utils.caching import cache_manager
+
+admin_routes = Blueprint("admin", __name__)
+
+
+@admin_routes.before_request
+def require_admin_token():
+    """
+    Admin endpoints are for operators, not users: they need the
+    ``X-Admin-Token`` header to match ``ADMIN_API_TOKEN``, and are
+    disabled when no token is configured.
+    """
+    expected = current_app.config.get('ADMIN_API_TOKEN')
+    if not expected:
+        return error_response("Admin API disabled", status_code=404)
+    if not hmac.compare_digest(request.headers.get('X-Admin-Token', ''), expected):
+        return error_response("Invalid admin token", status_code=403)
+
+
+@admin_routes.route('/cache')
+def cache_metrics():
+    """
+    Cache backend stats plus per-cache-type hits, misses, stale serves,
+    refreshes, sets, bytes written, evictions and p50/p99 lookup latency,
+    merged across workers.
+    """
+    return success_response({
+        "stats": cache_manager.get_stats(),
+        "metrics": cache_manager.collect_metrics(),
+    })
@@ -1,5 +1,5 @@
 from flask import Blueprint, jsonify, session, request
-from app.models import User, db
+from app.models import User, UserSearch, db
 from app.schemas.auth_schemas import LoginSchema, SignUpSchema, AuthResponseSchema
 from app.schemas.user_schemas import UserResponseSchema
 from app.utils.api_utils import (
@@ -18,7 +18,7 @@ import logging
 # Phase 4: Production Features
 from app.utils.rate_limiting import smart_rate_limit
 from app.utils.documentation import auth_doc
-from app.utils.caching import invalidate_user_cache
+from app.utils.caching import invalidate_search_cache, invalidate_user_cache
 
 logger = logging.getLogger(__name__)
 auth_routes = Blueprint("session", __name__)
@@ -137,6 +137,8 @@ def sign_up():
         
         db.session.add(user)
         db.session.commit()
+        UserSearch.index_user(user)
+        invalidate_search_cache()
         
         # Log in the new user
         login_user(user)
@@ -2,7 +2,10 @@ import os
 import boto3
 import time
 from flask import Blueprint, request, jsonify
-from ..models import db, User, Post
+from ..models import db, User, UserSearch, Post, Tag, TimelineEntry
+from ..utils.caching import (
+    invalidate_scroll_cache, invalidate_search_cache, invalidate_user_cache, invalidate_user_content
+)
 
 
 aws_routes = Blueprint("aws", __name__)
@@ -23,6 +26,9 @@ def upload(id):
                 return {"error": "User not found"}, 404
             user.profile_image_url = f'https://isntgram.s3.us-east-2.amazonaws.com/{f.filename}'
             db.session.commit()
+            UserSearch.index_user(user)
+            invalidate_user_content(user.id)
+            invalidate_search_cache()
             return {"img": f'https://isntgram.s3.us-east-2.amazonaws.com/{f.filename}'}
         except Exception as e:
             return {"error": str(e)}, 500
@@ -40,7 +46,13 @@ def upload_post(current_user_id, content):
 
         post = Post(user_id=current_user_id, image_url=image_url, caption=content)
         db.session.add(post)
+        db.session.flush()
+        TimelineEntry.fan_out(post.id)
+        Tag.sync_post(post.id, post.caption)
+        User.adjust_counts(post.user_id, posts=1)
         db.session.commit()
+        invalidate_scroll_cache()
+        invalidate_user_cache(post.user_id)
         post_dict = post.to_dict()
         return post_dict
     except AssertionError as message:
@@ -1,5 +1,6 @@
 from flask import Blueprint, request
-from ..models import Comment, User, Like, db
+from ..models import Comment, User, Like, Notification, db
+from ..utils.caching import invalidate_post_cache
 
 
 comment_routes = Blueprint("comment", __name__)
@@ -26,7 +27,11 @@ def post_comment():
         
         comment = Comment(user_id=data['user_id'], post_id=data['post_id'], content=data['content'])
         db.session.add(comment)
+        Post.adjust_counts(post.id, comments=1)
+        db.session.flush()
+        Notification.record_comment(comment.id)
         db.session.commit()
+        invalidate_post_cache(comment.post_id)
         comment_dict = comment.to_dict()
         
         # Handle case where user relationship might not exist (for testing)
@@ -1,6 +1,10 @@
 from flask import Blueprint, request, jsonify
 from sqlalchemy.orm import joinedload
-from ..models import User, Follow, db
+from ..models import User, Follow, Notification, TimelineEntry, db
+from ..schemas.user_schemas import UserPublicSchema
+from ..utils.api_utils import error_response
+from ..utils.caching import invalidate_user_cache
+from ..utils.pagination import InvalidCursorError, keyset_page, page_args
 
 
 #  following = /:id/following
@@ -8,24 +12,44 @@ from ..models import User, Follow, db
 
 follow_routes = Blueprint("follow", __name__)
 
+FOLLOWS_PAGE_SIZE = 20
+
+
+def follows_page(query, cursor, limit):
+    """
+    One cursor page of ``(Follow, User)`` rows from a single joined query,
+    serialized as follow dicts with a public user summary; returns the
+    follows and the next cursor.
+    """
+    rows, next_cursor = keyset_page(
+        query, Follow.created_at, Follow.id, cursor, limit,
+        row_key=lambda row: (row.Follow.created_at, row.Follow.id)
+    )
+    follows = [
+        dict(row.Follow.to_dict(), user=UserPublicSchema.model_validate(row.User).model_dump())
+        for row in rows
+    ]
+    return follows, next_cursor
+
+
+def _follows_response(query):
+    cursor, limit = page_args(default_limit=FOLLOWS_PAGE_SIZE)
+    try:
+        follows, next_cursor = follows_page(query, cursor, limit)
+    except InvalidCursorError:
+        return error_response("Invalid cursor", status_code=400)
+    return {"follows": follows, "next_cursor": next_cursor}
+
+
 # users who follow user of <id>
-@follow_routes.route('/<id>')
+@follow_routes.route('/<int:id>')
 def get_follows(id):
-    follows = Follow.query.filter(Follow.user_followed_id == id).all()
+    return _follows_response(Follow.followers_with_users(id))
 
-    follows_list = []
-    for follow in follows:
-        follows_list.append(follow.to_dict())
-    return {"follows": follows_list}
-
-@follow_routes.route('<id>/following')
+# users followed by user of <id>
+@follow_routes.route('/<int:id>/following')
 def get_following(id):
-    follows = Follow.query.filter(Follow.user_id == id).all()
-
-    follows_list = []
-    for follow in follows:
-        follows_list.append(follow.to_dict())
-    return {"follows": follows_list}
+    return _follows_response(Follow.following_with_users(id))
 
 @follow_routes.route('', methods=["POST"])
 def follow_user():
@@ -35,7 +59,14 @@ def follow_user():
         return {"error": "Already Follow!"}
     follow = Follow(user_id = data['user_id'], user_followed_id = data['user_followed_id'])
     db.session.add(follow)
+    db.session.flush()
+    TimelineEntry.backfill(follow.user_followed_id, follow.user_id)
+    Notification.record_follow(follow.id)
+    User.adjust_counts(follow.user_id, following=1)
+    User.adjust_counts(follow.user_followed_id, followers=1)
     db.session.commit()
+    invalidate_user_cache(follow.user_id)
+    invalidate_user_cache(follow.user_followed_id)
     return follow.to_dict()
 
 @follow_routes.route('', methods = ["DELETE"])
@@ -46,5 +77,11 @@ def delete_follow():
         return {"error": "Doesn't follow!"}
     follow = Follow.query.filter(Follow.user_id == data['user_id']).filter(Follow.user_followed_id == data['user_followed_id']).first()
     db.session.delete(follow)
+    TimelineEntry.prune(follow.user_followed_id, follow.user_id)
+    Notification.remove("follow", follow.id)
+    User.adjust_counts(follow.user_id, following=-1)
+    User.adjust_counts(follow.user_followed_id, followers=-1)
     db.session.commit()
+    invalidate_user_cache(follow.user_id)
+    invalidate_user_cache(follow.user_followed_id)
     return follow.to_dict()
@@ -1,11 +1,36 @@
 from flask import Blueprint, request, jsonify
+from sqlalchemy import select
 from sqlalchemy.orm import joinedload
-from ..models import db, User, Like, Post, Comment
+from ..models import db, User, Like, Post, Comment, Notification
+from ..models.like import POST_LIKEABLE_TYPES, COMMENT_LIKEABLE_TYPES
+from ..utils.caching import invalidate_post_cache, invalidate_post_details
 
 
 like_routes = Blueprint("like", __name__)
 
 
+def _adjust_like_count(likeable_type, likeable_id, delta):
+    """Shift the liked row's denormalized like_count in the current transaction."""
+    if likeable_type in POST_LIKEABLE_TYPES:
+        Post.adjust_counts(likeable_id, likes=delta)
+    elif likeable_type in COMMENT_LIKEABLE_TYPES:
+        Comment.adjust_like_count(likeable_id, delta)
+
+
+def _invalidate_liked(likeable_type, likeable_id):
+    """
+    Drop cached payloads showing the liked row's like count: for a post,
+    every entry tagged with it (details, scroll pages, profile grid); for a
+    comment, only its post's details, the one payload embedding comments.
+    """
+    if likeable_type in POST_LIKEABLE_TYPES:
+        invalidate_post_cache(likeable_id)
+    elif likeable_type in COMMENT_LIKEABLE_TYPES:
+        post_id = db.session.scalar(select(Comment.post_id).where(Comment.id == likeable_id))
+        if post_id is not None:
+            invalidate_post_details(post_id)
+
+
 @like_routes.route("/user/<id>")
 def get_user_likes(id):
     like_list = []
@@ -39,7 +64,11 @@ def post_like():
         likeable_type=data["likeable_type"],
     )
     db.session.add(like)
+    _adjust_like_count(data["likeable_type"], data["id"], 1)
+    db.session.flush()
+    Notification.record_like(like.id)
     db.session.commit()
+    _invalidate_liked(data["likeable_type"], data["id"])
 
     likes = (
         Like.query.filter(Like.likeable_id == data["id"])
@@ -58,7 +87,10 @@ def delete_like():
     like = Like.query.filter(Like.id == data["id"]).first()
 
     db.session.delete(like)
+    _adjust_like_count(like.likeable_type, like.likeable_id, -1)
+    Notification.remove("like", like.id)
     db.session.commit()
+    _invalidate_liked(like.likeable_type, like.likeable_id)
 
     
     return like.to_dict()
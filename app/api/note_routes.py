@@ -1,60 +1,91 @@
-from flask import Blueprint, request
-from sqlalchemy.orm import joinedload
-from ..models import db, Post, User, Follow, Like, Comment
+from flask import Blueprint
+from flask_login import login_required, current_user
+from ..models import db, Post, Follow, Like, Comment, Notification
+from ..utils.api_utils import error_response
+from ..utils.pagination import InvalidCursorError, keyset_page, page_args
 
 note_routes = Blueprint("note", __name__)
 
+NOTES_PAGE_SIZE = 20
+
+NOTE_SOURCES = {"follow": Follow, "like": Like, "comment": Comment}
+
+
+def _serialize_notes(notifications):
+    """Serialize notifications with their source rows, actors and posts loaded in batch."""
+    sources = {}
+    for kind, model in NOTE_SOURCES.items():
+        ids = [note.source_id for note in notifications if note.kind == kind]
+        if ids:
+            sources.update({(kind, row.id): row for row in model.query.filter(model.id.in_(ids)).all()})
+
+    post_ids = {note.post_id for note in notifications} - {None}
+    posts = {post.id: post for post in Post.query.filter(Post.id.in_(post_ids)).all()} if post_ids else {}
+
+    notes = []
+    for notification in notifications:
+        row = sources.get((notification.kind, notification.source_id))
+        if row is None:
+            continue
+        note = row.to_dict()
+        note["user"] = row.user.to_dict()
+        note["type"] = notification.kind
+        note["is_read"] = notification.read_at is not None
+        if notification.kind != "follow":
+            post = posts.get(notification.post_id)
+            note["post"] = post.to_dict() if post else None
+        notes.append(note)
+    return notes
+
 
 @note_routes.route('/<id>/scroll/<length>')
 def index(id, length):
+    """Activity feed by offset; one range scan on the recipient's notifications."""
     length = int(length)
+    notifications = (
+        Notification.for_recipient(id)
+        .order_by(Notification.created_at.desc(), Notification.id.desc())
+        .offset(length)
+        .limit(NOTES_PAGE_SIZE)
+        .all()
+    )
+    return {"notes": _serialize_notes(notifications)}
+
+
+@note_routes.route('/<int:id>/scroll')
+def index_cursor(id):
+    """
+    Activity feed with keyset pagination.
+    Every page is a range scan on ``ix_notifications_recipient_created``,
+    so its cost does not grow with account age.
+    """
+    cursor, limit = page_args(default_limit=NOTES_PAGE_SIZE)
+    try:
+        notifications, next_cursor = keyset_page(
+            Notification.for_recipient(id),
+            Notification.created_at, Notification.id, cursor, limit
+        )
+    except InvalidCursorError:
+        return error_response("Invalid cursor", status_code=400)
+
+    return {"notes": _serialize_notes(notifications), "next_cursor": next_cursor}
+
+
+@note_routes.route('/<int:id>/unread')
+@login_required
+def unread_count(id):
+    """Number of notifications the signed-in user has not marked read."""
+    if id != current_user.id:
+        return error_response("Not authorized to view these notifications", status_code=403)
+    return {"unread_count": Notification.unread_count(id)}
+
 
-    follows_list = []
-    likes_list = []
-    comments_list = []
-
-    user = User.query.filter(User.id == id).first()
-    user_post_ids = list(map(lambda post: post.id, user.posts))
-    user_comment_ids = list(map(lambda comment: comment.id, user.comments))
-
-    follows = Follow.query.filter(Follow.user_followed_id == id).order_by(Follow.created_at.desc()).all()
-
-    for follow in follows:
-        follows_dict = follow.to_dict()
-        user = follow.user.to_dict()
-        follows_dict['user'] = user
-        follows_dict['type'] = "follow"
-        follows_list.append(follows_dict)
-
-
-    all_likes_list = Like.query.filter(Like.likeable_id.in_(user_comment_ids)).order_by(Like.created_at.desc()).all()
-    
-    for like in all_likes_list:
-        like_dict = like.to_dict()
-        user = like.user.to_dict()
-        if like_dict['likeable_type'] == 'post':
-            post = Post.query.filter(Post.id == like_dict['likeable_id']).first()
-        else:
-            post = Post.query.filter(Comment.id == like_dict['likeable_id']).first()
-        like_dict['user'] = user
-        like_dict['post'] = post.to_dict()
-        like_dict['type'] = "like"
-        likes_list.append(like_dict)
-
-    comments = Comment.query.filter(Comment.post_id.in_(user_post_ids)).order_by(Comment.created_at.desc()).all()
-
-    for comment in comments:
-        comment_dict = comment.to_dict()
-        user = comment.user.to_dict()
-        post = comment.post.to_dict()
-        comment_dict['user'] = user
-        comment_dict['post'] = post 
-        comment_dict['type'] = "comment"
-        comments_list.append(comment_dict)
-
-    note_list = follows_list + likes_list + comments_list
-    
-    sorted_note_list = sorted(note_list, key=lambda note: note['created_at'])
-    sorted_note_list.reverse()
-
-    return {"notes": sorted_note_list[length: length + 20]}
+@note_routes.route('/<int:id>/read', methods=["POST"])
+@login_required
+def mark_read(id):
+    """Mark all of the signed-in user's notifications as read."""
+    if id != current_user.id:
+        return error_response("Not authorized to update these notifications", status_code=403)
+    marked = Notification.mark_read(id)
+    db.session.commit()
+    return {"marked_read": marked, "unread_count": 0}
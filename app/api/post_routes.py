@@ -1,10 +1,10 @@
-from flask import Blueprint, request, jsonify
-from sqlalchemy import desc, func
+from flask import Blueprint, request, jsonify, session
+from sqlalchemy import desc, func, select
 from sqlalchemy.orm import joinedload, selectinload
 from flask_login import login_required, current_user
 from pydantic import ValidationError
 
-from ..models import db, Post, User, Follow, Like, Comment
+from ..models import db, Post, PostScore, Tag, User, Like, Comment, Notification, TimelineEntry
 from ..schemas.post_schemas import (
     PostCreateSchema, 
     PostUpdateSchema, 
@@ -18,88 +18,191 @@ from ..utils.api_utils import (
     error_response,
     NotFoundAPIError
 )
+from ..utils.caching import (
+    EntityCache,
+    hydrate,
+    post_details_key,
+    post_dict_tags,
+    user_summary_key,
+    user_tag,
+    post_scroll_cache,
+    invalidate_post_cache,
+    invalidate_scroll_cache,
+    invalidate_user_cache
+)
+from ..utils.pagination import InvalidCursorError, keyset_page, page_args
+from ..utils.sampling import IdPermutation, new_seed
 import logging
 
 logger = logging.getLogger(__name__)
 post_routes = Blueprint("posts", __name__)
 
+EXPLORE_PAGE_SIZE = 3
+# Permutation positions probed by the first IN query of a page; each further
+# probe doubles the window up to the cap, so a gap-ridden id range is crossed
+# in a number of queries logarithmic in the gap and linear in span / cap
+EXPLORE_WINDOW = 12
+EXPLORE_MAX_WINDOW = 768
+
+
+@post_scroll_cache()
+def _scroll_page(length: int):
+    posts = (Post.query
+            .options(joinedload(Post.user))  # Load user data in single query
+            .order_by(desc(Post.created_at))
+            .offset(length)
+            .limit(3)
+            .all())
+    return [post.to_dict_with_user() for post in posts]
+
 
 @post_routes.route("/scroll/<int:length>")
 def index(length: int):
     """
     Get paginated posts for infinite scroll with optimized queries.
-    Uses modern SQLAlchemy 2.0 patterns and eliminates N+1 queries.
+    Like and comment counts are read from the denormalized counters on
+    each post, so a page is a single round trip; pages are cached under
+    ``post_scroll:offset:<length>``.
     """
     try:
-        # Optimized query with joined loading to prevent N+1 queries
-        posts = (Post.query
-                .options(joinedload(Post.user))  # Load user data in single query
-                .order_by(desc(Post.created_at))
-                .offset(length)
-                .limit(3)
-                .all())
+        return success_response({"posts": _scroll_page(length)})
         
-        post_list = []
-        for post in posts:
-            # Use optimized to_dict_with_user method from modernized model
-            post_dict = post.to_dict_with_user()
-            
-            # Get aggregated counts efficiently
-            likes_count = Like.query.filter(
-                Like.likeable_id == post.id, 
-                Like.likeable_type == "Post"
-            ).count()
-            
-            comments_count = Comment.query.filter(
-                Comment.post_id == post.id
-            ).count()
-            
-            post_dict["like_count"] = likes_count
-            post_dict["comment_count"] = comments_count
-            post_list.append(post_dict)
+    except Exception as e:
+        logger.error(f"Error fetching posts: {str(e)}")
+        return error_response("Failed to fetch posts", status_code=500)
+
+
+@post_routes.route("/scroll")
+def index_cursor():
+    """
+    Get posts for infinite scroll with keyset pagination.
+    Pass the previous page's ``next_cursor`` as ``?cursor=``; every page is a
+    range scan on ix_posts_created_at, so cost does not grow with depth.
+    """
+    try:
+        cursor, limit = page_args()
+        posts, next_cursor = keyset_page(
+            Post.query.options(joinedload(Post.user)),
+            Post.created_at, Post.id, cursor, limit
+        )
         
-        return success_response({"posts": post_list})
+        return success_response({
+            "posts": [post.to_dict_with_user() for post in posts],
+            "next_cursor": next_cursor
+        })
         
+    except InvalidCursorError:
+        return error_response("Invalid cursor", status_code=400)
     except Exception as e:
         logger.error(f"Error fetching posts: {str(e)}")
         return error_response("Failed to fetch posts", status_code=500)
 
 
+def _explore_cursor(mode: str):
+    """
+    Position in ``?cursor=`` for an explore mode (``'r'`` ranked, ``'s'``
+    sampled), or ``None`` without one. A cursor from the other mode (the
+    ranking appeared mid-session) is ignored, so paging restarts.
+    """
+    cursor = request.args.get("cursor")
+    if not cursor:
+        return None
+    if cursor[0] not in "rs" or not cursor[1:].isdigit():
+        raise InvalidCursorError(f"Invalid cursor: {cursor}")
+    return int(cursor[1:]) if cursor[0] == mode else None
+
+
+def _explore_ranked(query, length):
+    """
+    One page of the precomputed ranking after the cursor's rank (or rank
+    ``length`` without a cursor): the range scan ``rank > last_rank`` on
+    the ``post_scores.rank`` index, which skips the holes deletes leave.
+    """
+    after = _explore_cursor("r")
+    if after is None:
+        after = length
+    rows = (query
+            .add_columns(PostScore.rank)
+            .join(PostScore, PostScore.post_id == Post.id)
+            .filter(PostScore.rank > after)
+            .order_by(PostScore.rank)
+            .limit(EXPLORE_PAGE_SIZE + 1)
+            .all())
+
+    next_cursor = None
+    if len(rows) > EXPLORE_PAGE_SIZE:
+        rows = rows[:EXPLORE_PAGE_SIZE]
+        next_cursor = f"r{rows[-1].rank}"
+    return [row[0] for row in rows], next_cursor
+
+
+def _explore_sample(query, length):
+    """
+    One explore page from this session's seeded permutation of the post id
+    range (stored in the session on the first page), so pages never repeat
+    and each page costs a few primary-key lookups however large the table is.
+    The cursor is the next permutation position.
+
+    Ids of deleted posts are gaps in the permutation. A page keeps probing,
+    in windows that double up to ``EXPLORE_MAX_WINDOW``, until it is full or
+    the permutation is exhausted, so it only comes back short on the last
+    page. This is only the fallback until ``score-posts`` has run.
+    """
+    resume = _explore_cursor("s")
+    state = session.get("explore")
+    if (length == 0 and resume is None) or not state:
+        span = db.session.scalar(select(func.max(Post.id))) or 0
+        state = {"seed": new_seed(), "span": span, "position": 0, "served": 0}
+    if resume is not None:
+        state["position"] = min(resume, state["span"])
+    elif state["served"] != length:
+        # Client jumped (e.g. reloaded mid-scroll); resume near its offset
+        state["position"] = min(length, state["span"])
+
+    permutation = IdPermutation(state["seed"], state["span"])
+    position = state["position"]
+    posts, window = [], EXPLORE_WINDOW
+    while len(posts) < EXPLORE_PAGE_SIZE and position < permutation.span:
+        ids = permutation.ids(position, window)
+        found = {post.id: post for post in query.filter(Post.id.in_(ids)).all()}
+        for post_id in ids:
+            position += 1
+            if post_id in found:
+                posts.append(found[post_id])
+                if len(posts) == EXPLORE_PAGE_SIZE:
+                    break
+        window = min(window * 2, EXPLORE_MAX_WINDOW)
+
+    session["explore"] = dict(state, position=position, served=length + len(posts))
+    next_cursor = f"s{position}" if position < permutation.span else None
+    return posts, next_cursor
+
+
 @post_routes.route("/explore/<int:length>")
 def explore(length: int):
     """
-    Get randomized posts for explore page with optimized queries.
-    Uses modern SQLAlchemy 2.0 patterns for better performance.
+    Get explore posts with optimized queries.
+
+    Posts come in precomputed engagement order (``flask database
+    score-posts``), keyset paged by rank; until a ranking exists, pages are
+    sampled randomly per session. Pass the previous page's ``next_cursor``
+    as ``?cursor=``; it is ``null`` once the feed is exhausted.
     """
     try:
-        # Optimized randomized query with joined loading
-        posts = (Post.query
-                .options(joinedload(Post.user))
-                .order_by(func.random())
-                .offset(length)
-                .limit(3)
-                .all())
-        
-        post_list = []
-        for post in posts:
-            post_dict = post.to_dict_with_user()
-            
-            # Efficient count queries with proper polymorphic filtering
-            likes_count = Like.query.filter(
-                Like.likeable_id == post.id,
-                Like.likeable_type == "Post"
-            ).count()
-            
-            comments_count = Comment.query.filter(
-                Comment.post_id == post.id
-            ).count()
-            
-            post_dict["like_count"] = likes_count
-            post_dict["comment_count"] = comments_count
-            post_list.append(post_dict)
-        
-        return success_response({"posts": post_list})
-        
+        query = Post.query.options(joinedload(Post.user))
+
+        if PostScore.is_populated():
+            posts, next_cursor = _explore_ranked(query, length)
+        else:
+            posts, next_cursor = _explore_sample(query, length)
+
+        return success_response({
+            "posts": [post.to_dict_with_user() for post in posts],
+            "next_cursor": next_cursor
+        })
+
+    except InvalidCursorError:
+        return error_response("Invalid cursor", status_code=400)
     except Exception as e:
         logger.error(f"Error fetching explore posts: {str(e)}")
         return error_response("Failed to fetch explore posts", status_code=500)
@@ -123,7 +226,13 @@ def create_post():
         )
         
         db.session.add(post)
+        db.session.flush()
+        TimelineEntry.fan_out(post.id)
+        Tag.sync_post(post.id, post.caption)
+        User.adjust_counts(post.user_id, posts=1)
         db.session.commit()
+        invalidate_scroll_cache()
+        invalidate_user_cache(post.user_id)
         
         # Return post with user data using optimized loading
         post_with_user = (Post.query
@@ -132,8 +241,6 @@ def create_post():
                          .first())
         
         post_response = post_with_user.to_dict_with_user()
-        post_response["like_count"] = 0
-        post_response["comment_count"] = 0
         
         return success_response(
             {"post": post_response}, 
@@ -169,7 +276,9 @@ def update_post(post_id: int):
         
         # Update post
         post.caption = update_data.caption
+        Tag.sync_post(post.id, post.caption)
         db.session.commit()
+        invalidate_post_cache(post.id)
         
         # Return updated post
         post_response = post.to_dict_with_user()
@@ -203,8 +312,17 @@ def delete_post(post_id: int):
             return error_response("Not authorized to delete this post", status_code=403)
         
         # Delete post (cascade will handle comments/likes)
+        TimelineEntry.remove_post(post.id)
+        Notification.remove_post(post.id)
+        PostScore.remove_post(post.id)
+        Tag.remove_post(post.id)
+        User.adjust_counts(post.user_id, posts=-1)
         db.session.delete(post)
         db.session.commit()
+        invalidate_post_cache(post_id)
+        # Later offset pages shift up by one, not just the pages showing the post
+        invalidate_scroll_cache()
+        invalidate_user_cache(current_user.id)
         
         return success_response(message="Post deleted successfully")
         
@@ -214,84 +332,134 @@ def delete_post(post_id: int):
         return error_response("Failed to delete post", status_code=500)
 
 
-@post_routes.route("/<id>/scroll/<length>")
-def home_feed(id, length):
-    length = int(length)
-    post_list = []
-    followed_users = Follow.query.filter(Follow.user_followed_id == id).all()
-    follow_list = []
-    for followed in followed_users:
-        followed_dict = followed.to_dict()
-        follow_list.append(followed_dict["user_id"])
-    posts = (
-        Post.query.filter(Post.user_id.in_(follow_list))
-        .order_by(desc(Post.created_at))
-        .offset(length)
-        .limit(3)
-        .all()
-    )
+def _viewer_id():
+    """Id of the signed-in user, or ``None`` for anonymous requests."""
+    if current_user.is_authenticated:
+        return current_user.id
+    return None
 
-    for post in posts:
-        post_dict = post.to_dict()
-        user = post.user
-        post_dict["user"] = user.to_dict()
 
-        likes = (
-            Like.query.filter(Like.likeable_id == post.id)
-            .filter(Like.likeable_type == "post")
-            .all()
-        )
+def _feed_post_dict(post):
+    """Serialize a feed post with its comments; the author is attached from its user summary."""
+    post_dict = post.to_dict()
+    post_dict["comments"] = [comment.to_dict_with_user() for comment in post.comments]
+    return post_dict
 
-        likes_list = []
-        for like in likes:
-            likes_list.append(like.to_dict())
 
-        post_dict["likes"] = likes_list
+def _load_feed_posts(post_ids):
+    """Serialized posts with comments for ``post_ids``, in one IN query."""
+    posts = (Post.query
+             .options(selectinload(Post.comments).joinedload(Comment.user))
+             .filter(Post.id.in_(post_ids))
+             .all())
+    return {post.id: _feed_post_dict(post) for post in posts}
 
-        comments = post.comments
 
-        comments_list = []
+def _load_user_summaries(user_ids):
+    """Serialized users for ``user_ids``, in one IN query."""
+    return {user.id: user.to_dict() for user in User.query.filter(User.id.in_(user_ids))}
 
-        for comment in comments:
-            comment_dict = comment.to_dict()
-            comment_dict["user"] = comment.user.to_dict()
-            comments_list.append(comment_dict)
 
-        post_dict["comments"] = comments_list
-        post_list.append(post_dict)
-        if len(post_list) == 3:
-            return {"posts": post_list}
-    return {"posts": post_list}
+# Per-entity caches: posts under post_details:post_id:<id>, authors under
+# user_summary:user_id:<id>, so a page hydrates both in one cache round trip
+POST_ENTITY = EntityCache('post_details', post_details_key, _load_feed_posts, post_dict_tags)
+USER_SUMMARY = EntityCache('user_summary', user_summary_key, _load_user_summaries,
+                           lambda user: {user_tag(user["id"])})
 
 
-@post_routes.route("/<post_id>")
-def get_post(post_id):
+def _hydrate_feed_posts(refs):
+    """
+    Viewer-independent payloads for ``(post_id, author_id)`` pairs, in
+    order: one cache round trip for posts and authors, and one IN query per
+    entity type for the misses. Posts deleted since the ids were read are
+    dropped.
+    """
+    posts, users = hydrate(
+        (POST_ENTITY, [post_id for post_id, _ in refs]),
+        (USER_SUMMARY, [author_id for _, author_id in refs]),
+    )
+    return [dict(posts[post_id], user=users[author_id])
+            for post_id, author_id in refs
+            if post_id in posts and author_id in users]
 
-    post = Post.query.filter(Post.id == post_id).first()
-    
-    if not post:
-        return error_response("Post not found", status_code=404)
 
-    post_dict = post.to_dict()
+def _with_viewer_state(post_dicts, viewer_id):
+    """
+    Add ``viewer_has_liked`` to serialized posts. Like totals come from the
+    denormalized ``like_count``; the viewer's own likes cost one IN query
+    per page, so payload size does not grow with a post's popularity.
+    """
+    liked = set()
+    if viewer_id is not None:
+        liked = Like.liked_post_ids(viewer_id, [post_dict["id"] for post_dict in post_dicts])
+    return [dict(post_dict, viewer_has_liked=post_dict["id"] in liked) for post_dict in post_dicts]
 
-    post_dict["user"] = post.user.to_dict()
-    comments = post.comments
-    comments_list = []
 
-    for comment in comments:
-        comment_dict = comment.to_dict()
-        comment_dict["user"] = comment.user.to_dict()
-        comments_list.append(comment_dict)
+def _feed_post_dicts(entries, viewer_id):
+    """Hydrate a page of timeline entries with the viewer's like state."""
+    refs = [(entry.post_id, entry.author_id) for entry in entries]
+    return _with_viewer_state(_hydrate_feed_posts(refs), viewer_id)
 
-    post_dict["comments"] = comments_list
 
-    likes = Like.query.filter(
-        Like.likeable_type == "post", Like.likeable_id == post_id
-    ).all()
+def _post_details(post_id):
+    """
+    Viewer-independent post payload from the post and user summary caches.
+    The author id is only known once the post is read, so this takes two
+    cache round trips but no queries when both are cached.
+    """
+    post = hydrate((POST_ENTITY, [post_id]))[0].get(post_id)
+    if post is None:
+        return None
+    author = hydrate((USER_SUMMARY, [post["user_id"]]))[0].get(post["user_id"])
+    return dict(post, user=author)
 
-    likeList = []
-    for like in likes:
-        likeList.append(like.to_dict())
-    post_dict["likes"] = likeList
 
-    return {"post": post_dict}
+@post_routes.route("/<id>/scroll/<length>")
+def home_feed(id, length):
+    """
+    Home feed read from the user's materialized timeline.
+    One indexed range scan on timeline_entries per page yields post and
+    author ids, which are hydrated from the per-entity caches.
+    """
+    length = int(length)
+    entries = (
+        TimelineEntry.entries_query(id)
+        .order_by(desc(TimelineEntry.post_created_at), desc(TimelineEntry.post_id))
+        .offset(length)
+        .limit(3)
+        .all()
+    )
+
+    return {"posts": _feed_post_dicts(entries, _viewer_id())}
+
+
+@post_routes.route("/<int:id>/scroll")
+def home_feed_cursor(id):
+    """
+    Home feed with keyset pagination.
+    Same content as ``home_feed`` but paged by ``?cursor=`` instead of offset.
+    """
+    cursor, limit = page_args()
+    try:
+        entries, next_cursor = keyset_page(
+            TimelineEntry.entries_query(id),
+            TimelineEntry.post_created_at, TimelineEntry.post_id, cursor, limit
+        )
+    except InvalidCursorError:
+        return error_response("Invalid cursor", status_code=400)
+
+    return {
+        "posts": _feed_post_dicts(entries, _viewer_id()),
+        "next_cursor": next_cursor
+    }
+
+
+@post_routes.route("/<int:post_id>")
+def get_post(post_id):
+    """Single post with its user, comments and viewer like state in a fixed number of queries."""
+    post = _post_details(post_id)
+    
+    if not post:
+        return error_response("Post not found", status_code=404)
+
+    return {"post": _with_viewer_state([post], _viewer_id())[0]}
@@ -1,47 +1,126 @@
 from flask import Blueprint, request, jsonify
+from sqlalchemy import case
 from sqlalchemy.orm import joinedload
-from ..models import db, Post, User, Follow, Like, Comment
+from ..models import db, Post, User, Follow
+from ..utils.api_utils import error_response
+from ..utils.caching import user_profile_cache
+from ..utils.pagination import InvalidCursorError, keyset_page, page_args
+from .follow_routes import follows_page
 
 profile_routes = Blueprint("profile", __name__)
 
+PROFILE_POSTS_PAGE_SIZE = 12
+PROFILE_FOLLOWS_PAGE_SIZE = 20
+
+
+def _find_user(username):
+    """
+    Resolve a profile by username, or by numeric id for backward
+    compatibility, in one query; a username match wins over an id match.
+    """
+    criteria = User.username == username
+    if username.isdigit():
+        criteria = criteria | (User.id == int(username))
+    return (User.query
+            .filter(criteria)
+            .order_by(case((User.username == username, 0), else_=1))
+            .first())
+
+
+def _posts_page(user_id, cursor, limit):
+    return keyset_page(
+        Post.query.filter(Post.user_id == user_id),
+        Post.created_at, Post.id, cursor, limit
+    )
+
+
+def _follows_page(query, cursor, limit):
+    """One page of follows, newest first."""
+    return keyset_page(query, Follow.created_at, Follow.id, cursor, limit)
+
+
+@user_profile_cache()
+def _profile_header(user_id):
+    """Profile header payload, cached under ``user_profile:user_id:<id>``."""
+    # Already in the identity map when called right after _find_user
+    user = db.session.get(User, user_id)
+    posts, posts_cursor = _posts_page(user.id, None, PROFILE_POSTS_PAGE_SIZE)
+    followers, followers_cursor = _follows_page(
+        Follow.followers_of(user.id), None, PROFILE_FOLLOWS_PAGE_SIZE)
+    following, following_cursor = _follows_page(
+        Follow.following_of(user.id), None, PROFILE_FOLLOWS_PAGE_SIZE)
+
+    return {
+        "num_posts": user.post_count,
+        "follower_count": user.follower_count,
+        "following_count": user.following_count,
+        "user": user.to_dict(),
+        "posts": [post.to_dict() for post in posts],
+        "posts_next_cursor": posts_cursor,
+        "followersList": [follow.to_dict() for follow in followers],
+        "followers_next_cursor": followers_cursor,
+        "followingList": [follow.to_dict() for follow in following],
+        "following_next_cursor": following_cursor,
+    }
+
 
 @profile_routes.route('/<username>')
 def index(username):
-    # Try to find user by username first, then by ID as fallback
-    user = User.query.filter(User.username == username).first()
+    """
+    Profile header: the user, its denormalized counts and the first page of posts,
+    followers and following. Further pages come from the paged endpoints
+    below, so response size is bounded however popular the profile is.
+    Everything after the username lookup is served from the profile cache.
+    """
+    user = _find_user(username)
+    if not user:
+        return {"error": "User not found"}, 404
+
+    return _profile_header(user.id)
+
+
+@profile_routes.route('/<username>/posts')
+def posts(username):
+    """Profile posts grid, newest first, paged by ``?cursor=``."""
+    user = _find_user(username)
     if not user:
-        # Try as numeric ID for backward compatibility
-        try:
-            user_id = int(username)
-            user = User.query.filter(User.id == user_id).first()
-        except ValueError:
-            user = None
-    
+        return {"error": "User not found"}, 404
+
+    cursor, limit = page_args(default_limit=PROFILE_POSTS_PAGE_SIZE)
+    try:
+        rows, next_cursor = _posts_page(user.id, cursor, limit)
+    except InvalidCursorError:
+        return error_response("Invalid cursor", status_code=400)
+
+    return {"posts": [post.to_dict() for post in rows], "next_cursor": next_cursor}
+
+
+def _follow_list(username, follows_query, key):
+    """
+    One page of a profile's follow list with public user summaries (no
+    email), shared with ``/api/follow``; ``follows_query`` maps the
+    profile's user id to the joined ``(Follow, User)`` query.
+    """
+    user = _find_user(username)
     if not user:
         return {"error": "User not found"}, 404
-    
-    user_id = user.id
-    post_count = Post.query.filter(Post.user_id == user_id).count()
-    followers = Follow.query.filter(Follow.user_followed_id == user_id).all()
-    follows = Follow.query.filter(Follow.user_id == user_id).all()
-    posts = Post.query.filter(Post.user_id == user_id).all()
-    posts.reverse()
-    plist = []
-
-    followersList = []
-    followsList = []
-
-    for follower in followers:
-        followersList.append(follower.to_dict())
-
-    for follower in follows:
-        followsList.append(follower.to_dict())
-
-    for post in posts:
-        post_dict = post.to_dict()
-        likes = Like.query.filter((Like.likeable_id == post_dict["id"]) & (Like.likeable_type == 'post')).count()
-        comments = Comment.query.filter(Comment.post_id == post_dict["id"]).count()
-        post_dict["like_count"] = likes
-        post_dict["comment_count"] = comments
-        plist.append(post_dict)
-    return {"num_posts": post_count, "posts": plist, "followersList": followersList, "followingList": followsList, "user": user.to_dict() }
+
+    cursor, limit = page_args(default_limit=PROFILE_FOLLOWS_PAGE_SIZE)
+    try:
+        follows, next_cursor = follows_page(follows_query(user.id), cursor, limit)
+    except InvalidCursorError:
+        return error_response("Invalid cursor", status_code=400)
+
+    return {key: follows, "next_cursor": next_cursor}
+
+
+@profile_routes.route('/<username>/followers')
+def followers(username):
+    """Users following the profile, newest follow first, paged by ``?cursor=``."""
+    return _follow_list(username, Follow.followers_with_users, "followers")
+
+
+@profile_routes.route('/<username>/following')
+def following(username):
+    """Users the profile follows, newest follow first, paged by ``?cursor=``."""
+    return _follow_list(username, Follow.following_with_users, "following")
@@ -1,37 +1,94 @@
 from flask import Blueprint, request
-from ..models import User, db
+from sqlalchemy.orm import joinedload
+from ..models import Post, Tag, UserSearch
+from ..models.search import SEARCH_PAGE_SIZE, TYPEAHEAD_PAGE_SIZE
 from ..utils.api_utils import error_response
+from ..utils.caching import cache_manager, counted_get, normalize_search_term, record_search, search_cache_key, search_timeout
+from ..utils.pagination import MAX_PAGE_SIZE, InvalidCursorError, keyset_page, page_args
 import logging
 
 logger = logging.getLogger(__name__)
 
 search_routes = Blueprint("query", __name__)
 
+HASHTAG_PAGE_SIZE = 12
+
+
+def _hashtag_search(tag):
+    """
+    Posts carrying ``tag``, newest first, paged by ``?cursor=``. The keyset
+    is the post date copied onto the tag row, so each page is a range scan
+    on ``ix_tags_content_created``.
+    """
+    cursor, limit = page_args(default_limit=HASHTAG_PAGE_SIZE)
+    if not Tag.normalize(tag):
+        return {"results": [], "next_cursor": None}
+
+    try:
+        posts, next_cursor = keyset_page(
+            Tag.posts_query(tag).options(joinedload(Post.user)),
+            Tag.taggable_created_at, Tag.taggable_id, cursor, limit,
+            row_key=lambda post: (post.created_at, post.id)
+        )
+    except InvalidCursorError:
+        return error_response("Invalid cursor", status_code=400)
+
+    return {
+        "results": [post.to_dict_with_user() for post in posts],
+        "next_cursor": next_cursor
+    }
+
 
 @search_routes.route('')
 def query():
+    """
+    Ranked user search over username and full name.
+    Paged by ``?limit=`` and ``?offset=``; ``next_offset`` is null on the last page.
+    Pages are cached under the normalized term, longer for popular terms.
+
+    A query starting with '#' (or ``?mode=hashtag``) searches post hashtags
+    instead and is paged by ``?cursor=``.
+    """
     query = request.args.get('query')
     
     # Handle missing query parameter
     if query is None:
         return error_response("Query parameter is required", 400)
+
+    if request.args.get('mode') == 'hashtag' or query.strip().startswith('#'):
+        return _hashtag_search(query)
     
     # Handle empty query - return empty results
     if query.strip() == "":
-        return {"results": []}
+        return {"results": [], "next_offset": None}
 
-    try:
-        userResults = User.query.filter(User.username.ilike(f'%{query}%')).all()
+    limit = max(1, min(request.args.get('limit', SEARCH_PAGE_SIZE, type=int), MAX_PAGE_SIZE))
+    offset = max(0, request.args.get('offset', 0, type=int))
 
-        results = []
-        
-        for user in userResults:
-            user_dict = user.to_dict()
-            results.append(user_dict)
+    try:
+        term = normalize_search_term(query)
+        popularity = record_search(term)
+        key = search_cache_key(term, limit, offset)
 
-        return {"results": results}
+        payload = counted_get(key)
+        if payload is None:
+            payload = UserSearch.results_page(term, limit, offset)
+            cache_manager.set(key, payload, search_timeout(popularity))
+        return payload
     except Exception as e:
         logger.error(f"Database error in search: {e}")
         return error_response("Database error occurred", 500)
 
 
+@search_routes.route('/typeahead')
+def typeahead():
+    """
+    Per-keystroke suggestions: users whose username, full name or a word of
+    it starts with ``?query=``, answered from the in-process prefix index.
+    """
+    query = request.args.get('query')
+    if query is None:
+        return error_response("Query parameter is required", 400)
+
+    limit = max(1, min(request.args.get('limit', TYPEAHEAD_PAGE_SIZE, type=int), MAX_PAGE_SIZE))
+    return {"results": UserSearch.typeahead(query, limit)}
@@ -1,5 +1,9 @@
 from flask import Blueprint, request, current_app
-from ..models import db, User
+from pydantic import ValidationError
+from ..models import db, User, UserSearch, Follow, Like
+from ..schemas.user_schemas import RelationshipLookupSchema
+from ..utils.api_utils import handle_validation_error
+from ..utils.caching import invalidate_search_cache, invalidate_user_content
 
 import jwt
 
@@ -16,6 +20,26 @@ def lookup_user(username):
     
     return {"user": user.to_dict()}
 
+@user_routes.route('/relationships', methods=['POST'])
+def relationships():
+    """
+    Bulk viewer state: which of the given users the viewer follows and which
+    posts/comments the viewer has liked. One IN query per non-empty list,
+    so hydrating a feed page costs at most three queries.
+    """
+    try:
+        lookup = RelationshipLookupSchema.model_validate(request.get_json())
+    except ValidationError as e:
+        return handle_validation_error(e)
+
+    return {
+        "viewer_id": lookup.viewer_id,
+        "following": sorted(Follow.followed_ids(lookup.viewer_id, lookup.user_ids)),
+        "liked_posts": sorted(Like.liked_post_ids(lookup.viewer_id, lookup.post_ids)),
+        "liked_comments": sorted(Like.liked_comment_ids(lookup.viewer_id, lookup.comment_ids)),
+    }
+
+
 @user_routes.route('', methods=['PUT'])
 def update_user():
     data = request.json
@@ -49,6 +73,11 @@ def update_user():
         old_user['bio'] == new_user['bio']):
         return {"error": "No changes made"}, 401
 
+    UserSearch.index_user(user)
+    invalidate_user_content(user.id)
+    if (old_user['username'], old_user['full_name']) != (user.username, user.full_name):
+        invalidate_search_cache()
+
     access_token = jwt.encode({'email': user.email}, current_app.config['SECRET_KEY'], algorithm="HS256")
     return {'access_token': access_token, 'user': user.to_dict()}
 
@@ -62,5 +91,8 @@ def reset_img(id):
 
     user.profile_image_url = 'https://slickpics.s3.us-east-2.amazonaws.com/uploads/FriJul171300242020.png'
     db.session.commit()
+    UserSearch.index_user(user)
+    invalidate_user_content(user.id)
+    invalidate_search_cache()
 
     return user.to_dict()
@@ -4,11 +4,14 @@ Flask CLI commands for database management and performance optimization.
 import click
 from flask import current_app
 from flask.cli import with_appcontext
-from sqlalchemy import text, inspect
+from sqlalchemy import text, inspect, func, select, update
 from sqlalchemy.orm import joinedload, selectinload
 import time
 from . import db
-from .models import User, Post, Comment, Like, Follow
+from .models import User, Post, Comment, Like, Follow, Notification, PostScore, Tag, TimelineEntry, UserSearch
+from .models.search import SEARCH_PAGE_SIZE
+from .utils.caching import SEARCH_HOT_KEY, HOT_SEARCH_TRACKED, cache_manager, warm_hot_searches
+from .utils.serializers import available_codecs, benchmark
 
 
 @click.group()
@@ -270,6 +273,8 @@ def seed():
         seed_data()
         
         click.echo("✅ Database seeded successfully!")
+        click.echo("💡 Seed rows bypass the write paths; run 'flask database reconcile-counters',")
+        click.echo("   'flask database rebuild-timelines' and 'flask database backfill-notifications'")
         
     except ImportError:
         click.echo("⚠️  Seed script not found. Creating basic test data...")
@@ -312,6 +317,212 @@ def health():
         click.echo(f"❌ Database health check failed: {e}")
 
 
+@database.command()
+@click.option('--dry-run', is_flag=True, help='Report drift without repairing it.')
+@with_appcontext
+def reconcile_counters(dry_run):
+    """Check and repair drift in the denormalized engagement and user counters."""
+    click.echo("🧮 Reconciling Denormalized Counters...")
+    click.echo("=" * 50)
+
+    # (label, model, stored counter, count recomputed from source rows)
+    counters = [
+        ('posts.like_count', Post, Post.like_count, Post.like_count_column()),
+        ('posts.comment_count', Post, Post.comment_count, Post.comment_count_column()),
+        ('comments.like_count', Comment, Comment.like_count, Comment.like_count_column()),
+        ('users.follower_count', User, User.follower_count, User.follower_count_column()),
+        ('users.following_count', User, User.following_count, User.following_count_column()),
+        ('users.post_count', User, User.post_count, User.post_count_column()),
+    ]
+
+    try:
+        total_drift = 0
+        for label, model, stored, actual in counters:
+            drifted = db.session.scalar(
+                select(func.count()).select_from(model).where(stored != actual)
+            )
+            total_drift += drifted
+            if not drifted:
+                click.echo(f"   ✅ {label}: consistent")
+                continue
+
+            click.echo(f"   ⚠️  {label}: {drifted} rows drifted")
+            if not dry_run:
+                db.session.execute(
+                    update(model).where(stored != actual).values({stored: actual})
+                )
+
+        if dry_run or not total_drift:
+            db.session.rollback()
+        else:
+            db.session.commit()
+            click.echo(f"\n🔧 Repaired {total_drift} counter values")
+
+        if not total_drift:
+            click.echo("\n🎉 All counters are consistent!")
+
+    except Exception as e:
+        db.session.rollback()
+        click.echo(f"❌ Counter reconciliation failed: {e}")
+
+
+@database.command()
+@with_appcontext
+def rebuild_timelines():
+    """Rebuild the materialized home timelines from follows and posts."""
+    click.echo("📰 Rebuilding Home Timelines...")
+    click.echo("=" * 50)
+
+    try:
+        entries = TimelineEntry.rebuild()
+        db.session.commit()
+        click.echo(f"✅ Wrote {entries} timeline entries")
+
+    except Exception as e:
+        db.session.rollback()
+        click.echo(f"❌ Timeline rebuild failed: {e}")
+
+
+@database.command()
+@with_appcontext
+def backfill_notifications():
+    """Create notifications for follows, likes and comments that have none."""
+    click.echo("🔔 Backfilling Notifications...")
+    click.echo("=" * 50)
+
+    try:
+        written = Notification.backfill()
+        db.session.commit()
+        click.echo(f"✅ Wrote {written} notifications")
+
+    except Exception as e:
+        db.session.rollback()
+        click.echo(f"❌ Notification backfill failed: {e}")
+
+
+@database.command()
+@with_appcontext
+def score_posts():
+    """Recompute the time-decayed engagement ranking used by explore."""
+    click.echo("🏆 Scoring Posts for Explore...")
+    click.echo("=" * 50)
+
+    try:
+        start_time = time.time()
+        ranked = PostScore.recompute()
+        db.session.commit()
+        click.echo(f"✅ Ranked {ranked} posts in {(time.time() - start_time):.2f}s")
+
+    except Exception as e:
+        db.session.rollback()
+        click.echo(f"❌ Post scoring failed: {e}")
+
+
+@database.command()
+@click.option('--batch-size', default=1000, show_default=True, help='Rows per insert batch.')
+@with_appcontext
+def backfill_tags(batch_size):
+    """Rebuild post hashtags from existing captions."""
+    click.echo("#️⃣  Backfilling Post Hashtags...")
+    click.echo("=" * 50)
+
+    try:
+        start_time = time.time()
+        written = Tag.backfill(batch_size=batch_size)
+        db.session.commit()
+        click.echo(f"✅ Wrote {written} tags in {(time.time() - start_time):.2f}s")
+
+    except Exception as e:
+        db.session.rollback()
+        click.echo(f"❌ Hashtag backfill failed: {e}")
+
+
+@database.command()
+@click.option('--top', default=20, show_default=True, help='Number of most popular search terms to warm.')
+@with_appcontext
+def warm_search_cache(top):
+    """Pre-compute cached search results for the most popular terms."""
+    click.echo("🔥 Warming Search Cache...")
+    click.echo("=" * 50)
+
+    if not cache_manager.redis_client:
+        click.echo("⚠️  Cache unavailable, nothing to warm")
+        return
+
+    try:
+        start_time = time.time()
+        terms = warm_hot_searches(UserSearch.results_page, top, SEARCH_PAGE_SIZE)
+        trimmed = cache_manager.trim_scores(SEARCH_HOT_KEY, HOT_SEARCH_TRACKED)
+        click.echo(f"✅ Warmed {len(terms)} search terms in {(time.time() - start_time):.2f}s")
+        for term in terms:
+            click.echo(f"  • {term}")
+        if trimmed:
+            click.echo(f"🧹 Stopped tracking {trimmed} rarely searched terms")
+
+    except Exception as e:
+        db.session.rollback()
+        click.echo(f"❌ Search cache warm-up failed: {e}")
+
+
+@database.command()
+@click.option('--pages', default=20, show_default=True, help='Scroll pages and posts to sample.')
+@click.option('--rounds', default=200, show_default=True, help='Encode/decode repetitions per payload.')
+@with_appcontext
+def benchmark_cache_serializers(pages, rounds):
+    """Compare cache encodings on real scroll page and post responses."""
+    click.echo("⏱️  Benchmarking Cache Serializers...")
+    click.echo("=" * 50)
+
+    try:
+        client = current_app.test_client()
+        post_ids = db.session.scalars(select(Post.id).order_by(Post.id.desc()).limit(pages)).all()
+        urls = [f'/api/post/scroll/{offset}' for offset in range(0, pages * 3, 3)]
+        urls += [f'/api/post/{post_id}' for post_id in post_ids]
+        responses = [client.get(url) for url in urls]
+        payloads = [response.get_json() for response in responses if response.status_code == 200]
+        if not payloads:
+            click.echo("⚠️  No feed responses to sample; seed the database first")
+            return
+
+        codecs = available_codecs(cache_manager.codec.compress_min_bytes)
+        click.echo(f"📦 {len(payloads)} responses, {rounds} rounds, current codec: {cache_manager.codec.name}")
+        click.echo(f"{'codec':<16}{'bytes':>10}{'encode µs':>12}{'decode µs':>12}")
+        for row in benchmark(codecs, payloads, rounds):
+            click.echo(f"{row['codec']:<16}{row['bytes']:>10}{row['encode_us']:>12.1f}{row['decode_us']:>12.1f}")
+
+    except Exception as e:
+        db.session.rollback()
+        click.echo(f"❌ Serializer benchmark failed: {e}")
+
+
+@database.command()
+@with_appcontext
+def cache_metrics():
+    """Show per-cache-type hit rates, volumes and lookup latency across workers."""
+    click.echo("📈 Cache Metrics")
+    click.echo("=" * 50)
+
+    stats = cache_manager.get_stats()
+    if stats['status'] != 'active':
+        click.echo(f"⚠️  Cache {stats['status']}; showing this process only")
+    else:
+        click.echo(f"Backend: {stats['backend']}, entries: {stats['our_keys']}")
+
+    metrics = cache_manager.collect_metrics()
+    if not metrics:
+        click.echo("No cache activity recorded yet")
+        return
+
+    click.echo(f"{'cache type':<16}{'hit rate':>9}{'hits':>8}{'misses':>8}{'stale':>7}{'refresh':>8}"
+               f"{'sets':>7}{'evict':>7}{'KB':>9}{'p50 ms':>8}{'p99 ms':>8}")
+    for cache_type, row in metrics.items():
+        hit_rate = f"{row['hit_rate']:.1%}" if row['hit_rate'] is not None else "-"
+        click.echo(f"{cache_type:<16}{hit_rate:>9}{row['hits']:>8}{row['misses']:>8}{row['stale']:>7}"
+                   f"{row['refreshes']:>8}{row['sets']:>7}{row['evictions']:>7}{row['bytes'] / 1024:>9.1f}"
+                   f"{row['p50_ms']:>8.2f}{row['p99_ms']:>8.2f}")
+    click.echo("💡 Low hit rates with few evictions suggest a CACHE_TIMEOUTS value is too short")
+
+
 def init_app(app):
     """Initialize CLI commands with Flask app."""
     app.cli.add_command(database)
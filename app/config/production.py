@@ -95,11 +95,23 @@ class ProductionConfig(Config):
         'CACHE_REDIS_URL': REDIS_URL,
         'CACHE_DEFAULT_TIMEOUT': 300,  # 5 minutes default
         'CACHE_KEY_PREFIX': 'isntgram:',
+        'CACHE_TAG_TIMEOUT': 3600,  # Lifetime floor of invalidation tag sets
+        # 'memory' serves the cache from an in-process backend when Redis is down
+        'CACHE_FALLBACK': os.getenv('CACHE_FALLBACK'),
+        # Value encoding: 'json' (orjson when installed), 'msgpack' or 'pickle'
+        'CACHE_SERIALIZER': os.getenv('CACHE_SERIALIZER', 'json'),
+        'CACHE_COMPRESSION': 'zlib',  # None, 'zlib' or 'lz4' (when installed)
+        'CACHE_COMPRESS_MIN_BYTES': 1024,
+        # Per-worker L1 in front of Redis; 0 items disables it
+        'CACHE_L1_MAX_ITEMS': int(os.getenv('CACHE_L1_MAX_ITEMS', '0')),
+        'CACHE_L1_MAX_BYTES': int(os.getenv('CACHE_L1_MAX_BYTES', str(16 * 1024 * 1024))),
+        'CACHE_L1_TIMEOUT': 5,  # Upper bound on L1 staleness if a message is lost
     }
     
     # Cache timeouts by data type
     CACHE_TIMEOUTS: Dict[str, int] = {
         'user_profile': 600,      # 10 minutes
+        'user_summary': 600,      # 10 minutes
         'post_details': 300,      # 5 minutes  
         'post_scroll': 60,        # 1 minute (dynamic content)
         'explore_posts': 180,     # 3 minutes
@@ -108,6 +120,9 @@ class ProductionConfig(Config):
         'static_content': 3600,   # 1 hour
     }
     
+    # Operator endpoints under /api/admin; disabled unless a token is set
+    ADMIN_API_TOKEN = os.getenv('ADMIN_API_TOKEN')
+    
     # Performance Monitoring
     PERFORMANCE_MONITORING = {
         'slow_query_threshold': 0.01,  # 10ms
@@ -146,6 +161,7 @@ class DevelopmentConfig(ProductionConfig):
     # Shorter cache times for development
     CACHE_TIMEOUTS = {
         'user_profile': 60,
+        'user_summary': 60,
         'post_details': 30,
         'post_scroll': 10,
         'explore_posts': 30,
@@ -0,0 +1,56 @@
+"""add_denormalized_engagement_counters
+
+Adds persistent like/comment counters to posts and a like counter to
+comments, then backfills them from the likes and comments tables.
+
+Revision ID: 5b7e2c91d4a3
+Revises: 64a3d2f9f607
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b7e2c91d4a3'
+down_revision = '64a3d2f9f607'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('posts', sa.Column('like_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('posts', sa.Column('comment_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('comments', sa.Column('like_count', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill from existing rows (both stored spellings of likeable_type)
+    op.execute("""
+        UPDATE posts SET
+            like_count = (
+                SELECT COUNT(*) FROM likes
+                WHERE likes.likeable_id = posts.id
+                  AND likes.likeable_type IN ('post', 'Post')
+            ),
+            comment_count = (
+                SELECT COUNT(*) FROM comments
+                WHERE comments.post_id = posts.id
+            )
+    """)
+    op.execute("""
+        UPDATE comments SET
+            like_count = (
+                SELECT COUNT(*) FROM likes
+                WHERE likes.likeable_id = comments.id
+                  AND likes.likeable_type IN ('comment', 'Comment')
+            )
+    """)
+
+
+def downgrade():
+    with op.batch_alter_table('comments') as batch_op:
+        batch_op.drop_column('like_count')
+
+    with op.batch_alter_table('posts') as batch_op:
+        batch_op.drop_column('comment_count')
+        batch_op.drop_column('like_count')
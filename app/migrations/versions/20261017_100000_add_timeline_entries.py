@@ -0,0 +1,55 @@
+"""add_timeline_entries
+
+Adds the materialized home timeline table written on post creation and
+follow changes, then backfills it from the follows and posts tables.
+
+Revision ID: 8d41f0a6c2e7
+Revises: 5b7e2c91d4a3
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d41f0a6c2e7'
+down_revision = '5b7e2c91d4a3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('timeline_entries',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('post_id', sa.Integer(), nullable=False),
+        sa.Column('author_id', sa.Integer(), nullable=False),
+        sa.Column('post_created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+        sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id', 'post_id', name='unique_timeline_entry')
+    )
+    with op.batch_alter_table('timeline_entries', schema=None) as batch_op:
+        batch_op.create_index('ix_timeline_entries_user_created', ['user_id', 'post_created_at', 'post_id'], unique=False)
+        batch_op.create_index('ix_timeline_entries_user_author', ['user_id', 'author_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_timeline_entries_post_id'), ['post_id'], unique=False)
+
+    # Backfill: a user's feed holds posts by everyone in follows.user_id
+    # whose user_followed_id is that user
+    op.execute("""
+        INSERT INTO timeline_entries (user_id, post_id, author_id, post_created_at)
+        SELECT follows.user_followed_id, posts.id, posts.user_id, posts.created_at
+        FROM follows JOIN posts ON posts.user_id = follows.user_id
+    """)
+
+
+def downgrade():
+    with op.batch_alter_table('timeline_entries', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_timeline_entries_post_id'))
+        batch_op.drop_index('ix_timeline_entries_user_author')
+        batch_op.drop_index('ix_timeline_entries_user_created')
+
+    op.drop_table('timeline_entries')
@@ -0,0 +1,74 @@
+"""add_notifications
+
+Adds the notifications table written by the follow, like and comment
+routes, then backfills it from existing activity.
+
+Revision ID: 2f6b9e1d7c34
+Revises: 8d41f0a6c2e7
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2f6b9e1d7c34'
+down_revision = '8d41f0a6c2e7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('notifications',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('recipient_id', sa.Integer(), nullable=False),
+        sa.Column('actor_id', sa.Integer(), nullable=False),
+        sa.Column('kind', sa.String(length=10), nullable=False),
+        sa.Column('source_id', sa.Integer(), nullable=False),
+        sa.Column('post_id', sa.Integer(), nullable=True),
+        sa.Column('read_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['actor_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['recipient_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('kind', 'source_id', name='unique_notification_source')
+    )
+    with op.batch_alter_table('notifications', schema=None) as batch_op:
+        batch_op.create_index('ix_notifications_recipient_created', ['recipient_id', 'created_at', 'id'], unique=False)
+        batch_op.create_index('ix_notifications_recipient_read', ['recipient_id', 'read_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_notifications_post_id'), ['post_id'], unique=False)
+
+    # Backfill from existing activity (both stored spellings of likeable_type)
+    op.execute("""
+        INSERT INTO notifications (kind, source_id, actor_id, recipient_id, post_id, created_at)
+        SELECT 'follow', follows.id, follows.user_id, follows.user_followed_id, NULL, follows.created_at
+        FROM follows
+    """)
+    op.execute("""
+        INSERT INTO notifications (kind, source_id, actor_id, recipient_id, post_id, created_at)
+        SELECT 'like', likes.id, likes.user_id, posts.user_id, posts.id, likes.created_at
+        FROM likes JOIN posts ON posts.id = likes.likeable_id
+        WHERE likes.likeable_type IN ('post', 'Post')
+    """)
+    op.execute("""
+        INSERT INTO notifications (kind, source_id, actor_id, recipient_id, post_id, created_at)
+        SELECT 'like', likes.id, likes.user_id, comments.user_id, comments.post_id, likes.created_at
+        FROM likes JOIN comments ON comments.id = likes.likeable_id
+        WHERE likes.likeable_type IN ('comment', 'Comment')
+    """)
+    op.execute("""
+        INSERT INTO notifications (kind, source_id, actor_id, recipient_id, post_id, created_at)
+        SELECT 'comment', comments.id, comments.user_id, posts.user_id, posts.id, comments.created_at
+        FROM comments JOIN posts ON posts.id = comments.post_id
+    """)
+
+
+def downgrade():
+    with op.batch_alter_table('notifications', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_notifications_post_id'))
+        batch_op.drop_index('ix_notifications_recipient_read')
+        batch_op.drop_index('ix_notifications_recipient_created')
+
+    op.drop_table('notifications')
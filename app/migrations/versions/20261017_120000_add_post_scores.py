@@ -0,0 +1,36 @@
+"""add_post_scores
+
+Adds the precomputed explore ranking table. It is filled by
+'flask database score-posts'; explore falls back to random sampling
+until the first run.
+
+Revision ID: 6c3a8f52b1d9
+Revises: 2f6b9e1d7c34
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6c3a8f52b1d9'
+down_revision = '2f6b9e1d7c34'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('post_scores',
+        sa.Column('post_id', sa.Integer(), nullable=False),
+        sa.Column('score', sa.Float(), nullable=False),
+        sa.Column('rank', sa.Integer(), nullable=False),
+        sa.Column('computed_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('post_id'),
+        sa.UniqueConstraint('rank')
+    )
+
+
+def downgrade():
+    op.drop_table('post_scores')
@@ -0,0 +1,48 @@
+"""add_user_counters
+
+Adds persistent follower, following and post counters to users, then
+backfills them from the follows and posts tables.
+
+Revision ID: 9a2d4c7e5f18
+Revises: 6c3a8f52b1d9
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a2d4c7e5f18'
+down_revision = '6c3a8f52b1d9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('users', sa.Column('follower_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('users', sa.Column('following_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('users', sa.Column('post_count', sa.Integer(), server_default='0', nullable=False))
+
+    op.execute("""
+        UPDATE users SET
+            follower_count = (
+                SELECT COUNT(*) FROM follows
+                WHERE follows.user_followed_id = users.id
+            ),
+            following_count = (
+                SELECT COUNT(*) FROM follows
+                WHERE follows.user_id = users.id
+            ),
+            post_count = (
+                SELECT COUNT(*) FROM posts
+                WHERE posts.user_id = users.id
+            )
+    """)
+
+
+def downgrade():
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('post_count')
+        batch_op.drop_column('following_count')
+        batch_op.drop_column('follower_count')
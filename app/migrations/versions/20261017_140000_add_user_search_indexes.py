@@ -0,0 +1,64 @@
+"""add_user_search_indexes
+
+Indexes users.username and users.full_name for substring search: pg_trgm
+GIN indexes on PostgreSQL, an FTS5 trigram table kept in sync by triggers
+on SQLite.
+
+Revision ID: 3e8b5a1c7d42
+Revises: 9a2d4c7e5f18
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '3e8b5a1c7d42'
+down_revision = '9a2d4c7e5f18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute("CREATE INDEX IF NOT EXISTS ix_users_username_trgm ON users USING gin (username gin_trgm_ops)")
+        op.execute("CREATE INDEX IF NOT EXISTS ix_users_full_name_trgm ON users USING gin (full_name gin_trgm_ops)")
+    elif dialect == 'sqlite':
+        op.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS users_fts USING fts5(
+                username, full_name, content='users', content_rowid='id', tokenize='trigram'
+            )
+        """)
+        op.execute("""
+            CREATE TRIGGER IF NOT EXISTS users_fts_ai AFTER INSERT ON users BEGIN
+                INSERT INTO users_fts(rowid, username, full_name) VALUES (new.id, new.username, new.full_name);
+            END
+        """)
+        op.execute("""
+            CREATE TRIGGER IF NOT EXISTS users_fts_ad AFTER DELETE ON users BEGIN
+                INSERT INTO users_fts(users_fts, rowid, username, full_name)
+                VALUES ('delete', old.id, old.username, old.full_name);
+            END
+        """)
+        op.execute("""
+            CREATE TRIGGER IF NOT EXISTS users_fts_au AFTER UPDATE OF username, full_name ON users BEGIN
+                INSERT INTO users_fts(users_fts, rowid, username, full_name)
+                VALUES ('delete', old.id, old.username, old.full_name);
+                INSERT INTO users_fts(rowid, username, full_name) VALUES (new.id, new.username, new.full_name);
+            END
+        """)
+        op.execute("INSERT INTO users_fts(users_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_users_full_name_trgm")
+        op.execute("DROP INDEX IF EXISTS ix_users_username_trgm")
+    elif dialect == 'sqlite':
+        op.execute("DROP TRIGGER IF EXISTS users_fts_au")
+        op.execute("DROP TRIGGER IF EXISTS users_fts_ad")
+        op.execute("DROP TRIGGER IF EXISTS users_fts_ai")
+        op.execute("DROP TABLE IF EXISTS users_fts")
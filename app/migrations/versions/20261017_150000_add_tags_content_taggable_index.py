@@ -0,0 +1,35 @@
+"""add_tags_content_taggable_index
+
+Adds a unique (content, taggable_type, taggable_id) index on tags so a
+hashtag lookup is one index range scan and a post cannot carry the same
+tag twice. The new index leads with content, so it replaces ix_tags_content.
+Run `flask database backfill-tags` afterwards to tag existing
+captions.
+
+Revision ID: 7b1f4d9e2a65
+Revises: 3e8b5a1c7d42
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '7b1f4d9e2a65'
+down_revision = '3e8b5a1c7d42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('tags') as batch_op:
+        batch_op.create_index(
+            'ix_tags_content_taggable', ['content', 'taggable_type', 'taggable_id'], unique=True
+        )
+        batch_op.drop_index('ix_tags_content')
+
+
+def downgrade():
+    with op.batch_alter_table('tags') as batch_op:
+        batch_op.create_index('ix_tags_content', ['content'], unique=False)
+        batch_op.drop_index('ix_tags_content_taggable')
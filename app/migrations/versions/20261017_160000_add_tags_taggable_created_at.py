@@ -0,0 +1,52 @@
+"""add_tags_taggable_created_at
+
+Copies each post's created_at onto its tag rows and replaces
+ix_tags_content_taggable with a unique (content, taggable_type,
+taggable_created_at, taggable_id) index, so a page of a hashtag newest
+first is one index range scan instead of a sort over every tagged post.
+
+Revision ID: 4d9c2e7a1b83
+Revises: 7b1f4d9e2a65
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4d9c2e7a1b83'
+down_revision = '7b1f4d9e2a65'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('tags', sa.Column('taggable_created_at', sa.DateTime(timezone=True), nullable=True))
+
+    # Backfill from the tagged posts; tags of missing posts cannot be served
+    op.execute("""
+        UPDATE tags SET taggable_created_at = (
+            SELECT posts.created_at FROM posts WHERE posts.id = tags.taggable_id
+        )
+        WHERE taggable_type = 'post'
+    """)
+    op.execute("DELETE FROM tags WHERE taggable_created_at IS NULL")
+
+    with op.batch_alter_table('tags') as batch_op:
+        batch_op.alter_column('taggable_created_at', existing_type=sa.DateTime(timezone=True), nullable=False)
+        batch_op.create_index(
+            'ix_tags_content_created',
+            ['content', 'taggable_type', 'taggable_created_at', 'taggable_id'],
+            unique=True
+        )
+        batch_op.drop_index('ix_tags_content_taggable')
+
+
+def downgrade():
+    with op.batch_alter_table('tags') as batch_op:
+        batch_op.create_index(
+            'ix_tags_content_taggable', ['content', 'taggable_type', 'taggable_id'], unique=True
+        )
+        batch_op.drop_index('ix_tags_content_created')
+        batch_op.drop_column('taggable_created_at')
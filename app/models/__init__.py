@@ -7,3 +7,8 @@ from .follow import Follow
 from .like import Like
 from .post import Post
 from .user import User
+from .timeline import TimelineEntry
+from .notification import Notification
+from .post_score import PostScore
+from .search import UserSearch
+from .tag import Tag
@@ -3,9 +3,11 @@ from typing import TYPE_CHECKING
 from datetime import datetime
 
 from ..models import db
-from sqlalchemy import func, String, Integer, DateTime, Text, ForeignKey, Index
+from sqlalchemy import func, select, update, String, Integer, DateTime, Text, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from .like import Like, COMMENT_LIKEABLE_TYPES
+
 if TYPE_CHECKING:
     from .user import User
     from .post import Post
@@ -28,6 +30,8 @@ class Comment(db.Model):
         index=True  # Performance: FK index
     )
     content: Mapped[str] = mapped_column(Text, nullable=False)
+    # Denormalized counter, maintained by the like write paths
+    like_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(), 
@@ -49,6 +53,24 @@ class Comment(db.Model):
         Index('ix_comments_post_created', 'post_id', 'created_at'),
     )
 
+    @classmethod
+    def adjust_like_count(cls, comment_id: int, delta: int) -> None:
+        """Atomically shift ``like_count`` within the current transaction."""
+        db.session.execute(
+            update(cls).where(cls.id == comment_id).values({cls.like_count: cls.like_count + delta})
+        )
+
+    @classmethod
+    def like_count_column(cls):
+        """Like count recomputed from the likes table, used to reconcile ``like_count``."""
+        return (
+            select(func.count(Like.id))
+            .where(Like.likeable_id == cls.id, Like.likeable_type.in_(COMMENT_LIKEABLE_TYPES))
+            .correlate(cls)
+            .scalar_subquery()
+            .label("like_count")
+        )
+
     def to_dict(self) -> dict[str, any]:
         """Convert comment instance to dictionary for API responses."""
         return {
@@ -56,7 +78,8 @@ class Comment(db.Model):
             "user_id": self.user_id, 
             "post_id": self.post_id, 
             "created_at": self.created_at.isoformat() if self.created_at else None, 
-            "content": self.content
+            "content": self.content,
+            "like_count": self.like_count or 0,
         }
 
     def to_dict_with_user(self) -> dict[str, any]:
@@ -3,8 +3,8 @@ from typing import TYPE_CHECKING
 from datetime import datetime
 
 from ..models import db
-from sqlalchemy import func, Integer, DateTime, ForeignKey, Index, UniqueConstraint
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import func, select, Integer, DateTime, ForeignKey, Index, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship, contains_eager, lazyload
 
 if TYPE_CHECKING:
     from .user import User
@@ -63,12 +63,62 @@ class Follow(db.Model):
             user_followed_id=followed_user_id
         ).first())
 
+    @classmethod
+    def followed_ids(cls, user_id: int, candidate_ids) -> set[int]:
+        """Which of ``candidate_ids`` ``user_id`` follows, in one IN query."""
+        if not candidate_ids:
+            return set()
+        return set(db.session.scalars(
+            select(cls.user_followed_id).where(
+                cls.user_id == user_id,
+                cls.user_followed_id.in_(set(candidate_ids))
+            )
+        ))
+
     @classmethod
     def get_followers_count(cls, user_id: int) -> int:
-        """Get count of followers for a user."""
-        return cls.query.filter_by(user_followed_id=user_id).count()
+        """Get count of followers for a user from the denormalized counter."""
+        from .user import User
+        return db.session.scalar(select(User.follower_count).where(User.id == user_id)) or 0
 
     @classmethod
     def get_following_count(cls, user_id: int) -> int:
-        """Get count of users being followed by a user."""
-        return cls.query.filter_by(user_id=user_id).count()
+        """Get count of users being followed by a user from the denormalized counter."""
+        from .user import User
+        return db.session.scalar(select(User.following_count).where(User.id == user_id)) or 0
+
+    @classmethod
+    def followers_of(cls, user_id: int):
+        """Follows of ``user_id``, without joining in the followers."""
+        return cls.query.options(lazyload(cls.user)).filter(cls.user_followed_id == user_id)
+
+    @classmethod
+    def following_of(cls, user_id: int):
+        """Follows made by ``user_id``, without joining in any users."""
+        return cls.query.options(lazyload(cls.user)).filter(cls.user_id == user_id)
+
+    @classmethod
+    def followers_with_users(cls, user_id: int):
+        """
+        Follows of ``user_id`` paired with the follower, as ``(Follow, User)``
+        rows. The explicit join also populates ``Follow.user``, so the
+        relationship's joined load does not add a second join.
+        """
+        from .user import User
+        return (db.session.query(cls, User)
+                .join(User, User.id == cls.user_id)
+                .options(contains_eager(cls.user))
+                .filter(cls.user_followed_id == user_id))
+
+    @classmethod
+    def following_with_users(cls, user_id: int):
+        """
+        Follows made by ``user_id`` paired with the followed user, as
+        ``(Follow, User)`` rows. ``Follow.user`` (the follower, ``user_id``
+        itself) is left to load lazily rather than joined in.
+        """
+        from .user import User
+        return (db.session.query(cls, User)
+                .join(User, User.id == cls.user_followed_id)
+                .options(lazyload(cls.user))
+                .filter(cls.user_id == user_id))
@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING, Literal
 from datetime import datetime
 
 from ..models import db
-from sqlalchemy import func, String, Integer, DateTime, ForeignKey, Index
+from sqlalchemy import func, select, String, Integer, DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
@@ -12,6 +12,12 @@ if TYPE_CHECKING:
 # Type for polymorphic likeable types
 LikeableType = Literal["Post", "Comment"]
 
+# Stored spellings of each likeable type. The client writes lowercase values
+# while older rows and fixtures use the capitalized form, so aggregate queries
+# match both (an IN on the second column of ix_likes_polymorphic).
+POST_LIKEABLE_TYPES = ("post", "Post")
+COMMENT_LIKEABLE_TYPES = ("comment", "Comment")
+
 class Like(db.Model):
     __tablename__ = 'likes'
 
@@ -73,6 +79,29 @@ class Like(db.Model):
             likeable_type="Comment"
         ).all()
 
+    @classmethod
+    def liked_ids(cls, user_id: int, likeable_ids, likeable_types) -> set[int]:
+        """Which of ``likeable_ids`` ``user_id`` has liked, in one IN query."""
+        if not likeable_ids:
+            return set()
+        return set(db.session.scalars(
+            select(cls.likeable_id).where(
+                cls.user_id == user_id,
+                cls.likeable_type.in_(likeable_types),
+                cls.likeable_id.in_(set(likeable_ids))
+            )
+        ))
+
+    @classmethod
+    def liked_post_ids(cls, user_id: int, post_ids) -> set[int]:
+        """Which of ``post_ids`` ``user_id`` has liked."""
+        return cls.liked_ids(user_id, post_ids, POST_LIKEABLE_TYPES)
+
+    @classmethod
+    def liked_comment_ids(cls, user_id: int, comment_ids) -> set[int]:
+        """Which of ``comment_ids`` ``user_id`` has liked."""
+        return cls.liked_ids(user_id, comment_ids, COMMENT_LIKEABLE_TYPES)
+
     @classmethod
     def user_liked_post(cls, user_id: int, post_id: int) -> bool:
         """Check if user has already liked a specific post."""
@@ -0,0 +1,150 @@
+from __future__ import annotations
+from typing import Optional
+from datetime import datetime
+
+from ..models import db
+from sqlalchemy import (
+    func, select, insert, delete, update, exists, literal, null, union_all,
+    String, Integer, DateTime, ForeignKey, Index, UniqueConstraint,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .comment import Comment
+from .follow import Follow
+from .like import Like, POST_LIKEABLE_TYPES, COMMENT_LIKEABLE_TYPES
+from .post import Post
+
+
+class Notification(db.Model):
+    """
+    Activity addressed to a user, materialized when the follow, like or
+    comment is written.
+
+    Each row points back at its source row (``kind`` + ``source_id``) and
+    copies the source's ``created_at``, so a user's notes page is a single
+    range scan on ``ix_notifications_recipient_created``.
+    """
+    __tablename__ = 'notifications'
+
+    # Modern SQLAlchemy 2.0 mapped columns with type annotations
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    recipient_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    actor_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    kind: Mapped[str] = mapped_column(String(10), nullable=False)
+    source_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    post_id: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        ForeignKey("posts.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True  # Performance: cleanup on post delete
+    )
+    read_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    # Performance indexes and constraints
+    __table_args__ = (
+        Index('ix_notifications_recipient_created', 'recipient_id', 'created_at', 'id'),
+        Index('ix_notifications_recipient_read', 'recipient_id', 'read_at'),
+        UniqueConstraint('kind', 'source_id', name='unique_notification_source'),
+    )
+
+    _insert_columns = ('kind', 'source_id', 'actor_id', 'recipient_id', 'post_id', 'created_at')
+
+    @staticmethod
+    def _follow_source():
+        return select(
+            literal("follow"), Follow.id, Follow.user_id, Follow.user_followed_id,
+            null(), Follow.created_at,
+        )
+
+    @staticmethod
+    def _like_sources():
+        on_posts = select(
+            literal("like"), Like.id, Like.user_id, Post.user_id, Post.id, Like.created_at,
+        ).join(Post, Post.id == Like.likeable_id).where(Like.likeable_type.in_(POST_LIKEABLE_TYPES))
+        on_comments = select(
+            literal("like"), Like.id, Like.user_id, Comment.user_id, Comment.post_id, Like.created_at,
+        ).join(Comment, Comment.id == Like.likeable_id).where(Like.likeable_type.in_(COMMENT_LIKEABLE_TYPES))
+        return on_posts, on_comments
+
+    @staticmethod
+    def _comment_source():
+        return select(
+            literal("comment"), Comment.id, Comment.user_id, Post.user_id, Post.id, Comment.created_at,
+        ).join(Post, Post.id == Comment.post_id)
+
+    @classmethod
+    def _insert(cls, source) -> int:
+        return db.session.execute(insert(cls).from_select(cls._insert_columns, source)).rowcount
+
+    @classmethod
+    def record_follow(cls, follow_id: int) -> None:
+        """Notify the followed user of a new follow."""
+        cls._insert(cls._follow_source().where(Follow.id == follow_id))
+
+    @classmethod
+    def record_like(cls, like_id: int) -> None:
+        """Notify the owner of the liked post or comment."""
+        on_posts, on_comments = cls._like_sources()
+        cls._insert(union_all(on_posts.where(Like.id == like_id), on_comments.where(Like.id == like_id)))
+
+    @classmethod
+    def record_comment(cls, comment_id: int) -> None:
+        """Notify the post owner of a new comment."""
+        cls._insert(cls._comment_source().where(Comment.id == comment_id))
+
+    @classmethod
+    def remove(cls, kind: str, source_id: int) -> None:
+        """Drop the notification for an undone follow or like."""
+        db.session.execute(delete(cls).where(cls.kind == kind, cls.source_id == source_id))
+
+    @classmethod
+    def remove_post(cls, post_id: int) -> None:
+        """Drop notifications that point at a deleted post."""
+        db.session.execute(delete(cls).where(cls.post_id == post_id))
+
+    @classmethod
+    def backfill(cls) -> int:
+        """Insert notifications for existing activity that has none; returns rows written."""
+        written = 0
+        on_posts, on_comments = cls._like_sources()
+        for kind, source_id, source in (
+            ("follow", Follow.id, cls._follow_source()),
+            ("like", Like.id, on_posts),
+            ("like", Like.id, on_comments),
+            ("comment", Comment.id, cls._comment_source()),
+        ):
+            missing = ~exists().where(cls.kind == kind, cls.source_id == source_id)
+            written += cls._insert(source.where(missing))
+        return written
+
+    @classmethod
+    def for_recipient(cls, recipient_id: int):
+        """Notifications addressed to a user, to be ordered by ``created_at, id``."""
+        return cls.query.filter(cls.recipient_id == recipient_id)
+
+    @classmethod
+    def unread_count(cls, recipient_id: int) -> int:
+        """Number of unread notifications, counted on ``ix_notifications_recipient_read``."""
+        return db.session.scalar(
+            select(func.count()).select_from(cls).where(
+                cls.recipient_id == recipient_id, cls.read_at.is_(None)
+            )
+        )
+
+    @classmethod
+    def mark_read(cls, recipient_id: int) -> int:
+        """Mark every unread notification for a user as read; returns rows updated."""
+        return db.session.execute(
+            update(cls)
+            .where(cls.recipient_id == recipient_id, cls.read_at.is_(None))
+            .values(read_at=func.now())
+        ).rowcount
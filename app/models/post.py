@@ -3,12 +3,14 @@ from typing import Optional, List, TYPE_CHECKING
 from datetime import datetime
 
 from ..models import db
-from sqlalchemy import func, String, Integer, DateTime, Text, ForeignKey
+from sqlalchemy import func, select, update, String, Integer, DateTime, Text, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from .comment import Comment
+from .like import Like, POST_LIKEABLE_TYPES
+
 if TYPE_CHECKING:
     from .user import User
-    from .comment import Comment
 
 class Post(db.Model):
     __tablename__ = "posts"
@@ -23,6 +25,9 @@ class Post(db.Model):
     )
     image_url: Mapped[str] = mapped_column(String(2000), nullable=False)
     caption: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Denormalized counters, maintained by the like/comment write paths
+    like_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    comment_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), 
         server_default=func.now(), 
@@ -45,6 +50,39 @@ class Post(db.Model):
         cascade="all, delete-orphan"
     )
 
+    @classmethod
+    def adjust_counts(cls, post_id: int, likes: int = 0, comments: int = 0) -> None:
+        """Atomically shift the denormalized counters within the current transaction."""
+        values = {}
+        if likes:
+            values[cls.like_count] = cls.like_count + likes
+        if comments:
+            values[cls.comment_count] = cls.comment_count + comments
+        if values:
+            db.session.execute(update(cls).where(cls.id == post_id).values(values))
+
+    @classmethod
+    def like_count_column(cls):
+        """Like count recomputed from the likes table, used to reconcile ``like_count``."""
+        return (
+            select(func.count(Like.id))
+            .where(Like.likeable_id == cls.id, Like.likeable_type.in_(POST_LIKEABLE_TYPES))
+            .correlate(cls)
+            .scalar_subquery()
+            .label("like_count")
+        )
+
+    @classmethod
+    def comment_count_column(cls):
+        """Comment count recomputed from the comments table, used to reconcile ``comment_count``."""
+        return (
+            select(func.count(Comment.id))
+            .where(Comment.post_id == cls.id)
+            .correlate(cls)
+            .scalar_subquery()
+            .label("comment_count")
+        )
+
     def to_dict(self) -> dict[str, any]:
         """Convert post instance to dictionary for API responses."""
         return {
@@ -52,6 +90,8 @@ class Post(db.Model):
             "user_id": self.user_id,
             "image_url": self.image_url,
             "caption": self.caption,
+            "like_count": self.like_count or 0,
+            "comment_count": self.comment_count or 0,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
@@ -0,0 +1,90 @@
+from __future__ import annotations
+from typing import Optional
+from datetime import datetime, timezone
+
+from ..models import db
+from sqlalchemy import select, delete, insert, case, func, literal, Integer, Float, DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .post import Post
+
+# Time-decayed engagement: (likes + COMMENT_WEIGHT * comments) / (age_hours + 2) ** SCORE_GRAVITY
+COMMENT_WEIGHT = 2.0
+SCORE_GRAVITY = 1.5
+
+
+class PostScore(db.Model):
+    """
+    Precomputed explore ranking, one row per post.
+
+    Rows are rewritten by ``flask database score-posts``; explore pages read
+    ``rank`` through its unique index instead of scoring anything per request.
+    """
+    __tablename__ = 'post_scores'
+
+    # Modern SQLAlchemy 2.0 mapped columns with type annotations
+    post_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("posts.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    score: Mapped[float] = mapped_column(Float, nullable=False)
+    rank: Mapped[int] = mapped_column(Integer, nullable=False, unique=True)  # Performance: explore paging
+    computed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    _insert_columns = ('post_id', 'score', 'rank', 'computed_at')
+
+    @staticmethod
+    def engagement_score(like_count: int, comment_count: int, created_at: datetime,
+                         now: datetime) -> float:
+        """Time-decayed engagement score for one post."""
+        # SQLite returns naive timestamps; treat them as UTC
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        if now.tzinfo is None:
+            now = now.replace(tzinfo=timezone.utc)
+        age_hours = max((now - created_at).total_seconds() / 3600, 0)
+        engagement = (like_count or 0) + COMMENT_WEIGHT * (comment_count or 0)
+        return engagement / (age_hours + 2) ** SCORE_GRAVITY
+
+    @staticmethod
+    def _score_expression(now: datetime):
+        """``engagement_score`` as a SQL expression over the posts table."""
+        if now.tzinfo is None:
+            now = now.replace(tzinfo=timezone.utc)
+        age_hours = (now.timestamp() - func.extract('epoch', Post.created_at)) / 3600
+        age_hours = case((age_hours < 0, 0), else_=age_hours)
+        engagement = func.coalesce(Post.like_count, 0) + COMMENT_WEIGHT * func.coalesce(Post.comment_count, 0)
+        return engagement / func.power(age_hours + 2, SCORE_GRAVITY)
+
+    @classmethod
+    def recompute(cls, now: Optional[datetime] = None) -> int:
+        """
+        Rescore every post from its denormalized counters and rewrite the
+        ranking in one INSERT ... SELECT, ranked by a window function.
+        Returns the number of posts ranked.
+        """
+        now = now or datetime.now(timezone.utc)
+        score = cls._score_expression(now)
+        ranked = select(
+            Post.id,
+            score,
+            # Highest score first; newer posts (higher ids) win ties
+            func.row_number().over(order_by=(score.desc(), Post.id.desc())),
+            literal(now, DateTime(timezone=True)),
+        )
+        db.session.execute(delete(cls))
+        return db.session.execute(insert(cls).from_select(cls._insert_columns, ranked)).rowcount
+
+    @classmethod
+    def is_populated(cls) -> bool:
+        """Whether a ranking has been computed."""
+        return db.session.scalar(select(cls.post_id).limit(1)) is not None
+
+    @classmethod
+    def remove_post(cls, post_id: int) -> None:
+        """
+        Drop a deleted post from the ranking. The hole it leaves is skipped
+        by the keyset explore cursor and closed by the next ``score-posts`` run.
+        """
+        db.session.execute(delete(cls).where(cls.post_id == post_id))
@@ -0,0 +1,224 @@
+from __future__ import annotations
+from typing import Optional
+import logging
+import time
+
+from ..models import db
+from sqlalchemy import case, event, func, or_, select, literal_column, text
+from sqlalchemy.exc import SQLAlchemyError
+
+from .user import User
+from ..utils.prefix_index import PrefixIndex
+
+logger = logging.getLogger(__name__)
+
+SEARCH_PAGE_SIZE = 20
+TYPEAHEAD_PAGE_SIZE = 8
+# Each worker keeps its own type-ahead index; reloading it this often bounds
+# how long changes written by other workers stay invisible
+TYPEAHEAD_MAX_AGE = 300
+# Deepest result reachable by paging; relevance-ranked lists past this are noise
+MAX_SEARCH_RESULTS = 200
+# Trigram indexes need at least one full trigram to narrow the candidates
+MIN_TRIGRAM_LENGTH = 3
+
+# PostgreSQL: trigram GIN indexes serve ILIKE '%term%' without a sequential scan
+POSTGRES_DDL = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_users_username_trgm ON users USING gin (username gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_users_full_name_trgm ON users USING gin (full_name gin_trgm_ops)",
+)
+POSTGRES_DROP = (
+    "DROP INDEX IF EXISTS ix_users_full_name_trgm",
+    "DROP INDEX IF EXISTS ix_users_username_trgm",
+)
+
+# SQLite: an external-content FTS5 trigram table over users, kept in sync by triggers
+SQLITE_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS users_fts USING fts5("
+    "username, full_name, content='users', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS users_fts_ai AFTER INSERT ON users BEGIN "
+    "INSERT INTO users_fts(rowid, username, full_name) VALUES (new.id, new.username, new.full_name); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS users_fts_ad AFTER DELETE ON users BEGIN "
+    "INSERT INTO users_fts(users_fts, rowid, username, full_name) "
+    "VALUES ('delete', old.id, old.username, old.full_name); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS users_fts_au AFTER UPDATE OF username, full_name ON users BEGIN "
+    "INSERT INTO users_fts(users_fts, rowid, username, full_name) "
+    "VALUES ('delete', old.id, old.username, old.full_name); "
+    "INSERT INTO users_fts(rowid, username, full_name) VALUES (new.id, new.username, new.full_name); "
+    "END",
+)
+SQLITE_DROP = (
+    "DROP TRIGGER IF EXISTS users_fts_au",
+    "DROP TRIGGER IF EXISTS users_fts_ad",
+    "DROP TRIGGER IF EXISTS users_fts_ai",
+    "DROP TABLE IF EXISTS users_fts",
+)
+
+
+@event.listens_for(User.__table__, "after_create")
+def _create_search_index(target, connection, **kw):
+    for statement in {"postgresql": POSTGRES_DDL, "sqlite": SQLITE_DDL}.get(connection.dialect.name, ()):
+        connection.exec_driver_sql(statement)
+
+
+@event.listens_for(User.__table__, "before_drop")
+def _drop_search_index(target, connection, **kw):
+    for statement in {"postgresql": POSTGRES_DROP, "sqlite": SQLITE_DROP}.get(connection.dialect.name, ()):
+        connection.exec_driver_sql(statement)
+
+
+class UserSearch:
+    """
+    Ranked, bounded username and full name search.
+
+    Candidates come from the dialect's substring index (``pg_trgm`` GIN on
+    PostgreSQL, the ``users_fts`` FTS5 trigram table on SQLite), so lookups
+    stay index-driven as the users table grows. Results are ranked exact
+    username, username prefix, full name prefix, then closeness, and paged
+    by offset up to ``MAX_SEARCH_RESULTS``.
+
+    Type-ahead prefix lookups are answered from an in-process
+    ``PrefixIndex`` of usernames and full names, falling back to the
+    database when the index cannot be loaded.
+    """
+
+    prefix_index = PrefixIndex()
+
+    @staticmethod
+    def _dialect() -> str:
+        return db.session.get_bind().dialect.name
+
+    @staticmethod
+    def _substring_match(term: str):
+        return or_(
+            User.username.icontains(term, autoescape=True),
+            User.full_name.icontains(term, autoescape=True),
+        )
+
+    @classmethod
+    def _match(cls, term: str, dialect: str):
+        """Filter selecting users whose username or full name contains ``term``."""
+        if dialect == "sqlite" and len(term) >= MIN_TRIGRAM_LENGTH:
+            phrase = '"' + term.replace('"', '""') + '"'
+            fts_ids = (
+                select(literal_column("rowid"))
+                .select_from(text("users_fts"))
+                .where(text("users_fts MATCH :phrase").bindparams(phrase=phrase))
+            )
+            return User.id.in_(fts_ids)
+        # PostgreSQL answers ILIKE from the trigram GIN indexes
+        return cls._substring_match(term)
+
+    @staticmethod
+    def _ranking(term: str, dialect: str) -> tuple:
+        tier = case(
+            (func.lower(User.username) == term.lower(), 0),
+            (User.username.istartswith(term, autoescape=True), 1),
+            (User.full_name.istartswith(term, autoescape=True), 2),
+            else_=3,
+        )
+        if dialect == "postgresql":
+            closeness = func.greatest(
+                func.similarity(User.username, term), func.similarity(User.full_name, term)
+            ).desc()
+        else:
+            closeness = func.length(User.username)
+        return tier, closeness, User.id
+
+    @classmethod
+    def users(cls, term: str, limit: int = SEARCH_PAGE_SIZE,
+              offset: int = 0) -> tuple[list[User], Optional[int]]:
+        """
+        One page of users matching ``term``, best match first.
+        Returns the users and the offset of the next page (``None`` on the last page).
+        """
+        term = term.strip()
+        offset = max(offset, 0)
+        limit = min(limit, MAX_SEARCH_RESULTS - offset)
+        if not term or limit <= 0:
+            return [], None
+
+        dialect = cls._dialect()
+        rows = (User.query
+                .filter(cls._match(term, dialect))
+                .order_by(*cls._ranking(term, dialect))
+                .offset(offset)
+                .limit(limit + 1)
+                .all())
+
+        next_offset = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            if offset + limit < MAX_SEARCH_RESULTS:
+                next_offset = offset + limit
+        return rows, next_offset
+
+    @classmethod
+    def results_page(cls, term: str, limit: int = SEARCH_PAGE_SIZE, offset: int = 0) -> dict:
+        """
+        The ``/api/search`` response body for one page of results. Rows are
+        public summaries only, so cached pages hold no private fields and go
+        stale only on username, full name or profile image changes.
+        """
+        users, next_offset = cls.users(term, limit, offset)
+        results = [cls._summary(user.id, user.username, user.full_name, user.profile_image_url)
+                   for user in users]
+        return {"results": results, "next_offset": next_offset}
+
+    @staticmethod
+    def _summary(user_id: int, username: str, full_name: str,
+                 profile_image_url: Optional[str]) -> dict:
+        return {
+            "id": user_id,
+            "username": username,
+            "full_name": full_name,
+            "profile_image_url": profile_image_url,
+        }
+
+    @staticmethod
+    def _keys(username: str, full_name: str) -> list[str]:
+        """Username, full name and each word of the full name."""
+        return [username, full_name or "", *(full_name or "").split()]
+
+    @classmethod
+    def load_index(cls) -> int:
+        """(Re)build the type-ahead index from the users table; returns users indexed."""
+        rows = db.session.execute(
+            select(User.id, User.username, User.full_name, User.profile_image_url)
+        )
+        cls.prefix_index.load(
+            (user_id, cls._keys(username, full_name),
+             cls._summary(user_id, username, full_name, profile_image_url))
+            for user_id, username, full_name, profile_image_url in rows
+        )
+        return len(cls.prefix_index)
+
+    @classmethod
+    def index_user(cls, user: User) -> None:
+        """Refresh one user's type-ahead entry after a signup or profile change."""
+        if cls.prefix_index.loaded:
+            cls.prefix_index.put(
+                user.id, cls._keys(user.username, user.full_name),
+                cls._summary(user.id, user.username, user.full_name, user.profile_image_url)
+            )
+
+    @classmethod
+    def typeahead(cls, prefix: str, limit: int = TYPEAHEAD_PAGE_SIZE) -> list[dict]:
+        """
+        Summaries of users whose username, full name or a word of it starts
+        with ``prefix``, served from memory once the index is loaded.
+        """
+        index = cls.prefix_index
+        try:
+            if not index.loaded or time.monotonic() - index.loaded_at > TYPEAHEAD_MAX_AGE:
+                cls.load_index()
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            logger.warning(f"Type-ahead index unavailable, using database search: {e}")
+            users, _ = cls.users(prefix, limit)
+            return [cls._summary(user.id, user.username, user.full_name, user.profile_image_url)
+                    for user in users]
+        return index.search(prefix, limit)
@@ -0,0 +1,149 @@
+from __future__ import annotations
+from typing import Optional
+from datetime import datetime
+import re
+
+from ..models import db
+from sqlalchemy import and_, delete, insert, select, func, String, Integer, DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .post import Post
+
+# '#' followed by letters, digits or underscores, not preceded by a word character
+HASHTAG_PATTERN = re.compile(r"(?<!\w)#(\w{1,100})")
+POST_TAGGABLE_TYPE = "post"
+
+
+class Tag(db.Model):
+    """
+    A normalized hashtag attached to a post (``taggable_type='post'``).
+
+    The post's ``created_at`` is copied onto the row, so a page of a hashtag
+    newest first is one range scan on ``ix_tags_content_created`` rather
+    than a sort of every post carrying the tag. The index is unique, and
+    ``taggable_created_at`` is fixed per post, so a tag cannot be stored
+    twice on the same post.
+    """
+    __tablename__ = 'tags'
+
+    # Modern SQLAlchemy 2.0 mapped columns with type annotations
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    content: Mapped[str] = mapped_column(String(2000), nullable=False)
+    taggable_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    taggable_type: Mapped[str] = mapped_column(String(10), nullable=False)
+    taggable_created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False
+    )
+
+    # Performance indexes for polymorphic and hashtag queries
+    __table_args__ = (
+        Index('ix_tags_polymorphic', 'taggable_id', 'taggable_type'),
+        Index('ix_tags_content_created', 'content', 'taggable_type', 'taggable_created_at', 'taggable_id',
+              unique=True),
+    )
+
+    def to_dict(self) -> dict[str, any]:
+        """Convert tag instance to dictionary for API responses."""
+        return {
+            "id": self.id,
+            "content": self.content,
+            "taggable_id": self.taggable_id,
+            "taggable_type": self.taggable_type,
+        }
+
+    @staticmethod
+    def normalize(tag: str) -> str:
+        """Stored form of a hashtag: no leading '#' or surrounding whitespace, case-folded."""
+        return tag.strip().lstrip('#').strip().casefold()
+
+    @classmethod
+    def parse(cls, caption: Optional[str]) -> list[str]:
+        """Distinct normalized hashtags in a caption, in order of appearance."""
+        return list(dict.fromkeys(cls.normalize(tag) for tag in HASHTAG_PATTERN.findall(caption or "")))
+
+    @classmethod
+    def sync_post(cls, post_id: int, caption: Optional[str]) -> None:
+        """Make a post's tag rows match the hashtags in its caption."""
+        wanted = set(cls.parse(caption))
+        existing = set(db.session.scalars(
+            select(cls.content).where(cls.taggable_id == post_id, cls.taggable_type == POST_TAGGABLE_TYPE)
+        ))
+        stale = existing - wanted
+        if stale:
+            db.session.execute(delete(cls).where(
+                cls.taggable_id == post_id,
+                cls.taggable_type == POST_TAGGABLE_TYPE,
+                cls.content.in_(stale)
+            ))
+        missing = wanted - existing
+        if missing:
+            created_at = db.session.scalar(select(Post.created_at).where(Post.id == post_id))
+            db.session.execute(insert(cls), [
+                {"content": content, "taggable_id": post_id, "taggable_type": POST_TAGGABLE_TYPE,
+                 "taggable_created_at": created_at}
+                for content in missing
+            ])
+
+    @classmethod
+    def remove_post(cls, post_id: int) -> None:
+        """Drop the tags of a deleted post."""
+        db.session.execute(delete(cls).where(
+            cls.taggable_id == post_id, cls.taggable_type == POST_TAGGABLE_TYPE
+        ))
+
+    @classmethod
+    def posts_query(cls, tag: str):
+        """Posts carrying ``tag``, to be ordered by ``taggable_created_at, taggable_id``."""
+        return Post.query.join(cls, and_(
+            cls.taggable_id == Post.id,
+            cls.taggable_type == POST_TAGGABLE_TYPE,
+        )).filter(cls.content == cls.normalize(tag))
+
+    @classmethod
+    def backfill(cls, batch_size: int = 1000) -> int:
+        """
+        Rebuild post tags from every caption containing a '#'.
+        Returns the number of tag rows written.
+
+        Captions are read in post id keyset batches, and each batch replaces
+        the tags of the id range it spans and commits, so neither memory nor
+        the transaction grows with the posts table. (A server-side cursor
+        would not survive the per-batch commits.)
+        """
+        written, last_id = 0, 0
+        while True:
+            rows = db.session.execute(
+                select(Post.id, Post.caption, Post.created_at)
+                .where(Post.id > last_id, Post.caption.contains('#'))
+                .order_by(Post.id)
+                .limit(batch_size)
+            ).all()
+
+            # Untagged posts in the range lose any stale tags too
+            stale = and_(cls.taggable_type == POST_TAGGABLE_TYPE, cls.taggable_id > last_id)
+            if len(rows) == batch_size:
+                stale = and_(stale, cls.taggable_id <= rows[-1].id)
+            db.session.execute(delete(cls).where(stale))
+            values = [
+                {"content": content, "taggable_id": post_id, "taggable_type": POST_TAGGABLE_TYPE,
+                 "taggable_created_at": created_at}
+                for post_id, caption, created_at in rows
+                for content in cls.parse(caption)
+            ]
+            if values:
+                db.session.execute(insert(cls), values)
+                written += len(values)
+            db.session.commit()
+
+            if len(rows) < batch_size:
+                return written
+            last_id = rows[-1].id
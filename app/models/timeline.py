@@ -0,0 +1,98 @@
+from __future__ import annotations
+from datetime import datetime
+
+from ..models import db
+from sqlalchemy import func, select, insert, delete, literal, Integer, DateTime, ForeignKey, Index, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .follow import Follow
+from .post import Post
+
+
+class TimelineEntry(db.Model):
+    """
+    Materialized home timeline: one row per (feed owner, post).
+
+    Rows are written when a post is created (fan-out on write) and when a
+    follow is created or removed, so reading a home feed is a single range
+    scan on ``ix_timeline_entries_user_created``.
+
+    A user's feed holds posts by the ``user_id`` of every Follow row whose
+    ``user_followed_id`` is that user, matching the original home_feed query.
+    """
+    __tablename__ = 'timeline_entries'
+
+    # Modern SQLAlchemy 2.0 mapped columns with type annotations
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    post_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("posts.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True  # Performance: cleanup on post delete
+    )
+    author_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    post_created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+
+    # Performance indexes and constraints
+    __table_args__ = (
+        Index('ix_timeline_entries_user_created', 'user_id', 'post_created_at', 'post_id'),
+        Index('ix_timeline_entries_user_author', 'user_id', 'author_id'),
+        UniqueConstraint('user_id', 'post_id', name='unique_timeline_entry'),
+    )
+
+    _insert_columns = ('user_id', 'post_id', 'author_id', 'post_created_at')
+
+    @classmethod
+    def fan_out(cls, post_id: int) -> None:
+        """Push a post into the timeline of every user whose feed includes its author."""
+        recipients = (
+            select(Follow.user_followed_id, Post.id, Post.user_id, Post.created_at)
+            .join(Post, Post.user_id == Follow.user_id)
+            .where(Post.id == post_id)
+        )
+        db.session.execute(insert(cls).from_select(cls._insert_columns, recipients))
+
+    @classmethod
+    def backfill(cls, feed_user_id: int, author_id: int) -> None:
+        """Copy an author's existing posts into a feed after a new follow."""
+        posts = select(literal(feed_user_id), Post.id, Post.user_id, Post.created_at).where(
+            Post.user_id == author_id
+        )
+        db.session.execute(insert(cls).from_select(cls._insert_columns, posts))
+
+    @classmethod
+    def prune(cls, feed_user_id: int, author_id: int) -> None:
+        """Drop an author's posts from a feed after an unfollow."""
+        db.session.execute(
+            delete(cls).where(cls.user_id == feed_user_id, cls.author_id == author_id)
+        )
+
+    @classmethod
+    def remove_post(cls, post_id: int) -> None:
+        """Drop a deleted post from every timeline."""
+        db.session.execute(delete(cls).where(cls.post_id == post_id))
+
+    @classmethod
+    def rebuild(cls) -> int:
+        """Recompute every timeline from the follows and posts tables."""
+        db.session.execute(delete(cls))
+        entries = (
+            select(Follow.user_followed_id, Post.id, Post.user_id, Post.created_at)
+            .join(Post, Post.user_id == Follow.user_id)
+        )
+        return db.session.execute(insert(cls).from_select(cls._insert_columns, entries)).rowcount
+
+    @classmethod
+    def entries_query(cls, feed_user_id: int):
+        """A user's timeline entries, for reading post and author ids without loading posts."""
+        return cls.query.filter(cls.user_id == feed_user_id)
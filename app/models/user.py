@@ -4,13 +4,14 @@ from datetime import datetime
 
 from ..models import db
 from werkzeug.security import generate_password_hash, check_password_hash
-from sqlalchemy import func, String, Integer, DateTime, Text
+from sqlalchemy import func, select, update, String, Integer, DateTime, Text
 from sqlalchemy.orm import validates, Mapped, mapped_column, relationship
 from flask_login import UserMixin
 
+from .follow import Follow
+from .post import Post
+
 if TYPE_CHECKING:
-    from .post import Post
-    from .follow import Follow
     from .like import Like
     from .comment import Comment
 
@@ -25,6 +26,10 @@ class User(db.Model, UserMixin):
     hashed_password: Mapped[str] = mapped_column(String(128), nullable=False)
     profile_image_url: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     bio: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Denormalized counters, maintained by the follow/post write paths
+    follower_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    following_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    post_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), 
         server_default=func.now(), 
@@ -58,6 +63,52 @@ class User(db.Model, UserMixin):
 
         return value
 
+    @classmethod
+    def adjust_counts(cls, user_id: int, followers: int = 0, following: int = 0, posts: int = 0) -> None:
+        """Atomically shift the denormalized counters within the current transaction."""
+        values = {}
+        if followers:
+            values[cls.follower_count] = cls.follower_count + followers
+        if following:
+            values[cls.following_count] = cls.following_count + following
+        if posts:
+            values[cls.post_count] = cls.post_count + posts
+        if values:
+            db.session.execute(update(cls).where(cls.id == user_id).values(values))
+
+    @classmethod
+    def follower_count_column(cls):
+        """Follower count recomputed from the follows table, used to reconcile ``follower_count``."""
+        return (
+            select(func.count(Follow.id))
+            .where(Follow.user_followed_id == cls.id)
+            .correlate(cls)
+            .scalar_subquery()
+            .label("follower_count")
+        )
+
+    @classmethod
+    def following_count_column(cls):
+        """Following count recomputed from the follows table, used to reconcile ``following_count``."""
+        return (
+            select(func.count(Follow.id))
+            .where(Follow.user_id == cls.id)
+            .correlate(cls)
+            .scalar_subquery()
+            .label("following_count")
+        )
+
+    @classmethod
+    def post_count_column(cls):
+        """Post count recomputed from the posts table, used to reconcile ``post_count``."""
+        return (
+            select(func.count(Post.id))
+            .where(Post.user_id == cls.id)
+            .correlate(cls)
+            .scalar_subquery()
+            .label("post_count")
+        )
+
     @property
     def password(self) -> str:
         return self.hashed_password
@@ -4,7 +4,7 @@ Provides type-safe validation for user operations.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, EmailStr, Field, ConfigDict
 
 
@@ -72,6 +72,18 @@ class UserPublicSchema(BaseModel):
     profile_image_url: Optional[str] = None
 
 
+# Upper bound on ids per list in a relationship lookup; a feed page needs far fewer
+MAX_RELATIONSHIP_IDS = 500
+
+
+class RelationshipLookupSchema(BaseModel):
+    """Schema for a bulk follow/like state lookup on behalf of a viewer."""
+    viewer_id: int = Field(..., description="User whose relationships are checked")
+    user_ids: List[int] = Field(default_factory=list, max_length=MAX_RELATIONSHIP_IDS)
+    post_ids: List[int] = Field(default_factory=list, max_length=MAX_RELATIONSHIP_IDS)
+    comment_ids: List[int] = Field(default_factory=list, max_length=MAX_RELATIONSHIP_IDS)
+
+
 class UserStatsSchema(BaseModel):
     """Schema for user statistics."""
     model_config = ConfigDict(from_attributes=True)
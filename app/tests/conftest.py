@@ -179,6 +179,22 @@ def mock_redis():
         yield mock_redis
 
 
+@pytest.fixture
+def query_counter(app):
+    """Count SQL statements executed while the fixture is active."""
+    from sqlalchemy import event
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.engine
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    yield statements
+    event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+
 @pytest.fixture
 def test_app_context(app):
     """Provide test application context."""
@@ -0,0 +1,35 @@
+"""
+Tests for operator-only admin routes.
+"""
+from unittest.mock import patch
+
+
+class TestAdminCacheMetrics:
+    """Test the cache metrics admin endpoint and its token guard."""
+
+    def test_disabled_without_token(self, client, app):
+        """Test the admin API is off unless ADMIN_API_TOKEN is configured."""
+        with patch.dict(app.config, {'ADMIN_API_TOKEN': None}):
+            response = client.get('/api/admin/cache')
+
+        assert response.status_code == 404
+
+    def test_rejects_wrong_token(self, client, app):
+        """Test a missing or wrong X-Admin-Token is refused."""
+        with patch.dict(app.config, {'ADMIN_API_TOKEN': 'secret-token'}):
+            assert client.get('/api/admin/cache').status_code == 403
+            assert client.get('/api/admin/cache', headers={'X-Admin-Token': 'nope'}).status_code == 403
+
+    def test_returns_stats_and_metrics(self, client, app):
+        """Test operators get backend stats and per-type metrics."""
+        metrics = {'post_scroll': {'hits': 9, 'misses': 1, 'hit_rate': 0.9}}
+        with patch.dict(app.config, {'ADMIN_API_TOKEN': 'secret-token'}), \
+                patch('app.api.admin_routes.cache_manager') as mock_cache:
+            mock_cache.get_stats.return_value = {'status': 'active', 'backend': 'redis'}
+            mock_cache.collect_metrics.return_value = metrics
+            response = client.get('/api/admin/cache', headers={'X-Admin-Token': 'secret-token'})
+
+        assert response.status_code == 200
+        body = response.get_json()
+        assert body['stats']['backend'] == 'redis'
+        assert body['metrics'] == metrics
@@ -0,0 +1,51 @@
+"""
+Tests for per-cache-type cache metrics.
+"""
+from unittest.mock import patch
+
+from app.utils.cache_metrics import CacheMetrics, PUBLISH_INTERVAL
+
+
+class TestCacheMetrics:
+    """Test counting, latency percentiles and cross-worker merging."""
+
+    def test_summary_rates_and_percentiles(self):
+        """Test hit rate counts stale serves as hits and percentiles use the samples."""
+        metrics = CacheMetrics()
+        metrics.incr("post_scroll", "hits", 6)
+        metrics.incr("post_scroll", "stale", 2)
+        metrics.incr("post_scroll", "misses", 2)
+        for ms in range(1, 101):
+            metrics.record_lookup("post_scroll", ms / 1000)
+
+        row = CacheMetrics.summarize([metrics.snapshot()])["post_scroll"]
+
+        assert row["hit_rate"] == 0.8
+        assert row["p50_ms"] == 51.0
+        assert row["p99_ms"] == 100.0
+
+    def test_summary_merges_workers(self):
+        """Test counters add up and latency samples pool across snapshots."""
+        first, second = CacheMetrics(), CacheMetrics()
+        first.incr("user_profile", "sets")
+        first.incr("user_profile", "bytes", 300)
+        second.incr("user_profile", "sets", 2)
+        second.incr("post_details", "evictions")
+        second.record_lookup("user_profile", 0.004)
+
+        summary = CacheMetrics.summarize([first.snapshot(), second.snapshot()])
+
+        assert summary["user_profile"]["sets"] == 3
+        assert summary["user_profile"]["bytes"] == 300
+        assert summary["user_profile"]["hit_rate"] is None
+        assert summary["user_profile"]["p99_ms"] == 4.0
+        assert summary["post_details"]["evictions"] == 1
+
+    def test_publish_due_once_per_interval(self):
+        """Test a worker claims one publication per interval."""
+        with patch("app.utils.cache_metrics.time.monotonic", return_value=0.0):
+            metrics = CacheMetrics()
+            assert metrics.publish_due() is False
+        with patch("app.utils.cache_metrics.time.monotonic", return_value=PUBLISH_INTERVAL + 1.0):
+            assert metrics.publish_due() is True
+            assert metrics.publish_due() is False
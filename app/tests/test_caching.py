@@ -5,6 +5,8 @@ Tests Redis-based caching with smart invalidation strategies
 import pytest
 import pickle
 import hashlib
+import json
+import time
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timedelta
 from app.utils.caching import (
@@ -13,15 +15,34 @@ from app.utils.caching import (
     cache_key,
     cached,
     smart_cached,
-    invalidate_cache_pattern,
     invalidate_user_cache,
+    invalidate_user_content,
     invalidate_post_cache,
     user_profile_cache,
     post_details_cache,
     post_scroll_cache,
     explore_posts_cache,
-    search_results_cache
+    search_results_cache,
+    normalize_search_term,
+    search_cache_key,
+    search_timeout,
+    hot_search_timeout,
+    record_search,
+    hot_searches,
+    SEARCH_HOT_KEY,
+    HOT_SEARCH_TRACKED,
+    MAX_SEARCH_TERM_LENGTH,
+    CacheEntry,
+    EntityCache,
+    hydrate,
+    user_summary_key,
+    warm_hot_searches,
+    namespace_tag,
+    post_tag,
+    user_tag
 )
+from app.utils.local_cache import LocalCache
+from app.utils.cache_metrics import CacheMetrics
 
 
 class TestCacheManager:
@@ -60,6 +81,38 @@ class TestCacheManager:
         assert manager.key_prefix == 'test:'
         assert app.extensions['cache_manager'] == manager
 
+    @patch('app.utils.caching.redis')
+    def test_init_app_memory_fallback(self, mock_redis):
+        """Test CACHE_FALLBACK='memory' swaps in the in-process backend when Redis is down."""
+        mock_redis.from_url.side_effect = Exception("Connection failed")
+        
+        app = Mock()
+        app.config = {'CACHE_CONFIG': {'CACHE_FALLBACK': 'memory', 'CACHE_KEY_PREFIX': 'test:'}}
+        app.extensions = {}
+        
+        manager = CacheManager()
+        manager.init_app(app)
+        
+        assert manager.backend == 'memory'
+        assert manager.key_prefix == 'test:'
+        assert manager.set('user:1', {'id': 1}) is True
+        assert manager.get('user:1') == {'id': 1}
+
+    @patch('app.utils.caching.redis')
+    def test_init_app_configures_codec(self, mock_redis):
+        """Test the serializer and compression come from CACHE_CONFIG."""
+        app = Mock()
+        app.config = {'CACHE_CONFIG': {
+            'CACHE_SERIALIZER': 'pickle', 'CACHE_COMPRESSION': 'zlib', 'CACHE_COMPRESS_MIN_BYTES': 64
+        }}
+        app.extensions = {}
+        
+        manager = CacheManager()
+        manager.init_app(app)
+        
+        assert manager.codec.name == 'pickle+zlib'
+        assert manager.codec.compress_min_bytes == 64
+
     @patch('app.utils.caching.redis')
     def test_init_app_failure(self, mock_redis):
         """Test app initialization failure."""
@@ -82,15 +135,15 @@ class TestCacheManager:
         key = manager._make_key('user:123')
         assert key == 'test:user:123'
 
-    @patch('app.utils.caching.pickle')
-    def test_get_success(self, mock_pickle):
+    def test_get_success(self):
         """Test successful cache get operation."""
         # Mock Redis client
         mock_redis = Mock()
         mock_redis.get.return_value = b'cached_data'
-        mock_pickle.loads.return_value = {'user_id': 123}
         
         manager = CacheManager()
+        manager.codec = Mock()
+        manager.codec.loads.return_value = {'user_id': 123}
         manager.redis_client = mock_redis
         manager.key_prefix = 'test:'
         
@@ -98,6 +151,7 @@ class TestCacheManager:
         
         assert result == {'user_id': 123}
         mock_redis.get.assert_called_once_with('test:user:123')
+        manager.codec.loads.assert_called_once_with(b'cached_data')
 
     def test_get_no_redis(self):
         """Test cache get when Redis is not available."""
@@ -119,22 +173,27 @@ class TestCacheManager:
         result = manager.get('user:123', default='default_value')
         assert result == 'default_value'
 
-    @patch('app.utils.caching.pickle')
-    def test_set_success(self, mock_pickle):
+    def test_set_success(self):
         """Test successful cache set operation."""
         # Mock Redis client
         mock_redis = Mock()
-        mock_redis.setex.return_value = True
-        mock_pickle.dumps.return_value = b'serialized_data'
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.return_value = [True, 1, 1, True]
         
         manager = CacheManager()
+        manager.codec = Mock()
+        manager.codec.dumps.return_value = b'serialized_data'
         manager.redis_client = mock_redis
         manager.key_prefix = 'test:'
         
         result = manager.set('user:123', {'user_id': 123}, 600)
         
         assert result is True
-        mock_redis.setex.assert_called_once_with('test:user:123', 600, b'serialized_data')
+        pipe.setex.assert_called_once_with('test:user:123', 600, b'serialized_data')
+        pipe.sadd.assert_any_call('test:namespaces', 'user')
+        tag_key, members = pipe.zadd.call_args.args
+        assert tag_key == 'test:tags:ns:user' and list(members) == ['test:user:123']
+        mock_redis.keys.assert_not_called()
 
     def test_set_no_redis(self):
         """Test cache set when Redis is not available."""
@@ -148,7 +207,7 @@ class TestCacheManager:
         """Test cache set with exception."""
         # Mock Redis client that raises exception
         mock_redis = Mock()
-        mock_redis.setex.side_effect = Exception("Redis error")
+        mock_redis.pipeline.side_effect = Exception("Redis error")
         
         manager = CacheManager()
         manager.redis_client = mock_redis
@@ -179,43 +238,44 @@ class TestCacheManager:
         result = manager.delete('user:123')
         assert result is False
 
-    def test_delete_pattern_success(self):
-        """Test successful pattern delete operation."""
-        # Mock Redis client
+    def test_invalidate_tags_success(self):
+        """Test tag invalidation deletes exactly the registered keys."""
         mock_redis = Mock()
-        mock_redis.keys.return_value = [b'test:user:123', b'test:user:456']
-        mock_redis.delete.return_value = 2
+        mock_redis.pipeline.return_value.execute.return_value = [
+            {b'test:user:123', b'test:user:456'}, {b'test:user:456'}
+        ]
+        mock_redis.delete.side_effect = [2, 2]
         
         manager = CacheManager()
         manager.redis_client = mock_redis
         manager.key_prefix = 'test:'
         
-        result = manager.delete_pattern('user:*')
+        result = manager.invalidate_tags('user:1', 'post:2')
         
         assert result == 2
-        mock_redis.keys.assert_called_once_with('test:user:*')
-        mock_redis.delete.assert_called_once_with(b'test:user:123', b'test:user:456')
+        mock_redis.delete.assert_any_call(b'test:user:123', b'test:user:456')
+        mock_redis.delete.assert_any_call('test:tags:user:1', 'test:tags:post:2')
+        mock_redis.keys.assert_not_called()
 
-    def test_delete_pattern_no_keys(self):
-        """Test pattern delete when no keys match."""
-        # Mock Redis client
+    def test_invalidate_tags_no_keys(self):
+        """Test tag invalidation when nothing is registered under the tag."""
         mock_redis = Mock()
-        mock_redis.keys.return_value = []
+        mock_redis.pipeline.return_value.execute.return_value = [set()]
         
         manager = CacheManager()
         manager.redis_client = mock_redis
         manager.key_prefix = 'test:'
         
-        result = manager.delete_pattern('user:*')
+        result = manager.invalidate_tags('user:1')
         
         assert result == 0
-        mock_redis.delete.assert_not_called()
+        mock_redis.delete.assert_called_once_with('test:tags:user:1')
 
     def test_clear_all_success(self):
-        """Test successful clear all operation."""
-        # Mock Redis client
+        """Test clear all drops every namespace tag without scanning keys."""
         mock_redis = Mock()
-        mock_redis.keys.return_value = [b'test:user:123', b'test:user:456']
+        mock_redis.smembers.return_value = {b'user', b'post_scroll'}
+        mock_redis.pipeline.return_value.execute.return_value = [{b'test:post_scroll:offset:0'}, {b'test:user:1'}]
         mock_redis.delete.return_value = 2
         
         manager = CacheManager()
@@ -225,8 +285,10 @@ class TestCacheManager:
         result = manager.clear_all()
         
         assert result is True
-        mock_redis.keys.assert_called_once_with('test:*')
-        mock_redis.delete.assert_called_once_with(b'test:user:123', b'test:user:456')
+        mock_redis.smembers.assert_called_once_with('test:namespaces')
+        mock_redis.delete.assert_any_call(b'test:post_scroll:offset:0', b'test:user:1')
+        mock_redis.delete.assert_any_call('test:namespaces')
+        mock_redis.keys.assert_not_called()
 
     def test_get_stats_success(self):
         """Test successful stats retrieval."""
@@ -239,7 +301,8 @@ class TestCacheManager:
             'connected_clients': 5,
             'db1': {'keys': 100}
         }
-        mock_redis.keys.return_value = [b'test:key1', b'test:key2']
+        mock_redis.smembers.return_value = {b'user', b'post_scroll'}
+        mock_redis.pipeline.return_value.execute.return_value = [1, 1]
         
         manager = CacheManager()
         manager.redis_client = mock_redis
@@ -250,6 +313,8 @@ class TestCacheManager:
         assert stats['status'] == 'active'
         assert stats['redis_version'] == '6.0.0'
         assert stats['our_keys'] == 2
+        assert stats['namespace_keys'] == {'post_scroll': 1, 'user': 1}
+        mock_redis.keys.assert_not_called()
 
     def test_get_stats_no_redis(self):
         """Test stats retrieval when Redis is not available."""
@@ -382,34 +447,33 @@ class TestInvalidateFunctions:
     """Test cache invalidation functions."""
 
     @patch('app.utils.caching.cache_manager')
-    def test_invalidate_cache_pattern(self, mock_cache_manager):
-        """Test cache pattern invalidation."""
-        mock_cache_manager.delete_pattern.return_value = 3
+    def test_invalidate_user_cache(self, mock_cache_manager):
+        """Test user cache invalidation deletes the user's structured profile key."""
+        mock_cache_manager.delete.return_value = True
         
-        result = invalidate_cache_pattern('user:*')
+        result = invalidate_user_cache(123)
         
-        assert result == 3
-        mock_cache_manager.delete_pattern.assert_called_once_with('user:*')
+        assert result == 1
+        mock_cache_manager.delete.assert_called_once_with('user_profile:user_id:123')
+        mock_cache_manager.invalidate_tags.assert_not_called()
 
     @patch('app.utils.caching.cache_manager')
-    def test_invalidate_user_cache(self, mock_cache_manager):
-        """Test user cache invalidation."""
-        mock_cache_manager.delete_pattern.side_effect = [2, 1, 0]
-        
-        result = invalidate_user_cache(123)
+    def test_invalidate_user_content(self, mock_cache_manager):
+        """Test a profile edit drops everything tagged with the user."""
+        mock_cache_manager.invalidate_tags.return_value = 4
         
-        assert result == 3
-        assert mock_cache_manager.delete_pattern.call_count == 3
+        assert invalidate_user_content(123) == 4
+        mock_cache_manager.invalidate_tags.assert_called_once_with('user:123')
 
     @patch('app.utils.caching.cache_manager')
     def test_invalidate_post_cache(self, mock_cache_manager):
-        """Test post cache invalidation."""
-        mock_cache_manager.delete_pattern.side_effect = [1, 2, 0]
+        """Test post cache invalidation drops every entry tagged with the post."""
+        mock_cache_manager.invalidate_tags.return_value = 3
         
         result = invalidate_post_cache(456)
         
         assert result == 3
-        assert mock_cache_manager.delete_pattern.call_count == 3
+        mock_cache_manager.invalidate_tags.assert_called_once_with('post:456')
 
 
 class TestConvenienceDecorators:
@@ -444,4 +508,711 @@ class TestConvenienceDecorators:
         """Test search_results_cache decorator."""
         decorator = search_results_cache()
         assert callable(decorator)
-        assert decorator.__name__ == 'decorator' 
\ No newline at end of file
+        assert decorator.__name__ == 'decorator' 
+
+
+class TestSearchCaching:
+    """Test search result caching and hot-query tracking."""
+
+    def test_search_keys_are_normalized(self):
+        """Test equivalent queries share one cache key."""
+        assert normalize_search_term("  John   DOE ") == "john doe"
+        assert search_cache_key("John  Doe", 20, 0) == search_cache_key(" john doe", 20, 0)
+        assert search_cache_key("john", 20, 0) != search_cache_key("john", 20, 20)
+
+    def test_search_timeout_grows_with_popularity(self, app):
+        """Test popular terms get longer TTLs, capped at the hot-search TTL."""
+        base = search_timeout(1)
+        assert base == app.config.get('CACHE_TIMEOUTS', {}).get('search_results', 120)
+        assert search_timeout(8) == base * 4
+        assert search_timeout(10 ** 9) == hot_search_timeout()
+
+    def test_popularity_tracked_in_sorted_set(self):
+        """Test searches increment a sorted set and top terms come back decoded."""
+        mock_redis = Mock()
+        mock_redis.zincrby.return_value = 3.0
+        mock_redis.zrevrange.return_value = [b'john', b'jane']
+
+        with patch.object(cache_manager, 'redis_client', mock_redis), \
+                patch('app.utils.caching.random.randrange', return_value=1):
+            assert record_search("  JOHN ") == 3.0
+            assert hot_searches(2) == ['john', 'jane']
+
+        mock_redis.zincrby.assert_called_once_with(cache_manager._make_key(SEARCH_HOT_KEY), 1, 'john')
+        mock_redis.zrevrange.assert_called_once_with(cache_manager._make_key(SEARCH_HOT_KEY), 0, 1)
+
+    def test_popularity_set_bounded_inline(self):
+        """Test long terms are cut and sampled searches trim the set in the same pipeline."""
+        mock_redis = Mock()
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.return_value = [1.0, 0]
+        name = cache_manager._make_key(SEARCH_HOT_KEY)
+
+        with patch.object(cache_manager, 'redis_client', mock_redis), \
+                patch('app.utils.caching.random.randrange', return_value=0):
+            assert record_search("x" * 10000) == 1.0
+
+        pipe.zincrby.assert_called_once_with(name, 1, "x" * MAX_SEARCH_TERM_LENGTH)
+        pipe.zremrangebyrank.assert_called_once_with(name, 0, -HOT_SEARCH_TRACKED - 1)
+        mock_redis.zincrby.assert_not_called()
+
+    def test_search_route_serves_cached_page(self, client, query_counter):
+        """Test a cached page is returned without touching the database."""
+        cached_page = {"results": [{"id": 1, "username": "cached"}], "next_offset": None}
+        with patch('app.api.search_routes.counted_get', return_value=cached_page) as mock_get, \
+                patch('app.api.search_routes.record_search', return_value=1):
+            query_counter.clear()
+            response = client.get('/api/search?query=%20Cached%20')
+
+        assert response.get_json() == cached_page
+        mock_get.assert_called_once_with(search_cache_key("cached", 20, 0))
+        assert len(query_counter) == 0
+
+    def test_search_route_caches_misses_with_popularity_ttl(self, client):
+        """Test a miss is computed once and stored with the popularity-aware TTL."""
+        with patch('app.api.search_routes.cache_manager') as mock_cache, \
+                patch('app.api.search_routes.record_search', return_value=8):
+            mock_cache.get.return_value = None
+            response = client.get('/api/search?query=nobody_matches_this&limit=5')
+
+        assert response.status_code == 200
+        key, payload, timeout = mock_cache.set.call_args[0]
+        assert key == search_cache_key("nobody_matches_this", 5, 0)
+        assert payload == {"results": [], "next_offset": None}
+        assert timeout == search_timeout(8)
+
+    def test_rename_invalidates_search_cache(self, client):
+        """Test username changes drop cached search pages and email changes do not."""
+        from app.models import db, User
+
+        user = User(username="cache_rename", email="cache_rename@example.com", full_name="Cache Rename")
+        user.password = "password123"
+        db.session.add(user)
+        db.session.commit()
+        body = {"id": user.id, "username": "cache_rename", "email": "cache_rename@example.com",
+                "full_name": "Cache Rename", "bio": None}
+
+        with patch('app.api.user_routes.invalidate_search_cache') as invalidate:
+            client.put('/api/user', json=dict(body, email="cache_rename2@example.com"))
+            invalidate.assert_not_called()
+            client.put('/api/user', json=dict(body, username="cache_renamed", email="cache_rename2@example.com"))
+            invalidate.assert_called_once()
+
+    def test_signup_and_avatar_reset_invalidate_search_cache(self, client):
+        """Test new users and avatar changes drop cached search pages."""
+        with patch('app.api.auth_routes.invalidate_search_cache') as invalidate:
+            response = client.post('/api/auth/signup', json={
+                "username": "cache_signup", "email": "cache_signup@example.com",
+                "full_name": "Cache Signup", "password": "Password123!", "confirm_password": "Password123!"
+            })
+            assert response.status_code == 201
+            invalidate.assert_called_once()
+
+        user_id = response.get_json()["user"]["id"]
+        with patch('app.api.user_routes.invalidate_search_cache') as invalidate:
+            client.get(f'/api/user/{user_id}/resetImg')
+            invalidate.assert_called_once()
+        # Signup logged the user in; keep the login from leaking into later tests
+        client.post('/api/auth/logout')
+
+    def test_warm_hot_searches_stores_hot_terms(self, app):
+        """Test the most popular terms are recomputed with the hot-search TTL."""
+        from app.models import UserSearch
+
+        with patch('app.utils.caching.hot_searches', return_value=['zzwarm']), \
+                patch('app.utils.caching.cache_manager') as mock_cache:
+            assert warm_hot_searches(UserSearch.results_page, 5, 20) == ['zzwarm']
+
+        mock_cache.set.assert_called_once_with(
+            search_cache_key('zzwarm', 20, 0), {"results": [], "next_offset": None}, hot_search_timeout()
+        )
+
+
+class DictRedis:
+    """Minimal in-memory stand-in for the Redis calls CacheManager makes (no KEYS)."""
+
+    def __init__(self):
+        self.store = {}
+        self.published = []
+        self.mgets = []
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def mget(self, keys):
+        self.mgets.append(list(keys))
+        return [self.store.get(key) for key in keys]
+
+    def setex(self, key, timeout, value):
+        self.store[key] = value
+        return True
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    def eval(self, script, numkeys, key, token):
+        # RELEASE_LOCK_SCRIPT: compare-and-delete
+        if self.store.get(key) == token:
+            return self.delete(key)
+        return 0
+
+    def delete(self, *keys):
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+    def sadd(self, key, *members):
+        self.store.setdefault(key, set()).update(members)
+        return len(members)
+
+    def smembers(self, key):
+        return set(self.store.get(key, set()))
+
+    def srem(self, key, *members):
+        before = len(self.store.get(key, set()))
+        self.store.get(key, set()).difference_update(members)
+        return before - len(self.store.get(key, set()))
+
+    def scard(self, key):
+        return len(self.store.get(key, set()))
+
+    def zadd(self, key, mapping):
+        scores = self.store.setdefault(key, {})
+        added = len(set(mapping) - set(scores))
+        scores.update(mapping)
+        return added
+
+    def _in_range(self, key, low, high):
+        return [m for m, s in self.store.get(key, {}).items() if float(low) <= s <= float(high)]
+
+    def zrangebyscore(self, key, low, high):
+        return self._in_range(key, low, high)
+
+    def zcount(self, key, low, high):
+        return len(self._in_range(key, low, high))
+
+    def zremrangebyscore(self, key, low, high):
+        doomed = self._in_range(key, low, high)
+        for member in doomed:
+            del self.store[key][member]
+        return len(doomed)
+
+    def expire(self, key, timeout):
+        return key in self.store
+
+    def info(self):
+        return {}
+
+    def publish(self, channel, message):
+        self.published.append((channel, json.loads(message)))
+        return 0
+
+    def pipeline(self, transaction=True):
+        return DictPipeline(self)
+
+    def cached_keys(self):
+        return {key[len(cache_manager.key_prefix):] for key, value in self.store.items()
+                if isinstance(value, bytes) and ':lock:' not in key}
+
+
+class DictPipeline:
+    """Queues DictRedis calls until ``execute``."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, name):
+        method = getattr(self.redis, name)
+        return lambda *args, **kwargs: self.calls.append((method, args, kwargs))
+
+    def execute(self):
+        return [method(*args, **kwargs) for method, args, kwargs in self.calls]
+
+
+class TestTagInvalidation:
+    """Test tag sets scope invalidation to the entries embedding an entity."""
+
+    @pytest.fixture
+    def manager(self):
+        manager = CacheManager()
+        manager.redis_client = DictRedis()
+        return manager
+
+    def test_set_registers_namespace_and_entity_tags(self, manager):
+        """Test entries join their namespace tag and the tags passed in."""
+        manager.set('post_scroll:offset:0', ['page'], 60, tags=[post_tag(1), user_tag(2)])
+
+        store = manager.redis_client.store
+        assert store['isntgram:namespaces'] == {'post_scroll'}
+        for tag in (namespace_tag('post_scroll'), 'post:1', 'user:2'):
+            assert set(store[f'isntgram:tags:{tag}']) == {'isntgram:post_scroll:offset:0'}
+
+    def test_invalidate_tags_only_drops_tagged_entries(self, manager):
+        """Test invalidating a post leaves entries that do not show it."""
+        manager.set('post_scroll:offset:0', ['a'], 60, tags=[post_tag(1)])
+        manager.set('post_scroll:offset:3', ['b'], 60, tags=[post_tag(2)])
+
+        assert manager.invalidate_tags(post_tag(1)) == 1
+        assert manager.redis_client.cached_keys() == {'post_scroll:offset:3'}
+        assert 'isntgram:tags:post:1' not in manager.redis_client.store
+
+    def test_clear_all_drops_every_namespace(self, manager):
+        """Test clear_all reaches every entry through the namespace registry."""
+        manager.set('post_scroll:offset:0', ['a'], 60)
+        manager.set('search_results:ann:20:0', {'results': []}, 60)
+
+        assert manager.clear_all() is True
+        assert manager.redis_client.cached_keys() == set()
+        assert manager.get_stats()['our_keys'] == 0
+
+    def test_writes_prune_expired_tag_members(self, manager):
+        """Test a busy namespace tag only holds unexpired entries, however many were written."""
+        with patch('app.utils.caching.time.time', return_value=1000.0):
+            for offset in range(50):
+                manager.set(f'search_results:ann:20:{offset}', {'results': []}, 60)
+        with patch('app.utils.caching.time.time', return_value=1100.0):
+            manager.set('search_results:bob:20:0', {'results': []}, 60)
+            assert manager.get_stats()['namespace_keys'] == {'search_results': 1}
+
+        tag_set = manager.redis_client.store[f'isntgram:tags:{namespace_tag("search_results")}']
+        assert list(tag_set) == ['isntgram:search_results:bob:20:0']
+
+
+class TestLocalTier:
+    """Test the per-worker L1 cache in front of Redis."""
+
+    @pytest.fixture
+    def manager(self):
+        manager = CacheManager()
+        manager.redis_client = DictRedis()
+        manager.local = LocalCache(max_items=10, max_bytes=1024 * 1024, ttl=5)
+        return manager
+
+    def test_hits_are_served_without_redis(self, manager):
+        """Test a warm key is answered from L1 once Redis has been read."""
+        manager.set('post_details:post_id:1', {'id': 1}, 60)
+        manager.redis_client.get = Mock(side_effect=AssertionError("network read"))
+
+        assert manager.get('post_details:post_id:1') == {'id': 1}
+
+    def test_hits_return_fresh_objects(self, manager):
+        """Test callers cannot mutate the L1 copy."""
+        manager.set('post_details:post_id:1', {'id': 1}, 60)
+        manager.get('post_details:post_id:1')['id'] = 2
+
+        assert manager.get('post_details:post_id:1') == {'id': 1}
+
+    def test_deletes_are_broadcast(self, manager):
+        """Test deletes and tag invalidations publish the keys to other workers."""
+        manager.set('post_details:post_id:1', {'id': 1}, 60, tags=[post_tag(1)])
+        manager.delete('user_profile:user_id:9')
+        manager.invalidate_tags(post_tag(1))
+
+        assert manager.redis_client.published == [
+            ('isntgram:invalidate', ['isntgram:user_profile:user_id:9']),
+            ('isntgram:invalidate', ['isntgram:post_details:post_id:1']),
+        ]
+        assert manager.local.get('isntgram:post_details:post_id:1') is None
+
+    def test_invalidation_messages_evict_local_entries(self, manager):
+        """Test a message from another worker drops the local copy."""
+        manager.local.set('isntgram:a', b'1')
+        manager.local.set('isntgram:b', b'2')
+
+        manager._on_invalidation({'data': json.dumps(['isntgram:a'])})
+        assert manager.local.get('isntgram:a') is None
+        assert manager.local.get('isntgram:b') == b'2'
+
+        manager._on_invalidation({'data': json.dumps('*')})
+        assert len(manager.local) == 0
+
+    @patch('app.utils.caching.redis')
+    def test_init_app_enables_l1_when_configured(self, mock_redis):
+        """Test CACHE_L1_MAX_ITEMS turns on L1 and subscribes to invalidations."""
+        client = mock_redis.from_url.return_value
+        app = Mock()
+        app.config = {'CACHE_CONFIG': {'CACHE_L1_MAX_ITEMS': 100, 'CACHE_L1_TIMEOUT': 2}}
+        app.extensions = {}
+
+        manager = CacheManager()
+        manager.init_app(app)
+
+        assert manager.local.max_items == 100
+        assert manager.local.ttl == 2
+        client.pubsub.return_value.subscribe.assert_called_once()
+        client.pubsub.return_value.run_in_thread.assert_called_once()
+
+
+class TestStampedeProtection:
+    """Test single-flight recompute, XFetch early refresh and stale-while-revalidate."""
+
+    @pytest.fixture
+    def cache(self):
+        fake = DictRedis()
+        with patch.object(cache_manager, 'redis_client', fake):
+            yield fake
+
+    @pytest.fixture
+    def calls(self):
+        return []
+
+    @pytest.fixture
+    def page(self, calls):
+        @cached(timeout=60, key_func=lambda n: f"stampede:{n}")
+        def page(n):
+            calls.append(n)
+            return {"page": n, "version": len(calls)}
+        return page
+
+    def store(self, key, value, expires_in, delta=0.01):
+        cache_manager.set(key, CacheEntry(value, time.time() + expires_in, delta), 60, grace=60)
+
+    def test_miss_computes_under_lock_and_releases(self, cache, page, calls):
+        """Test a miss stores a CacheEntry and leaves no lock behind."""
+        assert page(1) == {"page": 1, "version": 1}
+        assert page(1) == {"page": 1, "version": 1}
+
+        assert calls == [1]
+        entry = cache_manager.get("stampede:1")
+        assert isinstance(entry, CacheEntry) and entry.expires_at > time.time()
+        assert not any(':lock:' in key for key in cache.store)
+
+    def test_stale_value_served_while_another_worker_recomputes(self, cache, page, calls):
+        """Test callers that lose the lock get the stale value instead of querying."""
+        self.store("stampede:1", {"page": 1, "version": "stale"}, expires_in=-5)
+        assert cache_manager.acquire_lock("stampede:1", 10)
+
+        assert page(1) == {"page": 1, "version": "stale"}
+        assert calls == []
+
+    def test_stale_value_refreshed_by_lock_winner(self, cache, page, calls):
+        """Test the caller that takes the lock recomputes a stale value."""
+        self.store("stampede:1", {"page": 1, "version": "stale"}, expires_in=-5)
+
+        assert page(1) == {"page": 1, "version": 1}
+        assert cache_manager.get("stampede:1").value == {"page": 1, "version": 1}
+
+    def test_waits_for_lock_holder_when_nothing_to_serve(self, cache, page, calls):
+        """Test a miss during another caller's recompute waits for its result."""
+        cache_manager.acquire_lock("stampede:1", 10)
+
+        def finish_elsewhere(seconds):
+            self.store("stampede:1", {"page": 1, "version": "elsewhere"}, expires_in=60)
+
+        with patch('app.utils.caching.time.sleep', side_effect=finish_elsewhere):
+            assert page(1) == {"page": 1, "version": "elsewhere"}
+        assert calls == []
+
+    def test_gives_up_waiting_and_computes(self, cache, page, calls):
+        """Test a stuck lock holder does not block callers past LOCK_WAIT."""
+        cache_manager.acquire_lock("stampede:1", 10)
+
+        with patch('app.utils.caching.LOCK_WAIT', 0), patch('app.utils.caching.time.sleep'):
+            assert page(1) == {"page": 1, "version": 1}
+
+    def test_xfetch_refreshes_early_with_rising_probability(self, cache, page, calls):
+        """Test a fresh value near expiry is refreshed when the XFetch draw says so."""
+        self.store("stampede:1", {"page": 1, "version": "old"}, expires_in=1, delta=0.5)
+
+        # -0.5 * log(1 - 0.0) == 0: the value is not yet due
+        with patch('app.utils.caching.random.random', return_value=0.0):
+            assert page(1) == {"page": 1, "version": "old"}
+        # -0.5 * log(1 - 0.99) ~= 2.3s > 1s to expiry: refresh now
+        with patch('app.utils.caching.random.random', return_value=0.99):
+            assert page(1) == {"page": 1, "version": 1}
+
+    def test_lock_released_when_compute_fails(self, cache, calls):
+        """Test an exception in the wrapped function does not strand the lock."""
+        @cached(timeout=60, key_func=lambda: "stampede:boom")
+        def boom():
+            raise RuntimeError("db down")
+
+        with pytest.raises(RuntimeError):
+            boom()
+        assert cache_manager.acquire_lock("stampede:boom", 10)
+
+
+class TestCacheMetricsCollection:
+    """Test decorators and CacheManager feed per-cache-type metrics."""
+
+    @pytest.fixture
+    def cache(self):
+        fake = DictRedis()
+        with patch.object(cache_manager, 'redis_client', fake), \
+                patch.object(cache_manager, 'metrics', CacheMetrics()):
+            yield fake
+
+    def test_decorator_records_outcomes_sets_and_latency(self, cache):
+        """Test a miss, a hit, a stale serve and an eviction are counted under the key's namespace."""
+        @cached(timeout=60, key_func=lambda n: f"metered:{n}")
+        def page(n):
+            return {"page": n}
+
+        page(1)
+        page(1)
+        cache_manager.set("metered:2", CacheEntry({"page": 2}, time.time() - 1, 0.01), 60, grace=60)
+        cache_manager.acquire_lock("metered:2", 10)
+        page(2)
+        cache_manager.delete("metered:1")
+
+        row = cache_manager.collect_metrics()["metered"]
+        assert (row["hits"], row["misses"], row["stale"], row["sets"], row["evictions"]) == (1, 1, 1, 2, 1)
+        assert row["bytes"] > 0
+        assert row["hit_rate"] == round(2 / 3, 4)
+        assert row["p99_ms"] >= row["p50_ms"] > 0
+
+    def test_search_lookups_counted(self, client, cache):
+        """Test the search route's direct cache reads feed the same metrics as the decorators."""
+        client.get('/api/search?query=metered')
+        client.get('/api/search?query=metered')
+
+        row = cache_manager.collect_metrics()["search_results"]
+        assert (row["hits"], row["misses"], row["sets"]) == (1, 1, 1)
+        assert row["p99_ms"] >= row["p50_ms"] > 0
+
+    def test_collect_merges_published_workers(self, cache):
+        """Test snapshots published by other workers are merged, and expired ones pruned."""
+        other = CacheMetrics()
+        other.worker_id = "web-2:42"
+        other.incr("post_scroll", "hits", 5)
+        cache.setex(cache_manager._metrics_key(other.worker_id), 60, json.dumps(other.snapshot()))
+        cache.sadd(cache_manager._metrics_workers_key, other.worker_id, "web-3:gone")
+        cache_manager.metrics.incr("post_scroll", "misses")
+
+        row = cache_manager.collect_metrics()["post_scroll"]
+
+        assert (row["hits"], row["misses"]) == (5, 1)
+        assert cache.smembers(cache_manager._metrics_workers_key) == {"web-2:42"}
+
+    def test_publish_writes_snapshot(self, cache):
+        """Test a forced publish stores this worker's snapshot for other processes."""
+        cache_manager.metrics.incr("post_details", "sets")
+        cache_manager.publish_metrics(force=True)
+
+        stored = json.loads(cache.get(cache_manager._metrics_key(cache_manager.metrics.worker_id)))
+        assert stored["post_details"]["sets"] == 1
+        assert cache_manager.metrics.worker_id in cache.smembers(cache_manager._metrics_workers_key)
+
+
+class TestBulkHydration:
+    """Test get_many/set_many and per-entity hydration in one round trip."""
+
+    @pytest.fixture
+    def cache(self):
+        fake = DictRedis()
+        with patch.object(cache_manager, 'redis_client', fake), \
+                patch.object(cache_manager, 'metrics', CacheMetrics()):
+            yield fake
+
+    def test_get_many_single_mget(self, cache):
+        """Test several keys are read with one MGET and absent keys are left out."""
+        cache_manager.set_many({"post_details:post_id:1": {"id": 1}, "user_summary:user_id:7": {"id": 7}}, 60,
+                               tags={"post_details:post_id:1": [post_tag(1)]})
+
+        found = cache_manager.get_many(["post_details:post_id:1", "post_details:post_id:2", "user_summary:user_id:7"])
+
+        assert found == {"post_details:post_id:1": {"id": 1}, "user_summary:user_id:7": {"id": 7}}
+        assert len(cache.mgets) == 1
+        assert cache_manager.invalidate_tags(post_tag(1)) == 1
+        assert cache_manager.get_many(["post_details:post_id:1"]) == {}
+
+    def test_get_many_prefers_local_tier(self, cache):
+        """Test L1 hits are not re-read from Redis."""
+        with patch.object(cache_manager, 'local', LocalCache(100, 1 << 20, 60)):
+            cache_manager.set_many({"user_summary:user_id:1": {"id": 1}}, 60)
+            assert cache_manager.get_many(["user_summary:user_id:1"]) == {"user_summary:user_id:1": {"id": 1}}
+
+        assert cache.mgets == []
+
+    def test_hydrate_loads_only_misses_in_one_call(self, app, cache):
+        """Test a page of two entity types costs one MGET and one bulk load per type with misses."""
+        loads = []
+
+        def load_posts(ids):
+            loads.append(("posts", ids))
+            return {i: {"id": i, "user_id": 7} for i in ids if i != 404}
+
+        def load_users(ids):
+            loads.append(("users", ids))
+            return {i: {"id": i} for i in ids}
+
+        posts = EntityCache('post_details', lambda i: f"post_details:post_id:{i}", load_posts,
+                            lambda post: {post_tag(post["id"])})
+        users = EntityCache('user_summary', user_summary_key, load_users)
+        cache_manager.set("post_details:post_id:1", CacheEntry({"id": 1, "user_id": 7}, time.time() + 60, 0.01), 60)
+
+        with app.test_request_context():
+            found_posts, found_users = hydrate((posts, [1, 2, 3, 404]), (users, [7, 7, 7]))
+            assert loads == [("posts", [2, 3, 404]), ("users", [7])]
+            assert set(found_posts) == {1, 2, 3} and found_users == {7: {"id": 7}}
+            assert len(cache.mgets) == 1
+
+            loads.clear()
+            hydrate((posts, [1, 2, 3]), (users, [7]))
+
+        assert loads == []
+        row = cache_manager.collect_metrics()["post_details"]
+        assert (row["hits"], row["misses"]) == (4, 3)
+        assert cache_manager.invalidate_tags(post_tag(2)) == 1
+
+    def test_hydrate_reloads_stale_entries(self, app, cache):
+        """Test entries past their logical expiry are reloaded rather than served."""
+        loads = []
+        users = EntityCache('user_summary', user_summary_key,
+                            lambda ids: loads.append(ids) or {i: {"id": i, "fresh": True} for i in ids})
+        cache_manager.set(user_summary_key(1), CacheEntry({"id": 1}, time.time() - 1, 0.01), 60, grace=60)
+
+        with app.test_request_context():
+            assert hydrate((users, [1]))[0] == {1: {"id": 1, "fresh": True}}
+
+        assert loads == [[1]]
+
+    def test_hydrate_without_cache_loads_everything(self, app):
+        """Test hydration falls back to the bulk loaders when caching is off."""
+        users = EntityCache('user_summary', user_summary_key, lambda ids: {i: {"id": i} for i in ids})
+        with patch.object(cache_manager, 'redis_client', None), app.test_request_context():
+            assert hydrate((users, [1, 2]))[0] == {1: {"id": 1}, 2: {"id": 2}}
+
+
+class TestReadEndpointCaching:
+    """Test read endpoints cache under structured keys that write routes invalidate."""
+
+    @pytest.fixture
+    def cache(self):
+        fake = DictRedis()
+        with patch.object(cache_manager, 'redis_client', fake):
+            yield fake
+
+    @pytest.fixture
+    def author(self, app):
+        from app.models import db, User
+
+        existing = User.query.filter(User.username == "cache_author").first()
+        if existing:
+            return existing
+        user = User(username="cache_author", email="cache_author@example.com", full_name="Cache Author")
+        user.password = "password123"
+        db.session.add(user)
+        db.session.commit()
+        return user
+
+    def test_get_post_cached_and_invalidated_by_comment(self, client, cache, author, query_counter):
+        """Test get_post is served from post_details:post_id:<id> until a comment lands."""
+        from app.models import db, Post
+
+        post = Post(user_id=author.id, image_url="https://example.com/cached.jpg")
+        db.session.add(post)
+        db.session.commit()
+        post_id = post.id
+
+        assert client.get(f'/api/post/{post_id}').status_code == 200
+        assert f'post_details:post_id:{post_id}' in cache.cached_keys()
+
+        query_counter.clear()
+        cached = json.loads(client.get(f'/api/post/{post_id}').data)["post"]
+        assert len(query_counter) == 0
+        assert cached["viewer_has_liked"] is False
+
+        client.post('/api/comment', json={"user_id": author.id, "post_id": post_id, "content": "fresh"})
+        assert f'post_details:post_id:{post_id}' not in cache.cached_keys()
+        post = json.loads(client.get(f'/api/post/{post_id}').data)["post"]
+        assert [comment["content"] for comment in post["comments"]] == ["fresh"]
+
+    def test_home_feed_hydrated_from_entity_caches(self, client, cache, author, query_counter):
+        """Test a cached feed page reads posts and authors in one MGET and only queries the timeline."""
+        from app.models import db, Post, TimelineEntry, User
+
+        reader = User(username="cache_reader", email="cache_reader@example.com", full_name="Cache Reader")
+        reader.password = "password123"
+        db.session.add(reader)
+        db.session.commit()
+        client.post('/api/follow', json={"user_id": author.id, "user_followed_id": reader.id})
+        for i in range(3):
+            post = Post(user_id=author.id, image_url=f"https://example.com/hydrate{i}.jpg")
+            db.session.add(post)
+            db.session.flush()
+            TimelineEntry.fan_out(post.id)
+        db.session.commit()
+
+        first = json.loads(client.get(f'/api/post/{reader.id}/scroll/0').data)["posts"]
+        assert user_summary_key(author.id) in cache.cached_keys()
+
+        cache.mgets.clear()
+        query_counter.clear()
+        again = json.loads(client.get(f'/api/post/{reader.id}/scroll/0').data)["posts"]
+        assert again == first
+        assert all(post["user"]["username"] == "cache_author" for post in again)
+        assert len(cache.mgets) == 1
+        assert len(query_counter) == 1  # The timeline range scan; anonymous viewers like nothing
+
+        client.get(f'/api/user/{author.id}/resetImg')
+        assert user_summary_key(author.id) not in cache.cached_keys()
+
+    def test_like_refreshes_counts_on_feed_and_profile(self, client, cache, author):
+        """Test a like drops every cached page showing the post's like count."""
+        from app.models import db, Post
+
+        post = Post(user_id=author.id, image_url="https://example.com/liked.jpg")
+        db.session.add(post)
+        db.session.commit()
+        post_id = post.id
+
+        def counts():
+            scroll = json.loads(client.get('/api/post/scroll/0').data)["posts"]
+            profile = json.loads(client.get('/api/profile/cache_author').data)["posts"]
+            return ([p["like_count"] for p in scroll if p["id"] == post_id],
+                    [p["like_count"] for p in profile if p["id"] == post_id])
+
+        assert counts() == ([0], [0])
+        client.post('/api/like', json={"user_id": author.id, "id": post_id, "likeable_type": "post"})
+
+        assert counts() == ([1], [1])
+        assert json.loads(client.get(f'/api/post/{post_id}').data)["post"]["like_count"] == 1
+
+    def test_profile_cached_and_invalidated_by_follow(self, client, cache, author):
+        """Test the profile header is cached per user id and follows refresh it."""
+        from app.models import db, User
+
+        fan = User(username="cache_fan", email="cache_fan@example.com", full_name="Cache Fan")
+        fan.password = "password123"
+        db.session.add(fan)
+        db.session.commit()
+
+        assert json.loads(client.get('/api/profile/cache_author').data)["follower_count"] == 0
+        assert f'user_profile:user_id:{author.id}' in cache.cached_keys()
+
+        client.post('/api/follow', json={"user_id": fan.id, "user_followed_id": author.id})
+        assert f'user_profile:user_id:{author.id}' not in cache.cached_keys()
+        assert json.loads(client.get('/api/profile/cache_author').data)["follower_count"] == 1
+
+    def test_scroll_pages_invalidated_by_new_post(self, authenticated_client, cache):
+        """Test new posts drop every cached scroll page."""
+        authenticated_client.get('/api/post/scroll/0')
+        authenticated_client.get('/api/post/scroll/3')
+        assert {'post_scroll:offset:0', 'post_scroll:offset:3'} <= cache.cached_keys()
+
+        response = authenticated_client.post('/api/post', json={
+            "image_url": "https://example.com/scroll.jpg", "caption": "new"
+        })
+        assert response.status_code == 201
+        assert not any(key.startswith('post_scroll:') for key in cache.cached_keys())
+        page = json.loads(authenticated_client.get('/api/post/scroll/0').data)
+        assert page["posts"][0]["caption"] == "new"
+
+
+    def test_avatar_reset_invalidates_posts_showing_the_user(self, client, cache, author):
+        """Test a profile edit drops cached posts that embed the author."""
+        from app.models import db, Post
+
+        post = Post(user_id=author.id, image_url="https://example.com/avatar.jpg")
+        db.session.add(post)
+        db.session.commit()
+        post_id = post.id
+
+        client.get(f'/api/post/{post_id}')
+        assert f'post_details:post_id:{post_id}' in cache.cached_keys()
+
+        client.get(f'/api/user/{author.id}/resetImg')
+        assert f'post_details:post_id:{post_id}' not in cache.cached_keys()
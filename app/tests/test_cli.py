@@ -14,6 +14,14 @@ from app.cli import (
     test_n1,
     seed,
     health,
+    reconcile_counters,
+    rebuild_timelines,
+    backfill_notifications,
+    score_posts,
+    backfill_tags,
+    warm_search_cache,
+    benchmark_cache_serializers,
+    cache_metrics,
     init_app
 )
 from app import app as flask_app
@@ -262,4 +270,216 @@ class TestCLIErrorHandling:
                 result = self.runner.invoke(database, ['analyze'])
                 
                 assert result.exit_code == 0
-                assert '📈 Database Statistics (SQLite mode)' in result.output 
\ No newline at end of file
+                assert '📈 Database Statistics (SQLite mode)' in result.output 
+
+class TestReconcileCounters:
+    """Test cases for the denormalized counter reconciliation command."""
+
+    def test_reconcile_counters_repairs_drift(self, runner, sample_post, sample_user):
+        """Test drifted counters are recomputed from likes and comments."""
+        from app.models import db, Like, Comment, Post
+
+        db.session.add_all([
+            Like(user_id=sample_user.id, likeable_id=sample_post.id, likeable_type="post"),
+            Comment(user_id=sample_user.id, post_id=sample_post.id, content="drift"),
+        ])
+        db.session.commit()
+
+        result = runner.invoke(args=['database', 'reconcile-counters'])
+
+        assert result.exit_code == 0
+        assert 'posts.like_count' in result.output
+        db.session.expire_all()
+        post = db.session.get(Post, sample_post.id)
+        assert post.like_count == 1
+        assert post.comment_count == 1
+
+    def test_reconcile_counters_dry_run(self, runner, sample_post, sample_user):
+        """Test --dry-run reports drift without writing."""
+        from app.models import db, Like, Post
+
+        db.session.add(Like(user_id=sample_user.id, likeable_id=sample_post.id, likeable_type="Post"))
+        db.session.commit()
+
+        result = runner.invoke(args=['database', 'reconcile-counters', '--dry-run'])
+
+        assert result.exit_code == 0
+        assert 'rows drifted' in result.output
+        db.session.expire_all()
+        assert db.session.get(Post, sample_post.id).like_count == 0
+
+
+class TestReconcileUserCounters:
+    """Test cases for the user counters in the reconciliation command."""
+
+    def test_reconcile_counters_repairs_user_counts(self, runner, sample_post, sample_user):
+        """Test follower, following and post counts are recomputed."""
+        from app.models import db, User, Follow
+
+        fan = User(username="counterfan", email="counterfan@example.com", full_name="Counter Fan")
+        fan.password = "password123"
+        db.session.add(fan)
+        db.session.commit()
+        db.session.add(Follow(user_id=fan.id, user_followed_id=sample_user.id))
+        db.session.commit()
+
+        result = runner.invoke(args=['database', 'reconcile-counters'])
+
+        assert result.exit_code == 0
+        assert 'users.follower_count' in result.output
+        db.session.expire_all()
+        user = db.session.get(User, sample_user.id)
+        assert user.follower_count == Follow.query.filter_by(user_followed_id=sample_user.id).count()
+        assert user.post_count >= 1
+        assert db.session.get(User, fan.id).following_count == 1
+
+
+class TestRebuildTimelines:
+    """Test cases for the home timeline rebuild command."""
+
+    def test_rebuild_timelines_from_follows(self, runner, sample_post, sample_user):
+        """Test timelines are recomputed from follows written outside the routes."""
+        from app.models import db, User, Follow, TimelineEntry
+
+        reader = User(username="rebuildreader", email="rebuildreader@example.com", full_name="Rebuild Reader")
+        reader.password = "password123"
+        db.session.add(reader)
+        db.session.commit()
+        db.session.add(Follow(user_id=sample_user.id, user_followed_id=reader.id))
+        db.session.commit()
+
+        result = runner.invoke(args=['database', 'rebuild-timelines'])
+
+        assert result.exit_code == 0
+        assert 'timeline entries' in result.output
+        entry = TimelineEntry.query.filter_by(user_id=reader.id, post_id=sample_post.id).first()
+        assert entry is not None
+
+
+class TestBackfillNotifications:
+    """Test cases for the notification backfill command."""
+
+    def test_backfill_notifications_is_idempotent(self, runner, sample_post, sample_user):
+        """Test activity written outside the routes is backfilled exactly once."""
+        from app.models import db, User, Comment, Notification
+
+        fan = User(username="backfillfan", email="backfillfan@example.com", full_name="Backfill Fan")
+        fan.password = "password123"
+        db.session.add(fan)
+        db.session.commit()
+        comment = Comment(user_id=fan.id, post_id=sample_post.id, content="backfilled")
+        db.session.add(comment)
+        db.session.commit()
+
+        result = runner.invoke(args=['database', 'backfill-notifications'])
+        runner.invoke(args=['database', 'backfill-notifications'])
+
+        assert result.exit_code == 0
+        assert 'notifications' in result.output
+        notes = Notification.query.filter_by(kind="comment", source_id=comment.id).all()
+        assert len(notes) == 1
+        assert notes[0].recipient_id == sample_user.id
+        assert notes[0].post_id == sample_post.id
+
+
+class TestScorePosts:
+    """Test cases for the explore ranking job."""
+
+    def test_score_posts_ranks_by_decayed_engagement(self, runner, sample_user):
+        """Test engaged posts outrank quiet ones and every post gets a rank."""
+        from app.models import db, Post, PostScore
+
+        quiet = Post(user_id=sample_user.id, image_url="https://example.com/quiet.jpg")
+        popular = Post(user_id=sample_user.id, image_url="https://example.com/popular.jpg",
+                       like_count=40, comment_count=10)
+        db.session.add_all([quiet, popular])
+        db.session.commit()
+
+        result = runner.invoke(args=['database', 'score-posts'])
+
+        assert result.exit_code == 0
+        assert 'Ranked' in result.output
+        assert PostScore.query.count() == Post.query.count()
+        ranks = {score.post_id: score.rank for score in PostScore.query.all()}
+        assert ranks[popular.id] < ranks[quiet.id]
+
+        PostScore.query.delete()
+        db.session.commit()
+
+    def test_backfill_tags_parses_existing_captions(self, runner, sample_user):
+        """Test hashtags are rebuilt from captions written before tagging existed."""
+        from app.models import db, Post, Tag
+
+        post = Post(user_id=sample_user.id, image_url="https://example.com/tagged.jpg",
+                    caption="Golden hour #CliSunset #cli_beach #clisunset")
+        db.session.add(post)
+        db.session.commit()
+
+        result = runner.invoke(args=['database', 'backfill-tags', '--batch-size', '1'])
+
+        assert result.exit_code == 0
+        assert 'Wrote' in result.output
+        assert [p.id for p in Tag.posts_query('#clisunset').all()] == [post.id]
+        assert [p.id for p in Tag.posts_query('cli_beach').all()] == [post.id]
+        assert Tag.query.filter(Tag.taggable_id == post.id).count() == 2
+
+    def test_warm_search_cache_without_cache(self, runner):
+        """Test warming is skipped cleanly when no cache backend is available."""
+        with patch('app.cli.cache_manager') as mock_cache:
+            mock_cache.redis_client = None
+            result = runner.invoke(args=['database', 'warm-search-cache'])
+
+        assert result.exit_code == 0
+        assert 'Cache unavailable' in result.output
+
+    def test_warm_search_cache_reports_terms(self, runner):
+        """Test warmed terms are listed and the popularity set is trimmed."""
+        from app.models import UserSearch
+
+        with patch('app.cli.cache_manager') as mock_cache, \
+                patch('app.cli.warm_hot_searches', return_value=['john', 'jane']) as warm:
+            mock_cache.trim_scores.return_value = 0
+            result = runner.invoke(args=['database', 'warm-search-cache', '--top', '2'])
+
+        assert result.exit_code == 0
+        warm.assert_called_once_with(UserSearch.results_page, 2, 20)
+        assert 'Warmed 2 search terms' in result.output
+        assert 'john' in result.output
+
+    def test_benchmark_cache_serializers_samples_feed_responses(self, runner, sample_user):
+        """Test the benchmark encodes real scroll and post responses with every codec."""
+        from app.models import db, Post
+
+        db.session.add(Post(user_id=sample_user.id, image_url="https://example.com/bench.jpg", caption="bench"))
+        db.session.commit()
+
+        result = runner.invoke(args=['database', 'benchmark-cache-serializers', '--pages', '2', '--rounds', '1'])
+
+        assert result.exit_code == 0
+        assert 'responses, 1 rounds' in result.output
+        for codec in ('json', 'json+zlib', 'pickle'):
+            assert f'\n{codec} ' in result.output
+
+    def test_cache_metrics_prints_table(self, runner):
+        """Test per-cache-type metrics are listed with hit rate and latency."""
+        with patch('app.cli.cache_manager') as mock_cache:
+            mock_cache.get_stats.return_value = {'status': 'active', 'backend': 'redis', 'our_keys': 12}
+            mock_cache.collect_metrics.return_value = {'post_scroll': {
+                'hits': 90, 'misses': 10, 'stale': 0, 'refreshes': 2, 'sets': 12, 'evictions': 3,
+                'bytes': 4096, 'hit_rate': 0.9, 'p50_ms': 0.4, 'p99_ms': 2.5,
+            }}
+            result = runner.invoke(args=['database', 'cache-metrics'])
+
+        assert result.exit_code == 0
+        assert 'Backend: redis' in result.output
+        assert 'post_scroll' in result.output and '90.0%' in result.output
+
+    def test_cache_metrics_without_activity(self, runner):
+        """Test an idle or unavailable cache is reported plainly."""
+        with patch('app.cli.cache_manager') as mock_cache:
+            mock_cache.get_stats.return_value = {'status': 'unavailable'}
+            mock_cache.collect_metrics.return_value = {}
+            result = runner.invoke(args=['database', 'cache-metrics'])
+
+        assert result.exit_code == 0
+        assert 'No cache activity recorded yet' in result.output
@@ -4,7 +4,7 @@ Tests comment functionality
 """
 import pytest
 import json
-from app.models import Comment, db
+from app.models import Comment, Post, db
 
 
 class TestCommentRoutes:
@@ -73,6 +73,22 @@ class TestCommentRoutes:
         assert comment.user_id == sample_user.id
         assert comment.post_id == sample_post.id
 
+    def test_post_comment_increments_post_counter(self, authenticated_client, sample_user, sample_post):
+        """Test commenting bumps the post's denormalized comment_count."""
+        comment_data = {
+            "user_id": sample_user.id,
+            "post_id": sample_post.id,
+            "content": "Counter test comment"
+        }
+
+        response = authenticated_client.post('/api/comment',
+                                           data=json.dumps(comment_data),
+                                           content_type='application/json')
+        assert response.status_code == 200
+
+        db.session.expire_all()
+        assert db.session.get(Post, sample_post.id).comment_count == 1
+
     def test_post_comment_missing_fields(self, authenticated_client, sample_user, sample_post):
         """Test POST /api/comment with missing required fields."""
         # Missing user_id
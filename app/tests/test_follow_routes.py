@@ -232,3 +232,59 @@ class TestFollowRoutes:
         data = json.loads(response.data)
         assert "error" in data
         assert "Doesn't follow!" in data["error"]
+
+    def test_followers_paged_with_user_summaries(self, authenticated_client, query_counter):
+        """Test followers come back a page at a time with public user data from one query."""
+        star = User(username="pagedstar", email="pagedstar@example.com", full_name="Paged Star")
+        star.password = "password123"
+        db.session.add(star)
+        db.session.commit()
+        for i in range(5):
+            fan = User(username=f"pagedfan{i}", email=f"pagedfan{i}@example.com", full_name=f"Paged Fan {i}")
+            fan.password = "password123"
+            db.session.add(fan)
+            db.session.flush()
+            db.session.add(Follow(user_id=fan.id, user_followed_id=star.id))
+        db.session.commit()
+
+        seen, cursor = [], None
+        while True:
+            url = f'/api/follow/{star.id}?limit=2' + (f'&cursor={cursor}' if cursor else '')
+            query_counter.clear()
+            response = authenticated_client.get(url)
+            assert response.status_code == 200
+            data = json.loads(response.data)
+            assert len(data["follows"]) <= 2
+            # Session user load plus one joined page query
+            assert len(query_counter) <= 2
+            seen.extend(data["follows"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        assert len(seen) == 5
+        assert len({follow["id"] for follow in seen}) == 5
+        for follow in seen:
+            assert follow["user"]["id"] == follow["user_id"]
+            assert set(follow["user"]) == {"id", "username", "full_name", "profile_image_url"}
+
+    def test_following_paged_with_user_summaries(self, authenticated_client):
+        """Test the following list embeds the followed users."""
+        fan = User(username="pagedfollower", email="pagedfollower@example.com", full_name="Paged Follower")
+        fan.password = "password123"
+        idol = User(username="pagedidol", email="pagedidol@example.com", full_name="Paged Idol")
+        idol.password = "password123"
+        db.session.add_all([fan, idol])
+        db.session.commit()
+        db.session.add(Follow(user_id=fan.id, user_followed_id=idol.id))
+        db.session.commit()
+
+        data = json.loads(authenticated_client.get(f'/api/follow/{fan.id}/following').data)
+
+        assert [follow["user"]["username"] for follow in data["follows"]] == ["pagedidol"]
+        assert data["next_cursor"] is None
+
+    def test_follows_invalid_cursor(self, authenticated_client, sample_user):
+        """Test a malformed cursor is rejected with 400."""
+        response = authenticated_client.get(f'/api/follow/{sample_user.id}?cursor=bad')
+        assert response.status_code == 400
@@ -4,7 +4,7 @@ Tests like functionality
 """
 import pytest
 import json
-from app.models import Like, db
+from app.models import Like, Post, Comment, db
 
 
 class TestLikeRoutes:
@@ -179,3 +179,56 @@ class TestLikeRoutes:
         
         # Should handle duplicate gracefully
         assert response.status_code in [200, 400, 409]
+
+    def test_post_like_increments_post_counter(self, authenticated_client, sample_user, sample_post):
+        """Test liking a post bumps its denormalized like_count."""
+        like_data = {
+            "user_id": sample_user.id,
+            "id": sample_post.id,
+            "likeable_type": "post"
+        }
+
+        response = authenticated_client.post('/api/like',
+                                           data=json.dumps(like_data),
+                                           content_type='application/json')
+        assert response.status_code == 200
+
+        db.session.expire_all()
+        assert db.session.get(Post, sample_post.id).like_count == 1
+
+    def test_delete_like_decrements_post_counter(self, authenticated_client, sample_user, sample_post):
+        """Test unliking a post lowers its denormalized like_count."""
+        like_data = {
+            "user_id": sample_user.id,
+            "id": sample_post.id,
+            "likeable_type": "post"
+        }
+        response = authenticated_client.post('/api/like',
+                                           data=json.dumps(like_data),
+                                           content_type='application/json')
+        like_id = json.loads(response.data)["like"]["id"]
+
+        response = authenticated_client.delete('/api/like',
+                                             data=json.dumps({"id": like_id}),
+                                             content_type='application/json')
+        assert response.status_code == 200
+
+        db.session.expire_all()
+        assert db.session.get(Post, sample_post.id).like_count == 0
+
+    def test_like_comment_increments_comment_counter(self, authenticated_client, sample_user, sample_comment):
+        """Test liking a comment bumps the comment's like_count, not the post's."""
+        like_data = {
+            "user_id": sample_user.id,
+            "id": sample_comment.id,
+            "likeable_type": "comment"
+        }
+
+        response = authenticated_client.post('/api/like',
+                                           data=json.dumps(like_data),
+                                           content_type='application/json')
+        assert response.status_code == 200
+
+        db.session.expire_all()
+        assert db.session.get(Comment, sample_comment.id).like_count == 1
+        assert db.session.get(Post, sample_comment.post_id).like_count == 0
@@ -0,0 +1,60 @@
+"""
+Tests for the bounded in-process LRU used as the L1 cache tier.
+"""
+from unittest.mock import patch
+
+from app.utils.local_cache import LocalCache
+
+
+class TestLocalCache:
+    """Test LRU eviction, byte budget and TTL."""
+
+    def test_evicts_least_recently_used_item(self):
+        """Test the oldest untouched entry goes first when over max_items."""
+        cache = LocalCache(max_items=2, max_bytes=1024, ttl=60)
+        cache.set("a", b"1")
+        cache.set("b", b"2")
+        cache.get("a")
+        cache.set("c", b"3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1"
+        assert cache.get("c") == b"3"
+
+    def test_byte_budget_bounds_total_size(self):
+        """Test entries are evicted to stay within max_bytes, and oversized values are skipped."""
+        cache = LocalCache(max_items=10, max_bytes=10, ttl=60)
+        cache.set("a", b"12345")
+        cache.set("b", b"12345")
+        cache.set("c", b"123")
+
+        assert cache.get("a") is None
+        assert cache.size_bytes == 8
+
+        cache.set("huge", b"x" * 11)
+        assert cache.get("huge") is None
+        assert cache.size_bytes == 8
+
+    def test_entries_expire_after_shorter_of_timeout_and_ttl(self):
+        """Test expiry uses min(timeout, ttl)."""
+        cache = LocalCache(max_items=10, max_bytes=1024, ttl=5)
+        with patch("app.utils.local_cache.time.monotonic", return_value=100.0):
+            cache.set("short", b"1", timeout=1)
+            cache.set("long", b"2", timeout=600)
+        with patch("app.utils.local_cache.time.monotonic", return_value=102.0):
+            assert cache.get("short") is None
+            assert cache.get("long") == b"2"
+        with patch("app.utils.local_cache.time.monotonic", return_value=106.0):
+            assert cache.get("long") is None
+        assert len(cache) == 0
+
+    def test_delete_and_clear(self):
+        """Test explicit removal keeps the byte count in step."""
+        cache = LocalCache(max_items=10, max_bytes=1024, ttl=60)
+        cache.set("a", b"12")
+        cache.set("b", b"34")
+        cache.delete("a", "missing")
+
+        assert cache.size_bytes == 2
+        cache.clear()
+        assert len(cache) == 0 and cache.size_bytes == 0
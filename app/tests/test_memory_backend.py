@@ -0,0 +1,155 @@
+"""
+Tests for the in-process cache backend used when Redis is unavailable.
+"""
+from unittest.mock import patch
+
+import pytest
+
+from app.utils.caching import CacheManager, cached, namespace_tag, post_tag
+from app.utils.memory_backend import MemoryBackend
+
+
+def at(seconds):
+    return patch("app.utils.memory_backend.time.monotonic", return_value=seconds)
+
+
+class TestMemoryBackend:
+    """Test the Redis command subset against Redis semantics."""
+
+    def test_strings_expire(self):
+        """Test SETEX values disappear after their TTL."""
+        backend = MemoryBackend()
+        with at(100.0):
+            backend.setex("k", 10, b"v")
+            assert backend.get("k") == b"v"
+        with at(111.0):
+            assert backend.get("k") is None
+            assert backend.delete("k") == 0
+
+    def test_set_nx(self):
+        """Test SET NX only writes absent keys."""
+        backend = MemoryBackend()
+
+        assert backend.set("lock", "a", nx=True, ex=5) is True
+        assert backend.set("lock", "b", nx=True, ex=5) is None
+        assert backend.get("lock") == b"a"
+
+    def test_mget(self):
+        """Test MGET returns values in key order with None for misses."""
+        backend = MemoryBackend()
+        backend.set("a", "1")
+        backend.set("c", "3")
+
+        assert backend.mget(["a", "b", "c"]) == [b"1", None, b"3"]
+
+    def test_sets_keep_ttl_and_return_bytes(self):
+        """Test SADD keeps an existing EXPIRE and members come back as bytes."""
+        backend = MemoryBackend()
+        with at(100.0):
+            backend.sadd("tag", "x", "y")
+            backend.expire("tag", 10)
+            assert backend.sadd("tag", "y", "z") == 1
+            assert backend.smembers("tag") == {b"x", b"y", b"z"}
+        with at(111.0):
+            assert backend.scard("tag") == 0
+
+    def test_sorted_sets(self):
+        """Test ZINCRBY, ZREVRANGE and ZREMRANGEBYRANK follow Redis ranks."""
+        backend = MemoryBackend()
+        for member, score in (("a", 1), ("b", 3), ("c", 2)):
+            backend.zincrby("hot", score, member)
+
+        assert backend.zrevrange("hot", 0, 1) == [b"b", b"c"]
+        assert backend.zrevrange("hot", 0, -1) == [b"b", b"c", b"a"]
+        # Keep the top 2, as trim_scores does
+        assert backend.zremrangebyrank("hot", 0, -3) == 1
+        assert backend.zrevrange("hot", 0, -1) == [b"b", b"c"]
+        assert backend.zremrangebyrank("hot", 0, -10) == 0
+
+    def test_sorted_sets_by_score(self):
+        """Test ZADD, ZRANGEBYSCORE, ZCOUNT and ZREMRANGEBYSCORE, as tag sets use them."""
+        backend = MemoryBackend()
+        assert backend.zadd("tag", {"a": 10, "b": 20}) == 2
+        assert backend.zadd("tag", {"b": 30, "c": 40}) == 1
+
+        assert backend.zrangebyscore("tag", 15, "+inf") == [b"b", b"c"]
+        assert backend.zcount("tag", "-inf", 30) == 2
+        assert backend.zremrangebyscore("tag", "-inf", 30) == 2
+        assert backend.zrangebyscore("tag", "-inf", "+inf") == [b"c"]
+
+    def test_sorted_sets_reorder_on_rescore(self):
+        """Test a re-scored member moves to its new rank and ties order by member."""
+        backend = MemoryBackend()
+        backend.zadd("tag", {"b": 5, "a": 5, "c": 1})
+        assert backend.zrangebyscore("tag", "-inf", "+inf") == [b"c", b"a", b"b"]
+
+        assert backend.zadd("tag", {"c": 9}) == 0
+        assert backend.zincrby("tag", 10, "a") == 15
+        assert backend.zrangebyscore("tag", "-inf", "+inf") == [b"b", b"c", b"a"]
+        assert backend.zrevrange("tag", -2, -1) == [b"c", b"b"]
+        assert backend.zcount("tag", 5, 9) == 2
+        assert backend.zcount("missing", "-inf", "+inf") == 0
+
+    def test_pipeline_returns_results_in_order(self):
+        """Test queued calls run on execute."""
+        backend = MemoryBackend()
+        pipe = backend.pipeline(transaction=False)
+        pipe.setex("k", 10, b"v")
+        pipe.sadd("tag", "k")
+        pipe.smembers("tag")
+
+        assert backend.get("k") is None
+        assert pipe.execute() == [True, 1, {b"k"}]
+
+
+class TestCacheManagerOnMemory:
+    """Test CacheManager features end to end on the memory backend."""
+
+    @pytest.fixture
+    def manager(self):
+        manager = CacheManager()
+        manager.redis_client = MemoryBackend()
+        return manager
+
+    def test_get_set_and_ttl(self, manager):
+        """Test values round trip and expire."""
+        with at(100.0):
+            manager.set("post_details:post_id:1", {"id": 1}, 30)
+            assert manager.get("post_details:post_id:1") == {"id": 1}
+        with at(131.0):
+            assert manager.get("post_details:post_id:1", "miss") == "miss"
+
+    def test_tag_invalidation_and_stats(self, manager):
+        """Test tags, clear_all and stats work without Redis."""
+        manager.set("post_scroll:offset:0", [1], 60, tags=[post_tag(1)])
+        manager.set("post_scroll:offset:3", [2], 60, tags=[post_tag(2)])
+        manager.set("post_details:post_id:1", {"id": 1}, 60, tags=[post_tag(1)])
+
+        stats = manager.get_stats()
+        assert stats["backend"] == "memory"
+        assert stats["namespace_keys"] == {"post_details": 1, "post_scroll": 2}
+
+        assert manager.invalidate_tags(post_tag(1)) == 2
+        assert manager.get("post_scroll:offset:3") == [2]
+        assert manager.invalidate_tags(namespace_tag("post_scroll")) == 1
+        assert manager.clear_all() is True
+        assert manager.get_stats()["our_keys"] == 0
+
+    def test_locks_and_decorators(self, manager):
+        """Test single-flight locks and the cached decorator run on the memory backend."""
+        calls = []
+
+        @cached(timeout=60, key_func=lambda: "func:answer")
+        def answer():
+            calls.append(1)
+            return 42
+
+        with patch("app.utils.caching.cache_manager", manager):
+            assert answer() == 42
+            assert answer() == 42
+        assert calls == [1]
+
+        token = manager.acquire_lock("func:answer", 10)
+        assert manager.acquire_lock("func:answer", 10) is None
+        assert manager.release_lock("func:answer", "not-mine") is False
+        assert manager.release_lock("func:answer", token) is True
@@ -599,4 +599,64 @@ class TestFollowModel:
             
             # Test relationships - Follow model has user relationship, not user_followed
             assert follow.user == user1
-            # Follow model doesn't have user_followed relationship 
\ No newline at end of file
+            # Follow model doesn't have user_followed relationship 
+
+    def test_follow_lists_join_users_once(self, client):
+        """Test the follower and following queries join users exactly once per row."""
+        with client.application.app_context():
+            for query in (Follow.followers_with_users(1), Follow.following_with_users(1)):
+                sql = str(query.statement.compile(db.engine)).upper()
+                assert sql.count("JOIN USERS") == 1
+                assert "USERS_1" not in sql
+
+class TestPostScoreModel:
+    """Test PostScore ranking functionality."""
+
+    def test_engagement_score_decays_with_age(self):
+        """Test equal engagement scores lower on an older post."""
+        from datetime import datetime, timedelta, timezone
+        from app.models import PostScore
+
+        now = datetime(2026, 1, 2, tzinfo=timezone.utc)
+        fresh = PostScore.engagement_score(10, 2, now - timedelta(hours=1), now)
+        stale = PostScore.engagement_score(10, 2, now - timedelta(days=3), now)
+
+        assert fresh > stale > 0
+
+    def test_engagement_score_weights_comments(self):
+        """Test a comment counts for more than a like."""
+        from datetime import datetime
+        from app.models import PostScore
+
+        now = datetime(2026, 1, 2)
+        created = datetime(2026, 1, 1)
+
+        assert PostScore.engagement_score(0, 1, created, now) > PostScore.engagement_score(1, 0, created, now)
+
+    def test_recompute_matches_engagement_score(self, client, sample_user):
+        """Test the SQL ranking scores posts as engagement_score does, with dense ranks."""
+        from datetime import datetime, timedelta, timezone
+        from app.models import PostScore
+
+        now = datetime(2026, 1, 2, tzinfo=timezone.utc)
+        specs = [(0, 0, 30), (40, 10, 2), (5, 1, 1), (5, 1, 1)]
+        with client.application.app_context():
+            posts = [Post(user_id=sample_user.id, image_url=f"https://example.com/rank{i}.jpg",
+                          like_count=likes, comment_count=comments, created_at=now - timedelta(hours=hours))
+                     for i, (likes, comments, hours) in enumerate(specs)]
+            db.session.add_all(posts)
+            db.session.commit()
+
+            ranked = PostScore.recompute(now=now)
+            scores = {score.post_id: score for score in PostScore.query.all()}
+
+            assert ranked == Post.query.count()
+            assert sorted(score.rank for score in scores.values()) == list(range(1, ranked + 1))
+            for post, (likes, comments, hours) in zip(posts, specs):
+                expected = PostScore.engagement_score(likes, comments, now - timedelta(hours=hours), now)
+                assert scores[post.id].score == pytest.approx(expected)
+            # Ties go to the newer post
+            assert scores[posts[3].id].rank < scores[posts[2].id].rank < scores[posts[0].id].rank
+
+            PostScore.query.delete()
+            db.session.commit()
@@ -4,7 +4,8 @@ Tests note functionality
 """
 import pytest
 import json
-from app.models import User, Post, Comment, Like, Follow, db
+from unittest.mock import patch
+from app.models import User, Post, Comment, Like, Follow, Notification, db
 
 
 class TestNoteRoutes:
@@ -33,12 +34,10 @@ class TestNoteRoutes:
         db.session.commit()
         
         # Create follow relationship
-        follow = Follow(
-            user_id=user2.id,
-            user_followed_id=sample_user.id
-        )
-        db.session.add(follow)
-        db.session.commit()
+        authenticated_client.post('/api/follow', json={
+            "user_id": user2.id,
+            "user_followed_id": sample_user.id
+        })
         
         response = authenticated_client.get(f'/api/note/{sample_user.id}/scroll/0')
         assert response.status_code == 200
@@ -76,13 +75,11 @@ class TestNoteRoutes:
         db.session.commit()
         
         # Create like on comment
-        like = Like(
-            user_id=user2.id,
-            likeable_id=comment.id,
-            likeable_type="comment"
-        )
-        db.session.add(like)
-        db.session.commit()
+        authenticated_client.post('/api/like', json={
+            "user_id": user2.id,
+            "id": comment.id,
+            "likeable_type": "comment"
+        })
         
         response = authenticated_client.get(f'/api/note/{sample_user.id}/scroll/0')
         assert response.status_code == 200
@@ -91,12 +88,11 @@ class TestNoteRoutes:
         assert "notes" in data
         assert len(data["notes"]) > 0
         
-        # Check like note format - note that the route has a bug where it shows
-        # comment type instead of like type for comment likes
+        # Check like note format
         like_note = data["notes"][0]
         assert "type" in like_note
-        # The route has a bug where comment likes show as "comment" type
-        assert like_note["type"] in ["like", "comment"]  # Accept both due to route bug
+        assert like_note["type"] == "like"
+        assert like_note["post"]["id"] == sample_post.id
         assert "user" in like_note
         assert "post" in like_note
         assert "created_at" in like_note
@@ -114,13 +110,11 @@ class TestNoteRoutes:
         db.session.commit()
         
         # Create comment on sample_user's post
-        comment = Comment(
-            user_id=user2.id,
-            post_id=sample_post.id,
-            content="Test comment on your post"
-        )
-        db.session.add(comment)
-        db.session.commit()
+        authenticated_client.post('/api/comment', json={
+            "user_id": user2.id,
+            "post_id": sample_post.id,
+            "content": "Test comment on your post"
+        })
         
         response = authenticated_client.get(f'/api/note/{sample_user.id}/scroll/0')
         assert response.status_code == 200
@@ -160,13 +154,10 @@ class TestNoteRoutes:
             db.session.add(new_user)
             db.session.commit()
             
-            follow = Follow(
-                user_id=new_user.id,
-                user_followed_id=sample_user.id
-            )
-            db.session.add(follow)
-        
-        db.session.commit()
+            authenticated_client.post('/api/follow', json={
+                "user_id": new_user.id,
+                "user_followed_id": sample_user.id
+            })
         
         # Test first page
         response = authenticated_client.get(f'/api/note/{sample_user.id}/scroll/0')
@@ -197,30 +188,25 @@ class TestNoteRoutes:
         db.session.commit()
         
         # Create follow
-        follow = Follow(
-            user_id=user2.id,
-            user_followed_id=sample_user.id
-        )
-        db.session.add(follow)
+        authenticated_client.post('/api/follow', json={
+            "user_id": user2.id,
+            "user_followed_id": sample_user.id
+        })
         
         # Create comment
-        comment = Comment(
-            user_id=user2.id,
-            post_id=sample_post.id,
-            content="Mixed activity comment"
-        )
-        db.session.add(comment)
-        
-        db.session.commit()
+        response = authenticated_client.post('/api/comment', json={
+            "user_id": user2.id,
+            "post_id": sample_post.id,
+            "content": "Mixed activity comment"
+        })
+        comment_id = json.loads(response.data)["comment"]["id"]
         
-        # Create like on comment
-        like = Like(
-            user_id=user2.id,
-            likeable_id=comment.id,
-            likeable_type="comment"
-        )
-        db.session.add(like)
-        db.session.commit()
+        # Create like on comment (owned by user2, so not a note for sample_user)
+        authenticated_client.post('/api/like', json={
+            "user_id": user2.id,
+            "id": comment_id,
+            "likeable_type": "comment"
+        })
         
         response = authenticated_client.get(f'/api/note/{sample_user.id}/scroll/0')
         assert response.status_code == 200
@@ -247,4 +233,146 @@ class TestNoteRoutes:
         # This test expects the route to handle invalid int conversion gracefully
         # but the current implementation doesn't, so we'll skip this test
         # until the route is improved with proper error handling
-        pytest.skip("Route needs error handling improvements") 
\ No newline at end of file
+        pytest.skip("Route needs error handling improvements")
+
+    def test_get_notes_cursor_pages_merged_activity(self, authenticated_client, sample_user, sample_post):
+        """Test GET /api/note/<id>/scroll pages follows, likes and comments by cursor."""
+        actors = []
+        for i in range(3):
+            actor = User(
+                username=f"cursor_actor_{i}",
+                email=f"cursor_actor_{i}@example.com",
+                full_name=f"Cursor Actor {i}"
+            )
+            actor.password = "password123"
+            db.session.add(actor)
+            actors.append(actor)
+        db.session.commit()
+
+        for actor in actors:
+            authenticated_client.post('/api/follow', json={"user_id": actor.id, "user_followed_id": sample_user.id})
+            authenticated_client.post('/api/like', json={"user_id": actor.id, "id": sample_post.id, "likeable_type": "post"})
+            authenticated_client.post('/api/comment', json={"user_id": actor.id, "post_id": sample_post.id, "content": "cursor note"})
+
+        seen, cursor = [], None
+        while True:
+            url = f'/api/note/{sample_user.id}/scroll?limit=4' + (f'&cursor={cursor}' if cursor else '')
+            response = authenticated_client.get(url)
+            assert response.status_code == 200
+            data = json.loads(response.data)
+            assert len(data["notes"]) <= 4
+            seen.extend((note["type"], note["id"]) for note in data["notes"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        assert len(seen) == len(set(seen))
+        actor_ids = {actor.id for actor in actors}
+        assert {("follow", f.id) for f in Follow.query.filter(Follow.user_id.in_(actor_ids))} <= set(seen)
+        assert {("like", l.id) for l in Like.query.filter(Like.user_id.in_(actor_ids))} <= set(seen)
+        assert {("comment", c.id) for c in Comment.query.filter(Comment.user_id.in_(actor_ids))} <= set(seen)
+
+    def test_get_notes_cursor_invalid(self, authenticated_client, sample_user):
+        """Test a malformed notes cursor is rejected with 400."""
+        response = authenticated_client.get(f'/api/note/{sample_user.id}/scroll?cursor=bad')
+        assert response.status_code == 400
+
+    def test_get_notes_fixed_query_count(self, authenticated_client, sample_user, sample_post, query_counter):
+        """Test a notes page costs the same statements however much history exists."""
+        def add_activity(prefix, count):
+            for i in range(count):
+                actor = User(
+                    username=f"{prefix}_{i}",
+                    email=f"{prefix}_{i}@example.com",
+                    full_name=f"History Actor {i}"
+                )
+                actor.password = "password123"
+                db.session.add(actor)
+                db.session.commit()
+                authenticated_client.post('/api/follow', json={"user_id": actor.id, "user_followed_id": sample_user.id})
+                authenticated_client.post('/api/like', json={"user_id": actor.id, "id": sample_post.id, "likeable_type": "post"})
+                authenticated_client.post('/api/comment', json={"user_id": actor.id, "post_id": sample_post.id, "content": "history"})
+
+        def page_queries():
+            query_counter.clear()
+            response = authenticated_client.get(f'/api/note/{sample_user.id}/scroll/0')
+            assert response.status_code == 200
+            return len(query_counter), json.loads(response.data)["notes"]
+
+        add_activity("history_small", 7)
+        small_queries, _ = page_queries()
+        add_activity("history_large", 20)
+        queries, notes = page_queries()
+
+        # Session user load, one range scan, one IN query per kind and one post lookup
+        assert queries == small_queries
+        assert queries <= 6
+        assert len(notes) == 20
+        created = [note["created_at"] for note in notes]
+        assert created == sorted(created, reverse=True)
+
+    def test_unread_count_and_mark_read(self, authenticated_client, sample_user):
+        """Test unread counts track new activity and reset when marked read."""
+        authenticated_client.post(f'/api/note/{sample_user.id}/read')
+        fan = User(
+            username="unread_fan",
+            email="unread_fan@example.com",
+            full_name="Unread Fan"
+        )
+        fan.password = "password123"
+        db.session.add(fan)
+        db.session.commit()
+
+        authenticated_client.post('/api/follow', json={"user_id": fan.id, "user_followed_id": sample_user.id})
+        data = json.loads(authenticated_client.get(f'/api/note/{sample_user.id}/unread').data)
+        assert data["unread_count"] == 1
+
+        response = authenticated_client.post(f'/api/note/{sample_user.id}/read')
+        assert json.loads(response.data)["marked_read"] == 1
+        data = json.loads(authenticated_client.get(f'/api/note/{sample_user.id}/unread').data)
+        assert data["unread_count"] == 0
+
+    def test_unread_and_mark_read_require_owner(self, authenticated_client):
+        """Test only the signed-in recipient can read or clear their notification state."""
+        other = User(
+            username="nosy_reader",
+            email="nosy_reader@example.com",
+            full_name="Nosy Reader"
+        )
+        other.password = "password123"
+        db.session.add(other)
+        db.session.commit()
+
+        assert authenticated_client.get(f'/api/note/{other.id}/unread').status_code == 403
+        assert authenticated_client.post(f'/api/note/{other.id}/read').status_code == 403
+
+    def test_unread_and_mark_read_require_login(self, app, client, sample_user):
+        """Test anonymous callers cannot read or clear anyone's notification state."""
+        # Without a login view Flask-Login answers 401 instead of redirecting
+        with patch.object(app.login_manager, 'login_view', None):
+            assert client.get(f'/api/note/{sample_user.id}/unread').status_code == 401
+            assert client.post(f'/api/note/{sample_user.id}/read').status_code == 401
+
+    def test_undone_activity_removes_note(self, authenticated_client, sample_user, sample_post):
+        """Test unfollowing and unliking drop the matching notifications."""
+        fan = User(
+            username="fickle_fan",
+            email="fickle_fan@example.com",
+            full_name="Fickle Fan"
+        )
+        fan.password = "password123"
+        db.session.add(fan)
+        db.session.commit()
+        follow = {"user_id": fan.id, "user_followed_id": sample_user.id}
+
+        authenticated_client.post('/api/follow', json=follow)
+        response = authenticated_client.post('/api/like', json={
+            "user_id": fan.id, "id": sample_post.id, "likeable_type": "post"
+        })
+        like_id = json.loads(response.data)["like"]["id"]
+        assert Notification.query.filter_by(actor_id=fan.id).count() == 2
+
+        authenticated_client.delete('/api/follow', json=follow)
+        authenticated_client.delete('/api/like', json={"id": like_id})
+
+        assert Notification.query.filter_by(actor_id=fan.id).count() == 0
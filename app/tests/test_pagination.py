@@ -0,0 +1,87 @@
+"""
+Test suite for keyset pagination utilities
+Tests cursor encoding and range-scan paging over (created_at, id)
+"""
+import pytest
+from datetime import datetime
+from app.models import db, User, Post
+from app.utils.pagination import (
+    InvalidCursorError,
+    encode_cursor,
+    decode_cursor,
+    keyset_page,
+)
+
+
+class TestCursorEncoding:
+    """Test cursor encode/decode round trips."""
+
+    def test_round_trip(self):
+        """Test a cursor decodes to the values it was built from."""
+        created_at = datetime(2024, 5, 1, 12, 30, 45, 123456)
+        cursor = encode_cursor(created_at, 42)
+
+        assert decode_cursor(cursor) == (created_at, 42)
+
+    def test_cursor_is_url_safe(self):
+        """Test cursors need no escaping in a query string."""
+        cursor = encode_cursor(datetime(2024, 5, 1, 12, 30, 45), 99999)
+
+        assert all(c.isalnum() or c in '-_' for c in cursor)
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "", "e30", "WyJ4IiwxXQ"])
+    def test_invalid_cursor(self, cursor):
+        """Test malformed cursors raise InvalidCursorError."""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor)
+
+
+class TestKeysetPage:
+    """Test paging through rows with keyset_page."""
+
+    @pytest.fixture(scope="class")
+    def paged_user(self, app):
+        """Create a user whose posts mix server-default and explicit timestamps."""
+        user = User(
+            username="keysetuser",
+            email="keyset@example.com",
+            full_name="Keyset User"
+        )
+        user.password = "password123"
+        db.session.add(user)
+        db.session.commit()
+
+        for i in range(4):
+            db.session.add(Post(user_id=user.id, image_url=f"https://example.com/k{i}.jpg"))
+        for i in range(3):
+            db.session.add(Post(user_id=user.id, image_url=f"https://example.com/w{i}.jpg",
+                                created_at=datetime(2020, 1, 1, 8, 0, 0)))
+        for i in range(2):
+            db.session.add(Post(user_id=user.id, image_url=f"https://example.com/f{i}.jpg",
+                                created_at=datetime(2020, 1, 1, 9, 0, 0, 500)))
+        db.session.commit()
+        return user
+
+    def test_pages_cover_every_row_once(self, paged_user):
+        """Test walking all pages returns each post exactly once, newest first."""
+        query = Post.query.filter(Post.user_id == paged_user.id)
+        expected = [post.id for post in query.order_by(Post.created_at.desc(), Post.id.desc()).all()]
+
+        seen, cursor = [], None
+        while True:
+            rows, cursor = keyset_page(query, Post.created_at, Post.id, cursor, 2)
+            seen.extend(row.id for row in rows)
+            if cursor is None:
+                break
+
+        assert seen == expected
+        assert len(seen) == 9
+
+    def test_last_page_has_no_cursor(self, paged_user):
+        """Test a page that reaches the end returns no next cursor."""
+        query = Post.query.filter(Post.user_id == paged_user.id)
+
+        rows, cursor = keyset_page(query, Post.created_at, Post.id, None, 50)
+
+        assert len(rows) == 9
+        assert cursor is None
@@ -5,7 +5,11 @@ Tests all endpoints: index, explore, create_post, update_post, delete_post, home
 import pytest
 import json
 from unittest.mock import patch, MagicMock
-from app.models import Post, User, Follow, Like, Comment, db
+from datetime import datetime, timedelta
+from sqlalchemy import select
+from app.models import Post, PostScore, User, Follow, Like, Comment, TimelineEntry, db
+from app.utils.caching import CacheManager
+from app.utils.memory_backend import MemoryBackend
 
 
 class TestPostRoutes:
@@ -127,6 +131,174 @@ class TestPostRoutes:
             data = json.loads(response.data)
             assert "error" in data
 
+    # =================
+    # CURSOR SCROLL ROUTE TESTS (GET /api/post/scroll?cursor=)
+    # =================
+
+    def test_index_cursor_walks_all_posts(self, client, sample_post):
+        """Test following next_cursor visits every post once, newest first."""
+        with client.application.app_context():
+            for i in range(4):
+                db.session.add(Post(
+                    user_id=sample_post.user_id,
+                    image_url=f"https://example.com/cursor{i}.jpg",
+                    caption=f"Cursor post {i}"
+                ))
+            db.session.commit()
+            expected = [post.id for post in
+                        Post.query.order_by(Post.created_at.desc(), Post.id.desc()).all()]
+
+        seen, cursor = [], None
+        while True:
+            url = '/api/post/scroll?limit=2' + (f'&cursor={cursor}' if cursor else '')
+            response = client.get(url)
+            assert response.status_code == 200
+            data = json.loads(response.data)
+            assert len(data["posts"]) <= 2
+            seen.extend(post["id"] for post in data["posts"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == expected
+
+    def test_index_cursor_invalid_cursor(self, client):
+        """Test a malformed cursor is rejected with 400."""
+        response = client.get('/api/post/scroll?cursor=garbage')
+
+        assert response.status_code == 400
+        assert "error" in json.loads(response.data)
+
+    def test_home_feed_cursor(self, client, sample_user):
+        """Test GET /api/post/<id>/scroll pages the home feed by cursor."""
+        with client.application.app_context():
+            author = User(
+                username="cursorauthor",
+                email="cursorauthor@example.com",
+                full_name="Cursor Author"
+            )
+            author.password = "password123"
+            db.session.add(author)
+            db.session.commit()
+            for i in range(2):
+                db.session.add(Post(user_id=author.id, image_url=f"https://example.com/feed{i}.jpg"))
+            db.session.commit()
+            author_id = author.id
+
+        client.post('/api/follow', json={"user_id": author_id, "user_followed_id": sample_user.id})
+        response = client.get(f'/api/post/{sample_user.id}/scroll?limit=1')
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert len(data["posts"]) == 1
+        assert "comments" in data["posts"][0]
+        assert data["next_cursor"] is not None
+
+    def test_home_feed_fan_out_on_create(self, authenticated_client, sample_user):
+        """Test a new post lands in the timeline of users whose feed includes its author."""
+        reader = User(
+            username="timelinereader",
+            email="timelinereader@example.com",
+            full_name="Timeline Reader"
+        )
+        reader.password = "password123"
+        db.session.add(reader)
+        db.session.commit()
+        authenticated_client.post('/api/follow', json={"user_id": sample_user.id, "user_followed_id": reader.id})
+
+        response = authenticated_client.post('/api/post', json={
+            "image_url": "https://example.com/fanout.jpg",
+            "caption": "Fan out"
+        })
+        post_id = json.loads(response.data)["post"]["id"]
+
+        entry = TimelineEntry.query.filter_by(user_id=reader.id, post_id=post_id).first()
+        assert entry is not None
+        assert entry.author_id == sample_user.id
+
+        feed = json.loads(authenticated_client.get(f'/api/post/{reader.id}/scroll/0').data)
+        assert feed["posts"][0]["id"] == post_id
+
+    def test_home_feed_follow_and_unfollow(self, client, sample_user):
+        """Test following backfills an author's posts and unfollowing removes them."""
+        author = User(
+            username="timelineauthor",
+            email="timelineauthor@example.com",
+            full_name="Timeline Author"
+        )
+        author.password = "password123"
+        reader = User(
+            username="timelinefollower",
+            email="timelinefollower@example.com",
+            full_name="Timeline Follower"
+        )
+        reader.password = "password123"
+        db.session.add_all([author, reader])
+        db.session.commit()
+        for i in range(2):
+            db.session.add(Post(user_id=author.id, image_url=f"https://example.com/backfill{i}.jpg"))
+        db.session.commit()
+        follow = {"user_id": author.id, "user_followed_id": reader.id}
+
+        client.post('/api/follow', json=follow)
+        feed = json.loads(client.get(f'/api/post/{reader.id}/scroll/0').data)
+        assert len(feed["posts"]) == 2
+        assert all(post["user_id"] == author.id for post in feed["posts"])
+
+        client.delete('/api/follow', json=follow)
+        feed = json.loads(client.get(f'/api/post/{reader.id}/scroll/0').data)
+        assert feed["posts"] == []
+
+    def test_home_feed_fixed_query_count(self, client, query_counter):
+        """Test a home feed page costs the same statements however many comments it carries."""
+        author = User(
+            username="eagerauthor",
+            email="eagerauthor@example.com",
+            full_name="Eager Author"
+        )
+        author.password = "password123"
+        reader = User(
+            username="eagerreader",
+            email="eagerreader@example.com",
+            full_name="Eager Reader"
+        )
+        reader.password = "password123"
+        db.session.add_all([author, reader])
+        db.session.commit()
+        client.post('/api/follow', json={"user_id": author.id, "user_followed_id": reader.id})
+
+        def page_queries():
+            query_counter.clear()
+            response = client.get(f'/api/post/{reader.id}/scroll/0')
+            assert response.status_code == 200
+            return len(query_counter)
+
+        post = Post(user_id=author.id, image_url="https://example.com/eager0.jpg")
+        db.session.add(post)
+        db.session.flush()
+        TimelineEntry.fan_out(post.id)
+        db.session.commit()
+        baseline = page_queries()
+
+        for i in range(1, 3):
+            extra = Post(user_id=author.id, image_url=f"https://example.com/eager{i}.jpg")
+            db.session.add(extra)
+            db.session.flush()
+            TimelineEntry.fan_out(extra.id)
+            for commenter in (author, reader):
+                db.session.add(Comment(user_id=commenter.id, post_id=extra.id, content="eager"))
+                db.session.add(Like(user_id=commenter.id, likeable_id=extra.id, likeable_type="post"))
+        db.session.commit()
+
+        assert page_queries() == baseline
+        data = json.loads(client.get(f'/api/post/{reader.id}/scroll/0').data)
+        assert len(data["posts"]) == 3
+        assert sum(len(post["comments"]) for post in data["posts"]) == 4
+        # Anonymous requests never see the feed owner's likes
+        assert sum(post["viewer_has_liked"] for post in data["posts"]) == 0
+        assert all("likes" not in post for post in data["posts"])
+        assert all("user" in comment for post in data["posts"] for comment in post["comments"])
+
     # =================
     # EXPLORE ROUTE TESTS (GET /api/post/explore/<length>)
     # =================
@@ -157,6 +329,112 @@ class TestPostRoutes:
         data = json.loads(response.data)
         assert len(data["posts"]) <= 3  # Should limit to 3 posts
 
+    def test_explore_session_pages_do_not_repeat(self, client, sample_post):
+        """Test one session's explore pages walk a permutation without repeats."""
+        with client.application.app_context():
+            # Without a precomputed ranking explore samples randomly
+            PostScore.query.delete()
+            for i in range(7):
+                db.session.add(Post(
+                    user_id=sample_post.user_id,
+                    image_url=f"https://example.com/explore{i}.jpg"
+                ))
+            db.session.commit()
+            total = Post.query.count()
+
+        seen, length = [], 0
+        while True:
+            response = client.get(f'/api/post/explore/{length}')
+            posts = json.loads(response.data)["posts"]
+            if not posts:
+                break
+            assert len(posts) <= 3
+            seen.extend(post["id"] for post in posts)
+            length += len(posts)
+
+        assert len(seen) == len(set(seen))
+        assert len(seen) == total
+
+    def test_explore_sample_fills_pages_across_gaps(self, client, sample_post):
+        """Test sampled pages stay full when most of the id range was deleted."""
+        with client.application.app_context():
+            PostScore.query.delete()
+            posts = [Post(user_id=sample_post.user_id,
+                          image_url=f"https://example.com/sparse{i}.jpg") for i in range(120)]
+            db.session.add_all(posts)
+            db.session.commit()
+            for post in posts[:-4]:
+                db.session.delete(post)
+            db.session.commit()
+            total = Post.query.count()
+
+        pages, cursor = [], None
+        while True:
+            url = f'/api/post/explore/{sum(map(len, pages))}' + (f'?cursor={cursor}' if cursor else '')
+            data = json.loads(client.get(url).data)
+            pages.append([post["id"] for post in data["posts"]])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        seen = [post_id for page in pages for post_id in page]
+        assert all(len(page) == 3 for page in pages[:-1])
+        assert len(seen) == len(set(seen)) == total
+
+    def test_explore_follows_precomputed_ranking(self, client, sample_post):
+        """Test explore pages through post_scores in rank order once scores exist."""
+        with client.application.app_context():
+            for i in range(4):
+                db.session.add(Post(
+                    user_id=sample_post.user_id,
+                    image_url=f"https://example.com/ranked{i}.jpg",
+                    like_count=i * 10
+                ))
+            db.session.commit()
+            PostScore.recompute()
+            db.session.commit()
+            expected = [score.post_id for score in PostScore.query.order_by(PostScore.rank).limit(6)]
+
+        first = json.loads(client.get('/api/post/explore/0').data)["posts"]
+        second = json.loads(client.get('/api/post/explore/3').data)["posts"]
+
+        assert [post["id"] for post in first + second] == expected
+
+        PostScore.query.delete()
+        db.session.commit()
+
+    def test_explore_cursor_skips_deleted_ranks(self, authenticated_client, sample_user):
+        """Test a deleted ranked post leaves a hole the rank cursor skips without repeats."""
+        posts = [Post(user_id=sample_user.id, image_url=f"https://example.com/dense{i}.jpg",
+                      like_count=1000 - i) for i in range(9)]
+        db.session.add_all(posts)
+        db.session.commit()
+        PostScore.recompute()
+        db.session.commit()
+        ranked = [post.id for post in posts]
+
+        def page(cursor):
+            url = '/api/post/explore/0' + (f'?cursor={cursor}' if cursor else '')
+            data = json.loads(authenticated_client.get(url).data)
+            return [post["id"] for post in data["posts"]], data["next_cursor"]
+
+        seen, cursor = page(None)
+        # Delete a post the client has not reached yet (rank 5)
+        ahead = db.session.scalar(select(PostScore.post_id).where(PostScore.rank == 5))
+        authenticated_client.delete(f'/api/post/{ahead}')
+        for _ in range(2):
+            ids, cursor = page(cursor)
+            seen += ids
+
+        assert db.session.scalar(select(PostScore.rank).where(PostScore.rank == 5)) is None
+        assert ahead not in seen
+        assert len(seen) == len(set(seen))
+        assert set(ranked) - {ahead} <= set(seen)
+        assert authenticated_client.get('/api/post/explore/0?cursor=bad').status_code == 400
+
+        PostScore.query.delete()
+        db.session.commit()
+
     def test_explore_route_error_handling(self, client):
         """Test explore route error handling."""
         with patch('app.api.post_routes.Post.query') as mock_query:
@@ -168,6 +446,43 @@ class TestPostRoutes:
             data = json.loads(response.data)
             assert "error" in data
 
+    def test_index_route_reads_denormalized_counts(self, client, sample_post):
+        """Test scroll reports the counters stored on each post."""
+        with client.application.app_context():
+            post = db.session.get(Post, sample_post.id)
+            post.like_count = 7
+            post.comment_count = 2
+            db.session.commit()
+
+        response = client.get('/api/post/scroll/0')
+        assert response.status_code == 200
+        posts = json.loads(response.data)["posts"]
+        assert len(posts) > 0
+
+        with client.application.app_context():
+            for post in posts:
+                stored = db.session.get(Post, post["id"])
+                assert post["like_count"] == stored.like_count
+                assert post["comment_count"] == stored.comment_count
+
+    def test_index_route_single_query_per_page(self, client, sample_post, query_counter):
+        """Test a scroll page costs one statement regardless of post count."""
+        with client.application.app_context():
+            for i in range(3):
+                db.session.add(Post(
+                    user_id=sample_post.user_id,
+                    image_url=f"https://example.com/count{i}.jpg",
+                    caption=f"Count post {i}"
+                ))
+            db.session.commit()
+
+        query_counter.clear()
+        response = client.get('/api/post/scroll/0')
+
+        assert response.status_code == 200
+        assert len(json.loads(response.data)["posts"]) == 3
+        assert len(query_counter) == 1
+
     # =================
     # CREATE POST ROUTE TESTS (POST /api/post)
     # =================
@@ -301,6 +616,50 @@ class TestPostRoutes:
         data = json.loads(response.data)
         assert "message" in data
 
+    def test_post_count_follows_create_and_delete(self, authenticated_client, sample_user, sample_post_data):
+        """Test creating and deleting a post moves the author's post_count."""
+        def post_count():
+            db.session.expire_all()
+            return db.session.get(User, sample_user.id).post_count
+
+        before = post_count()
+        response = authenticated_client.post('/api/post', json=sample_post_data)
+        post_id = json.loads(response.data)["post"]["id"]
+        assert post_count() == before + 1
+
+        authenticated_client.delete(f'/api/post/{post_id}')
+        assert post_count() == before
+
+    def test_delete_post_refreshes_later_scroll_pages(self, authenticated_client, sample_user):
+        """Test deleting a post drops cached offset pages after it, so none repeat a post."""
+        manager = CacheManager()
+        manager.redis_client = MemoryBackend()
+        newest = datetime.now() + timedelta(days=1)
+        posts = [Post(user_id=sample_user.id, image_url=f"https://example.com/shift{i}.jpg",
+                      caption=f"Shift {i}", created_at=newest - timedelta(minutes=i))
+                 for i in range(6)]
+        db.session.add_all(posts)
+        db.session.commit()
+
+        def page_ids(offset):
+            response = authenticated_client.get(f'/api/post/scroll/{offset}')
+            return [post["id"] for post in json.loads(response.data)["posts"]]
+
+        try:
+            with patch('app.utils.caching.cache_manager', manager):
+                deleted = page_ids(0)[1]
+                page_ids(3)
+                response = authenticated_client.delete(f'/api/post/{deleted}')
+                assert response.status_code == 200
+
+                first_page = page_ids(0)
+                assert deleted not in first_page
+                assert not set(page_ids(3)) & set(first_page)
+        finally:
+            # Keep the future-dated posts from heading other tests' scroll pages
+            Post.query.filter(Post.caption.like("Shift %")).delete(synchronize_session=False)
+            db.session.commit()
+
     def test_delete_post_not_found(self, authenticated_client):
         """Test DELETE /api/post/<post_id> with non-existent post."""
         response = authenticated_client.delete('/api/post/99999')
@@ -375,7 +734,8 @@ class TestPostRoutes:
         assert "posts" in data
         if len(data["posts"]) > 0:
             post = data["posts"][0]
-            assert "likes" in post
+            assert "like_count" in post
+            assert "viewer_has_liked" in post
             assert "comments" in post
 
     # =================
@@ -391,6 +751,26 @@ class TestPostRoutes:
         assert "post" in data
         assert data["post"]["id"] == sample_post.id
 
+    def test_get_post_fixed_query_count(self, client, sample_post, sample_user, query_counter):
+        """Test get_post loads comments, their users and likes without per-row queries."""
+        client.get(f'/api/post/{sample_post.id}')
+        query_counter.clear()
+        client.get(f'/api/post/{sample_post.id}')
+        baseline = len(query_counter)
+
+        for i in range(3):
+            db.session.add(Comment(user_id=sample_user.id, post_id=sample_post.id, content=f"c{i}"))
+        db.session.add(Like(user_id=sample_user.id, likeable_id=sample_post.id, likeable_type="post"))
+        db.session.commit()
+
+        query_counter.clear()
+        response = client.get(f'/api/post/{sample_post.id}')
+
+        assert len(query_counter) == baseline
+        post = json.loads(response.data)["post"]
+        assert len(post["comments"]) == 3
+        assert "likes" not in post
+
     def test_get_post_with_likes_and_comments(self, client, sample_post_with_likes, sample_post_with_comments):
         """Test GET /api/post/<post_id> includes likes and comments."""
         response = client.get(f'/api/post/{sample_post_with_likes.id}')
@@ -399,9 +779,25 @@ class TestPostRoutes:
         data = json.loads(response.data)
         assert "post" in data
         post = data["post"]
-        assert "likes" in post
+        assert "like_count" in post
+        assert "viewer_has_liked" in post
         assert "comments" in post
 
+    def test_get_post_viewer_has_liked(self, authenticated_client, sample_post, sample_user):
+        """Test GET /api/post/<post_id> reports the signed-in user's like state and count."""
+        post = json.loads(authenticated_client.get(f'/api/post/{sample_post.id}').data)["post"]
+        assert post["viewer_has_liked"] is False
+        likes_before = post["like_count"]
+
+        response = authenticated_client.post('/api/like', json={
+            "id": sample_post.id, "user_id": sample_user.id, "likeable_type": "post"
+        })
+        assert response.status_code in (200, 201)
+
+        post = json.loads(authenticated_client.get(f'/api/post/{sample_post.id}').data)["post"]
+        assert post["viewer_has_liked"] is True
+        assert post["like_count"] == likes_before + 1
+
     def test_get_post_not_found(self, client):
         """Test GET /api/post/<post_id> with non-existent post."""
         response = client.get('/api/post/99999')
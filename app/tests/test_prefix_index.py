@@ -0,0 +1,53 @@
+"""
+Tests for the in-memory prefix index used by type-ahead search.
+"""
+from app.utils.prefix_index import PrefixIndex
+
+
+class TestPrefixIndex:
+    """Test sorted-array prefix lookups."""
+
+    def build(self):
+        index = PrefixIndex()
+        index.load([
+            (1, ["john_doe", "John Doe", "Doe"], "john_doe"),
+            (2, ["johnny", "Johnny Appleseed", "Appleseed"], "johnny"),
+            (3, ["jane", "Jane Doe", "Doe"], "jane"),
+        ])
+        return index
+
+    def test_prefix_search_is_case_insensitive_and_ordered(self):
+        """Test matches come back in key order regardless of case."""
+        index = self.build()
+
+        assert index.search("JOHN", 10) == ["john_doe", "johnny"]
+        assert index.search("j", 10) == ["jane", "john_doe", "johnny"]
+        assert index.search("zz", 10) == []
+        assert index.search("", 10) == []
+
+    def test_item_returned_once_across_keys(self):
+        """Test an item stored under several matching keys appears once."""
+        index = self.build()
+
+        assert index.search("doe", 10) == ["john_doe", "jane"]
+        assert index.search("j", 2) == ["jane", "john_doe"]
+
+    def test_put_replaces_and_remove_drops(self):
+        """Test updates move an item to its new keys."""
+        index = self.build()
+
+        index.put(1, ["zed", "Zed"], "zed")
+        assert index.search("john", 10) == ["johnny"]
+        assert index.search("ze", 10) == ["zed"]
+
+        index.remove(2)
+        index.remove(99)
+        assert index.search("john", 10) == []
+        assert len(index) == 2
+
+    def test_loaded_flag(self):
+        """Test an index is only marked loaded after a full load."""
+        index = PrefixIndex()
+        assert not index.loaded
+        index.load([])
+        assert index.loaded
@@ -5,6 +5,7 @@ Tests user profile retrieval with posts, followers, and following data
 import pytest
 import json
 from unittest.mock import patch, MagicMock
+from sqlalchemy import update
 from app.models import User, Post, Follow, Like, Comment, db
 
 
@@ -396,4 +397,112 @@ class TestProfileRoutes:
         for response in responses[1:]:
             assert response["num_posts"] == first_response["num_posts"]
             assert len(response["posts"]) == len(first_response["posts"])
-            assert response["user"]["id"] == first_response["user"]["id"] 
\ No newline at end of file
+            assert response["user"]["id"] == first_response["user"]["id"] 
+
+class TestPagedProfile:
+    """Test the bounded profile header and its paged lists."""
+
+    @pytest.fixture(scope="class")
+    def busy_profile(self, app):
+        """Create a user with more posts and followers than one page holds."""
+        owner = User(username="busyprofile", email="busyprofile@example.com", full_name="Busy Profile")
+        owner.password = "password123"
+        db.session.add(owner)
+        db.session.commit()
+
+        for i in range(15):
+            db.session.add(Post(user_id=owner.id, image_url=f"https://example.com/busy{i}.jpg"))
+        for i in range(23):
+            fan = User(username=f"busyfan{i}", email=f"busyfan{i}@example.com", full_name=f"Busy Fan {i}")
+            fan.password = "password123"
+            db.session.add(fan)
+            db.session.flush()
+            db.session.add(Follow(user_id=fan.id, user_followed_id=owner.id))
+            if i < 2:
+                db.session.add(Follow(user_id=owner.id, user_followed_id=fan.id))
+        db.session.commit()
+        # Fixture rows bypass the write paths, so recompute the counters
+        db.session.execute(update(User).values({
+            User.post_count: User.post_count_column(),
+            User.follower_count: User.follower_count_column(),
+            User.following_count: User.following_count_column(),
+        }))
+        db.session.commit()
+        return {"id": owner.id, "username": owner.username}
+
+    def walk(self, client, url, key):
+        items, cursor = [], None
+        while True:
+            response = client.get(url + (f'?cursor={cursor}' if cursor else ''))
+            assert response.status_code == 200
+            data = json.loads(response.data)
+            items.extend(data[key])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                return items
+
+    def test_header_counts_and_bounded_lists(self, client, busy_profile):
+        """Test the header carries full counts but only first pages of each list."""
+        response = client.get(f'/api/profile/{busy_profile["username"]}')
+
+        data = json.loads(response.data)
+        assert data["num_posts"] == 15
+        assert data["follower_count"] == 23
+        assert data["following_count"] == 2
+        assert len(data["posts"]) == 12
+        assert len(data["followersList"]) == 20
+        assert len(data["followingList"]) == 2
+        assert data["posts_next_cursor"] is not None
+        assert data["followers_next_cursor"] is not None
+        assert data["following_next_cursor"] is None
+
+    def test_header_fixed_query_count(self, client, busy_profile, query_counter):
+        """Test the header costs the same statements as a quiet profile."""
+        client.get('/api/profile/busyfan5')
+        query_counter.clear()
+        client.get('/api/profile/busyfan5')
+        quiet = len(query_counter)
+
+        query_counter.clear()
+        client.get(f'/api/profile/{busy_profile["username"]}')
+
+        assert len(query_counter) == quiet
+
+    def test_posts_pages(self, client, busy_profile):
+        """Test the posts grid pages through every post once, newest first."""
+        posts = self.walk(client, f'/api/profile/{busy_profile["username"]}/posts', "posts")
+
+        assert len(posts) == 15
+        assert len({post["id"] for post in posts}) == 15
+        assert all(post["user_id"] == busy_profile["id"] for post in posts)
+
+    def test_followers_and_following_pages(self, client, busy_profile):
+        """Test follower and following lists page with user summaries."""
+        followers = self.walk(client, f'/api/profile/{busy_profile["id"]}/followers', "followers")
+        following = self.walk(client, f'/api/profile/{busy_profile["id"]}/following', "following")
+
+        assert len(followers) == 23
+        assert all(item["user"]["id"] == item["user_id"] for item in followers)
+        assert len(following) == 2
+        assert all(item["user"]["id"] == item["user_followed_id"] for item in following)
+        assert not any("email" in item["user"] for item in followers + following)
+
+    def test_paged_list_errors(self, client, busy_profile):
+        """Test unknown users 404 and malformed cursors 400."""
+        assert client.get('/api/profile/nobodyhere/posts').status_code == 404
+        response = client.get(f'/api/profile/{busy_profile["username"]}/followers?cursor=bad')
+        assert response.status_code == 400
+
+    def test_counters_follow_write_paths(self, client, busy_profile):
+        """Test follow and unfollow through the API move both users' counters."""
+        follow = {"user_id": busy_profile["id"], "user_followed_id": User.query.filter_by(username="busyfan9").first().id}
+
+        client.post('/api/follow', json=follow)
+        data = json.loads(client.get(f'/api/profile/{busy_profile["username"]}').data)
+        fan = json.loads(client.get('/api/profile/busyfan9').data)
+        assert data["following_count"] == 3
+        assert fan["follower_count"] == 1
+
+        client.delete('/api/follow', json=follow)
+        data = json.loads(client.get(f'/api/profile/{busy_profile["username"]}').data)
+        assert data["following_count"] == 2
@@ -213,8 +213,11 @@ class TestSearchRoutes:
         for result in data["results"]:
             assert "id" in result
             assert "username" in result
-            assert "email" in result
             assert "full_name" in result
+            assert "profile_image_url" in result
+            # Only public fields are served (and cached)
+            assert "email" not in result
+            assert "bio" not in result
 
     def test_search_no_users_in_database(self, client):
         """Test search when no users exist in database."""
@@ -369,4 +372,172 @@ class TestSearchRoutes:
             response = client.get('/api/search?query=special_chars')
             assert response.status_code == 200
             data = json.loads(response.data)
-            assert "results" in data 
\ No newline at end of file
+            assert "results" in data 
+
+class TestRankedSearch:
+    """Test the indexed search engine: ranking, bounds and index maintenance."""
+
+    @pytest.fixture
+    def ranked_users(self, client):
+        """Users whose names match 'qzrank' in different ways."""
+        users = [
+            User(username="my_qzrank_fan", email="qzfan@example.com", full_name="Fan"),
+            User(username="qzrank", email="qzexact@example.com", full_name="Exact"),
+            User(username="qzrank_longer_name", email="qzprefix@example.com", full_name="Prefix"),
+            User(username="someone_else", email="qzfull@example.com", full_name="Qzrank Person"),
+        ]
+        for user in users:
+            user.password = "password123"
+        db.session.add_all(users)
+        db.session.commit()
+        yield users
+        for user in users:
+            db.session.delete(user)
+        db.session.commit()
+
+    def test_results_are_ranked(self, client, ranked_users):
+        """Test exact username, username prefix, full name prefix, then substring."""
+        data = json.loads(client.get('/api/search?query=QZRANK').data)
+
+        assert [user["username"] for user in data["results"]] == [
+            "qzrank", "qzrank_longer_name", "someone_else", "my_qzrank_fan"
+        ]
+        assert data["next_offset"] is None
+
+    def test_results_are_paged(self, client, ranked_users):
+        """Test limit bounds a page and next_offset walks the ranking."""
+        first = json.loads(client.get('/api/search?query=qzrank&limit=3').data)
+        assert len(first["results"]) == 3
+        assert first["next_offset"] == 3
+
+        second = json.loads(client.get('/api/search?query=qzrank&limit=3&offset=3').data)
+        assert [user["username"] for user in second["results"]] == ["my_qzrank_fan"]
+        assert second["next_offset"] is None
+
+    def test_index_follows_renames_and_deletes(self, client, ranked_users):
+        """Test the SQLite FTS table is kept current by its triggers."""
+        from app.models import UserSearch
+
+        fan = ranked_users[0]
+        fan.username = "renamed_fan"
+        db.session.commit()
+        users, _ = UserSearch.users("qzrank")
+        assert fan not in users
+        assert fan in UserSearch.users("renamed_f")[0]
+
+        db.session.delete(ranked_users[3])
+        ranked_users.pop(3)
+        db.session.commit()
+        assert [user.username for user in UserSearch.users("qzrank")[0]] == [
+            "qzrank", "qzrank_longer_name"
+        ]
+
+    def test_short_terms_fall_back_to_substring(self, client, ranked_users):
+        """Test terms shorter than a trigram still match."""
+        from app.models import UserSearch
+
+        assert ranked_users[1] in UserSearch.users("qz", limit=50)[0]
+
+
+class TestTypeahead:
+    """Test type-ahead suggestions served from the in-process prefix index."""
+
+    def test_typeahead_served_from_index(self, client, query_counter):
+        """Test suggestions match username and name prefixes without touching the database."""
+        from app.models import UserSearch
+
+        user = User(username="tqahead_one", email="tqahead@example.com", full_name="Tqa Headley")
+        user.password = "password123"
+        db.session.add(user)
+        db.session.commit()
+        UserSearch.load_index()
+        user_id = user.id
+
+        query_counter.clear()
+        by_username = json.loads(client.get('/api/search/typeahead?query=TQAHEAD').data)
+        by_surname = json.loads(client.get('/api/search/typeahead?query=headl').data)
+
+        assert [result["username"] for result in by_username["results"]] == ["tqahead_one"]
+        assert set(by_username["results"][0]) == {"id", "username", "full_name", "profile_image_url"}
+        assert [result["id"] for result in by_surname["results"]] == [user_id]
+        assert len(query_counter) == 0
+
+        db.session.delete(user)
+        db.session.commit()
+        UserSearch.prefix_index.remove(user_id)
+
+    def test_profile_update_refreshes_index(self, client):
+        """Test renaming a user through the API moves its suggestion."""
+        from app.models import UserSearch
+
+        user = User(username="tqrename_old", email="tqrename@example.com", full_name="Rename Me")
+        user.password = "password123"
+        db.session.add(user)
+        db.session.commit()
+        UserSearch.load_index()
+
+        response = client.put('/api/user', json={
+            "id": user.id, "username": "tqrename_new", "email": "tqrename@example.com",
+            "full_name": "Rename Me", "bio": None
+        })
+        assert response.status_code == 200
+
+        assert UserSearch.typeahead("tqrename_o") == []
+        assert [result["username"] for result in UserSearch.typeahead("tqrename")] == ["tqrename_new"]
+
+    def test_typeahead_requires_query(self, client):
+        """Test a missing query is rejected."""
+        assert client.get('/api/search/typeahead').status_code == 400
+
+
+class TestHashtagSearch:
+    """Test hashtag extraction on post writes and hashtag search."""
+
+    def test_parse_normalizes_hashtags(self):
+        """Test hashtags are case-folded, deduplicated and need a word boundary."""
+        from app.models import Tag
+
+        assert Tag.parse("Sunset #Beach #beach #golden_hour mail#not, #") == ["beach", "golden_hour"]
+        assert Tag.parse(None) == []
+        assert Tag.normalize(" # Foo ") == "foo"
+
+    def test_hashtag_search_follows_post_writes(self, authenticated_client):
+        """Test create, update and delete keep the hashtag index current."""
+        first = json.loads(authenticated_client.post('/api/post', json={
+            "image_url": "https://example.com/tag1.jpg", "caption": "Morning #QzTagA"
+        }).data)["post"]["id"]
+        second = json.loads(authenticated_client.post('/api/post', json={
+            "image_url": "https://example.com/tag2.jpg", "caption": "Evening #qztaga #qztagb"
+        }).data)["post"]["id"]
+
+        data = json.loads(authenticated_client.get('/api/search?query=%23QZTAGA').data)
+        assert [post["id"] for post in data["results"]] == [second, first]
+        assert "user" in data["results"][0]
+
+        authenticated_client.put(f'/api/post/{second}', json={"caption": "Evening #qztagb"})
+        data = json.loads(authenticated_client.get('/api/search?query=qztaga&mode=hashtag').data)
+        assert [post["id"] for post in data["results"]] == [first]
+
+        authenticated_client.delete(f'/api/post/{first}')
+        data = json.loads(authenticated_client.get('/api/search?query=%23qztaga').data)
+        assert data["results"] == []
+
+    def test_hashtag_search_is_cursor_paged(self, authenticated_client):
+        """Test hashtag results page newest first by cursor."""
+        post_ids = [
+            json.loads(authenticated_client.post('/api/post', json={
+                "image_url": f"https://example.com/page{i}.jpg", "caption": f"#qzpaged {i}"
+            }).data)["post"]["id"]
+            for i in range(3)
+        ]
+
+        first = json.loads(authenticated_client.get('/api/search?query=%23qzpaged&limit=2').data)
+        assert [post["id"] for post in first["results"]] == post_ids[:0:-1]
+        assert first["next_cursor"]
+
+        second = json.loads(authenticated_client.get(
+            f'/api/search?query=%23qzpaged&limit=2&cursor={first["next_cursor"]}').data)
+        assert [post["id"] for post in second["results"]] == [post_ids[0]]
+        assert second["next_cursor"] is None
+
+        assert authenticated_client.get('/api/search?query=%23qzpaged&cursor=bad').status_code == 400
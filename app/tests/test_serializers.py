@@ -0,0 +1,81 @@
+"""
+Tests for cache value encodings.
+"""
+import pytest
+
+from app.utils.serializers import CacheCodec, Serializer, available_codecs, benchmark, msgpack
+
+PAYLOAD = {
+    "posts": [
+        {"id": i, "caption": "sunset " * 20, "like_count": i * 3, "user": {"id": 1, "username": "ann"}}
+        for i in range(20)
+    ],
+    "next_cursor": None,
+}
+
+
+class TestCacheCodec:
+    """Test serializer and compression round trips."""
+
+    @pytest.mark.parametrize("name", sorted(available_codecs()))
+    def test_round_trip(self, name):
+        """Test every available codec decodes what it encodes."""
+        codec = available_codecs()[name]
+
+        assert codec.loads(codec.dumps(PAYLOAD)) == PAYLOAD
+
+    def test_serializer_requires_dumps_and_loads(self):
+        """Test a serializer missing an encoding method cannot be created."""
+        class DumpsOnly(Serializer):
+            def dumps(self, value):
+                return b""
+
+        with pytest.raises(TypeError):
+            DumpsOnly()
+
+    def test_compressed_json_is_smaller_than_pickle(self):
+        """Test the default encoding beats pickle on large feed-shaped payloads."""
+        assert len(CacheCodec("json", "zlib").dumps(PAYLOAD)) < len(CacheCodec("pickle").dumps(PAYLOAD))
+
+    def test_json_does_not_unpickle(self):
+        """Test a pickled value planted in the cache is rejected, not executed."""
+        planted = CacheCodec("pickle").dumps(PAYLOAD)
+
+        with pytest.raises(ValueError):
+            CacheCodec("json").loads(planted)
+
+    def test_compresses_only_above_threshold(self):
+        """Test small values skip compression and large ones shrink."""
+        codec = CacheCodec("json", "zlib", compress_min_bytes=512)
+
+        assert codec.dumps({"id": 1})[:1] == b"\x00"
+        compressed = codec.dumps(PAYLOAD)
+        assert compressed[:1] == b"z"
+        assert len(compressed) < len(CacheCodec("json").dumps(PAYLOAD))
+
+    def test_reads_values_written_with_other_compression(self):
+        """Test the header lets an uncompressed codec read compressed values."""
+        written = CacheCodec("json", "zlib", compress_min_bytes=0).dumps(PAYLOAD)
+
+        assert CacheCodec("json").loads(written) == PAYLOAD
+
+    def test_unknown_options_rejected(self):
+        """Test misconfiguration fails loudly."""
+        with pytest.raises(ValueError):
+            CacheCodec("yaml")
+        with pytest.raises(ValueError):
+            CacheCodec("json", "brotli")
+
+    @pytest.mark.skipif(msgpack is not None, reason="msgpack is installed")
+    def test_msgpack_requires_package(self):
+        """Test msgpack is optional and skipped when not installed."""
+        with pytest.raises(ImportError):
+            CacheCodec("msgpack")
+        assert "msgpack" not in available_codecs()
+
+    def test_benchmark_reports_size_and_timings(self):
+        """Test benchmark rows are ordered by encoded size."""
+        rows = benchmark(available_codecs(), [PAYLOAD], rounds=2)
+
+        assert [row["bytes"] for row in rows] == sorted(row["bytes"] for row in rows)
+        assert all(row["encode_us"] > 0 and row["decode_us"] > 0 for row in rows)
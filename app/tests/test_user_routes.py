@@ -200,12 +200,15 @@ class TestUserRoutes:
             "bio": test_user.bio
         }
         
-        response = client.put('/api/user', json=update_data)
+        with patch('app.api.user_routes.invalidate_user_content') as invalidate:
+            response = client.put('/api/user', json=update_data)
         
         assert response.status_code == 401
         data = response.get_json()
         assert 'error' in data
         assert data['error'] == 'No changes made'
+        # A no-op edit leaves the cached feeds alone
+        invalidate.assert_not_called()
 
     def test_update_user_missing_data(self, client):
         """Test user update with missing required data"""
@@ -335,3 +338,67 @@ class TestUserRoutes:
         data = response.get_json()
         assert data['user']['bio'] == "Only bio changed"
         assert data['user']['username'] == test_user.username  # Unchanged
+
+
+class TestRelationshipLookup:
+    """Test the bulk follow/like state endpoint."""
+
+    def test_relationships_batch(self, client, query_counter):
+        """Test every membership question is answered with one query per type."""
+        from app.models import Post, Comment, Follow, Like
+
+        viewer = User(email='viewer@example.com', full_name='Viewer', username='rel_viewer',
+                      hashed_password='hashed_password')
+        others = [User(email=f'relother{i}@example.com', full_name=f'Other {i}', username=f'rel_other{i}',
+                       hashed_password='hashed_password') for i in range(3)]
+        db.session.add_all([viewer] + others)
+        db.session.commit()
+        posts = [Post(user_id=others[0].id, image_url=f'https://example.com/rel{i}.jpg') for i in range(3)]
+        db.session.add_all(posts)
+        db.session.commit()
+        comment = Comment(user_id=others[1].id, post_id=posts[0].id, content='rel')
+        db.session.add(comment)
+        db.session.commit()
+        db.session.add_all([
+            Follow(user_id=viewer.id, user_followed_id=others[0].id),
+            Follow(user_id=viewer.id, user_followed_id=others[2].id),
+            Follow(user_id=others[1].id, user_followed_id=viewer.id),
+            Like(user_id=viewer.id, likeable_id=posts[1].id, likeable_type='post'),
+            Like(user_id=viewer.id, likeable_id=posts[2].id, likeable_type='Post'),
+            Like(user_id=viewer.id, likeable_id=comment.id, likeable_type='comment'),
+        ])
+        db.session.commit()
+
+        payload = {
+            'viewer_id': viewer.id,
+            'user_ids': [other.id for other in others],
+            'post_ids': [post.id for post in posts],
+            'comment_ids': [comment.id],
+        }
+        query_counter.clear()
+        response = client.post('/api/user/relationships', json=payload)
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['following'] == sorted([others[0].id, others[2].id])
+        assert data['liked_posts'] == sorted([posts[1].id, posts[2].id])
+        assert data['liked_comments'] == [comment.id]
+        assert len(query_counter) == 3
+
+    def test_relationships_empty_lists_skip_queries(self, client, query_counter):
+        """Test omitted lists cost no queries."""
+        query_counter.clear()
+        response = client.post('/api/user/relationships', json={'viewer_id': 1, 'post_ids': [1]})
+
+        data = response.get_json()
+        assert data['following'] == []
+        assert data['liked_comments'] == []
+        assert len(query_counter) == 1
+
+    def test_relationships_validation(self, client):
+        """Test missing viewer ids and oversized lists are rejected."""
+        assert client.post('/api/user/relationships', json={'user_ids': [1]}).status_code == 400
+        response = client.post('/api/user/relationships', json={
+            'viewer_id': 1, 'post_ids': list(range(501))
+        })
+        assert response.status_code == 400
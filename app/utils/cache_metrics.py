@@ -0,0 +1,103 @@
+"""
+Per-cache-type counters and lookup latency for the cache layer.
+Each worker records in process and periodically publishes a snapshot, so
+an admin endpoint or CLI command in any process can merge them all.
+"""
+
+from collections import defaultdict, deque
+from typing import Dict, Iterable, List
+import os
+import socket
+import threading
+import time
+
+COUNTERS = ("hits", "misses", "stale", "refreshes", "sets", "evictions", "bytes")
+# Most recent lookup latencies kept per cache type for percentiles
+LATENCY_SAMPLES = 1024
+# Seconds between a worker's snapshot publications
+PUBLISH_INTERVAL = 10
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of ``samples`` (already sorted)."""
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+
+class CacheMetrics:
+    """
+    Counters and a bounded latency reservoir per cache type (the key's
+    namespace, e.g. ``post_scroll``).
+
+    - ``hits``/``misses``: decorator lookups answered fresh / not at all
+    - ``stale``: stale values served while another caller recomputed
+    - ``refreshes``: stale or XFetch-early recomputes
+    - ``sets``/``bytes``: writes and encoded bytes written
+    - ``evictions``: entries dropped by deletes and tag invalidation
+    """
+
+    def __init__(self):
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._counters = defaultdict(lambda: dict.fromkeys(COUNTERS, 0))
+        self._latencies = defaultdict(lambda: deque(maxlen=LATENCY_SAMPLES))
+        self._lock = threading.Lock()
+        self._published_at = time.monotonic()
+
+    def incr(self, cache_type: str, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[cache_type][counter] += amount
+
+    def record_lookup(self, cache_type: str, seconds: float) -> None:
+        """Record the latency of one cache read."""
+        with self._lock:
+            self._latencies[cache_type].append(seconds)
+
+    def snapshot(self) -> Dict[str, dict]:
+        """This worker's counters and latency samples, JSON-serializable."""
+        with self._lock:
+            return {
+                cache_type: dict(self._counters[cache_type], latencies=list(self._latencies[cache_type]))
+                for cache_type in set(self._counters) | set(self._latencies)
+            }
+
+    def publish_due(self) -> bool:
+        """Whether ``PUBLISH_INTERVAL`` has passed; claims the slot if so."""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._published_at < PUBLISH_INTERVAL:
+                return False
+            self._published_at = now
+            return True
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._latencies.clear()
+
+    @staticmethod
+    def summarize(snapshots: Iterable[Dict[str, dict]]) -> Dict[str, dict]:
+        """
+        Merge worker snapshots into one row per cache type, with the hit
+        rate and p50/p99 lookup latency in milliseconds.
+        """
+        counters = defaultdict(lambda: dict.fromkeys(COUNTERS, 0))
+        latencies = defaultdict(list)
+        for snapshot in snapshots:
+            for cache_type, values in snapshot.items():
+                for counter in COUNTERS:
+                    counters[cache_type][counter] += values.get(counter, 0)
+                latencies[cache_type].extend(values.get("latencies", ()))
+
+        summary = {}
+        for cache_type in sorted(counters):
+            row = counters[cache_type]
+            lookups = row["hits"] + row["misses"] + row["stale"] + row["refreshes"]
+            samples = sorted(latencies[cache_type])
+            summary[cache_type] = dict(
+                row,
+                hit_rate=round((row["hits"] + row["stale"]) / lookups, 4) if lookups else None,
+                p50_ms=round(_percentile(samples, 0.50) * 1000, 3),
+                p99_ms=round(_percentile(samples, 0.99) * 1000, 3),
+            )
+        return summary
@@ -4,28 +4,86 @@ Provides Redis-based caching with smart invalidation strategies.
 """
 
 from functools import wraps
-from typing import Optional, Callable, Any, Union, Dict
+from typing import Optional, Callable, Any, Union, Dict, Iterable, List, NamedTuple, Tuple
 import json
-import pickle
 import hashlib
 import logging
+import math
+import random
+import time
+import uuid
 from datetime import datetime, timedelta
 from flask import current_app, request
 import redis
 
+from .cache_metrics import PUBLISH_INTERVAL, CacheMetrics
+from .local_cache import LocalCache
+from .memory_backend import MemoryBackend
+from .serializers import CacheCodec
+
 logger = logging.getLogger(__name__)
 
 
+# Tag set lifetime floor; refreshed on every write that registers a member
+TAG_TIMEOUT = 3600
+# Keys deleted per DEL command when invalidating a large tag
+INVALIDATE_BATCH = 500
+ENTRY_MARKER = '__cache_entry__'
+# Published worker metrics snapshots outlive a few missed publications
+METRICS_TIMEOUT = 6 * PUBLISH_INTERVAL
+# Compare-and-delete, so a lock that expired and was re-taken is not released
+RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def namespace_of(key: str) -> str:
+    """Namespace (and metrics cache type) of an unprefixed key: the part before the first ':'."""
+    return key.split(':', 1)[0]
+
+
+def namespace_tag(namespace: str) -> str:
+    """Tag carried by every entry whose key starts with ``<namespace>:``."""
+    return f"ns:{namespace}"
+
+
 class CacheManager:
-    """Centralized cache management with Redis backend."""
+    """
+    Centralized cache management with Redis backend.
+
+    Invalidation is tag based: every entry is registered in the Redis set of
+    its key namespace (``post_scroll``, ``search_results``, ...) and in any
+    entity tags passed to ``set``, so dropping a tag costs one ``SMEMBERS``
+    plus a ``DEL`` of exactly those keys, never a keyspace scan.
+
+    Values are encoded by a ``CacheCodec`` (``CACHE_SERIALIZER``, default
+    compact JSON, with ``CACHE_COMPRESSION`` above ``CACHE_COMPRESS_MIN_BYTES``).
+    
+    With ``CACHE_L1_MAX_ITEMS`` configured, each worker also keeps a bounded
+    ``LocalCache`` of hot entries; deletes are broadcast on a pub/sub channel
+    so every worker drops its local copy.
+    """
     
     def __init__(self):
-        self.redis_client: Optional[redis.Redis] = None
+        self.redis_client: Optional[Union[redis.Redis, MemoryBackend]] = None
         self.default_timeout = 300  # 5 minutes
         self.key_prefix = 'isntgram:'
+        self.tag_timeout = TAG_TIMEOUT
+        self.codec = CacheCodec()
+        self.metrics = CacheMetrics()
+        self.local: Optional[LocalCache] = None
+        self._listener = None
     
     def init_app(self, app):
-        """Initialize caching with Flask app."""
+        """
+        Initialize caching with Flask app. If Redis is unreachable and
+        ``CACHE_FALLBACK`` is ``'memory'``, an in-process ``MemoryBackend``
+        takes its place; otherwise caching is disabled.
+        """
+        cache_config = app.config.get('CACHE_CONFIG', {})
         try:
             redis_url = app.config.get('REDIS_URL', 'redis://localhost:6379/1')
             self.redis_client = redis.from_url(redis_url, decode_responses=False)
@@ -33,10 +91,9 @@ class CacheManager:
             # Test Redis connection
             self.redis_client.ping()
             
-            # Update configuration from app config
-            cache_config = app.config.get('CACHE_CONFIG', {})
-            self.default_timeout = cache_config.get('CACHE_DEFAULT_TIMEOUT', 300)
-            self.key_prefix = cache_config.get('CACHE_KEY_PREFIX', 'isntgram:')
+            self._configure(cache_config)
+            if cache_config.get('CACHE_L1_MAX_ITEMS'):
+                self._init_local(cache_config)
             
             app.extensions['cache_manager'] = self
             logger.info("✅ Redis cache initialized successfully")
@@ -44,11 +101,109 @@ class CacheManager:
         except Exception as e:
             logger.error(f"❌ Failed to initialize Redis cache: {e}")
             self.redis_client = None
+            if cache_config.get('CACHE_FALLBACK') == 'memory':
+                self.redis_client = MemoryBackend()
+                self._configure(cache_config)
+                app.extensions['cache_manager'] = self
+                logger.warning("⚠️ Using in-memory cache (single process only)")
+    
+    def _configure(self, cache_config: Dict[str, Any]):
+        """Update configuration from app config."""
+        self.default_timeout = cache_config.get('CACHE_DEFAULT_TIMEOUT', 300)
+        self.key_prefix = cache_config.get('CACHE_KEY_PREFIX', 'isntgram:')
+        self.tag_timeout = cache_config.get('CACHE_TAG_TIMEOUT', TAG_TIMEOUT)
+        self.codec = CacheCodec(
+            cache_config.get('CACHE_SERIALIZER', 'json'),
+            cache_config.get('CACHE_COMPRESSION'),
+            cache_config.get('CACHE_COMPRESS_MIN_BYTES', 1024),
+        )
+    
+    @property
+    def backend(self) -> str:
+        """``'redis'``, ``'memory'`` or ``'none'``."""
+        if self.redis_client is None:
+            return 'none'
+        return 'memory' if isinstance(self.redis_client, MemoryBackend) else 'redis'
+    
+    def _init_local(self, cache_config: Dict[str, Any]):
+        """
+        Enable the per-worker L1 cache and subscribe to invalidations.
+        Runs in each worker process (the listener thread does not survive a fork).
+        """
+        try:
+            pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{self._channel: self._on_invalidation})
+            self.local = LocalCache(
+                max_items=cache_config['CACHE_L1_MAX_ITEMS'],
+                max_bytes=cache_config.get('CACHE_L1_MAX_BYTES', 16 * 1024 * 1024),
+                ttl=cache_config.get('CACHE_L1_TIMEOUT', 5),
+            )
+            self._listener = pubsub.run_in_thread(
+                sleep_time=1, daemon=True, exception_handler=self._on_listener_error
+            )
+            logger.info("✅ L1 cache enabled")
+        except Exception as e:
+            # Without invalidation messages local copies could go stale
+            logger.error(f"❌ Failed to enable L1 cache: {e}")
+            self.local = None
+    
+    @property
+    def _channel(self) -> str:
+        return f"{self.key_prefix}invalidate"
+    
+    def _on_invalidation(self, message):
+        """Pub/sub handler: drop the broadcast keys (or everything) from L1."""
+        if self.local is None:
+            return
+        keys = json.loads(message['data'])
+        if keys == '*':
+            self.local.clear()
+        else:
+            self.local.delete(*keys)
+    
+    def _on_listener_error(self, error, pubsub, thread):
+        # Messages may have been missed while disconnected
+        logger.error(f"Cache invalidation listener error: {error}")
+        if self.local is not None:
+            self.local.clear()
+    
+    def _broadcast(self, keys) -> None:
+        """Drop ``keys`` (full keys, or ``'*'``) from every worker's L1."""
+        if self.local is None:
+            return
+        if keys == '*':
+            self.local.clear()
+        else:
+            self.local.delete(*keys)
+        self.redis_client.publish(self._channel, json.dumps(keys))
     
     def _make_key(self, key: str) -> str:
         """Generate prefixed cache key."""
         return f"{self.key_prefix}{key}"
     
+    def _tag_key(self, tag: str) -> str:
+        """
+        Sorted set of the keys registered under ``tag``, scored by their
+        expiry time so members that have expired can be pruned by score.
+        """
+        return f"{self.key_prefix}tags:{tag}"
+    
+    @property
+    def _namespaces_key(self) -> str:
+        return f"{self.key_prefix}namespaces"
+    
+    def _dumps(self, value: Any) -> bytes:
+        if isinstance(value, CacheEntry):
+            # Keep the envelope distinguishable in formats without tuples
+            value = {ENTRY_MARKER: [value.value, value.expires_at, value.delta]}
+        return self.codec.dumps(value)
+    
+    def _loads(self, data: bytes) -> Any:
+        value = self.codec.loads(data)
+        if isinstance(value, dict) and len(value) == 1 and ENTRY_MARKER in value:
+            return CacheEntry(*value[ENTRY_MARKER])
+        return value
+    
     def get(self, key: str, default=None) -> Any:
         """Retrieve value from cache."""
         if not self.redis_client:
@@ -56,29 +211,123 @@ class CacheManager:
         
         try:
             cache_key = self._make_key(key)
-            value = self.redis_client.get(cache_key)
+            value = self.local.get(cache_key) if self.local is not None else None
+            if value is None:
+                value = self.redis_client.get(cache_key)
+                if value is not None and self.local is not None:
+                    self.local.set(cache_key, value)
+            self.publish_metrics()
             if value is not None:
-                return pickle.loads(value)
+                return self._loads(value)
             return default
         except Exception as e:
             logger.error(f"Cache get error for key {key}: {e}")
             return default
     
-    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
-        """Store value in cache."""
+    def set(self, key: str, value: Any, timeout: Optional[int] = None,
+            tags: Iterable[str] = (), grace: int = 0) -> bool:
+        """
+        Store value in cache, registered under its key's namespace tag and
+        any extra ``tags`` (e.g. ``post_tag(id)``) for later invalidation.
+        ``grace`` keeps the entry in Redis that many seconds past ``timeout``
+        so a stale copy can be served while it is recomputed.
+        """
         if not self.redis_client:
             return False
         
         try:
-            cache_key = self._make_key(key)
             timeout = timeout or self.default_timeout
-            serialized_value = pickle.dumps(value)
-            result = self.redis_client.setex(cache_key, timeout, serialized_value)
+            pipe = self.redis_client.pipeline(transaction=False)
+            write = self._queue_set(pipe, key, value, timeout, tags, grace)
+            result = pipe.execute()[0]
+            write()
             return bool(result)
         except Exception as e:
             logger.error(f"Cache set error for key {key}: {e}")
             return False
     
+    def _queue_set(self, pipe, key: str, value: Any, timeout: int,
+                   tags: Iterable[str], grace: int) -> Callable[[], None]:
+        """
+        Queue the writes storing ``key`` and its tag registrations on
+        ``pipe``; returns the local bookkeeping to run once it executes.
+        """
+        cache_key = self._make_key(key)
+        serialized_value = self._dumps(value)
+        namespace = namespace_of(key)
+        tag_timeout = max(timeout + grace, self.tag_timeout)
+        now = time.time()
+        
+        pipe.setex(cache_key, timeout + grace, serialized_value)
+        pipe.sadd(self._namespaces_key, namespace)
+        for tag in {namespace_tag(namespace), *tags}:
+            tag_key = self._tag_key(tag)
+            # Drop members whose entries have expired, so busy tags stay bounded
+            pipe.zremrangebyscore(tag_key, '-inf', now)
+            pipe.zadd(tag_key, {cache_key: now + timeout + grace})
+            pipe.expire(tag_key, tag_timeout)
+        
+        def written():
+            if self.local is not None:
+                self.local.set(cache_key, serialized_value, timeout)
+            self.metrics.incr(namespace, 'sets')
+            self.metrics.incr(namespace, 'bytes', len(serialized_value))
+        return written
+    
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Values of the cached keys among ``keys`` in one round trip: L1 hits
+        first, then a single MGET for the rest. Missing keys are left out.
+        """
+        keys = list(dict.fromkeys(keys))
+        if not self.redis_client or not keys:
+            return {}
+        
+        try:
+            found = {}
+            remote = []
+            for key in keys:
+                value = self.local.get(self._make_key(key)) if self.local is not None else None
+                if value is None:
+                    remote.append(key)
+                else:
+                    found[key] = value
+            if remote:
+                cache_keys = [self._make_key(key) for key in remote]
+                for key, cache_key, value in zip(remote, cache_keys, self.redis_client.mget(cache_keys)):
+                    if value is not None:
+                        found[key] = value
+                        if self.local is not None:
+                            self.local.set(cache_key, value)
+            self.publish_metrics()
+            return {key: self._loads(value) for key, value in found.items()}
+        except Exception as e:
+            logger.error(f"Cache get_many error for {len(keys)} keys: {e}")
+            return {}
+    
+    def set_many(self, mapping: Dict[str, Any], timeout: Optional[int] = None,
+                 tags: Optional[Dict[str, Iterable[str]]] = None, grace: int = 0) -> bool:
+        """
+        Store several values in one pipeline. ``tags`` maps a key to its
+        extra tags; every entry also joins its namespace tag, as in ``set``.
+        """
+        if not self.redis_client or not mapping:
+            return False
+        
+        try:
+            timeout = timeout or self.default_timeout
+            tags = tags or {}
+            pipe = self.redis_client.pipeline(transaction=False)
+            writes = [self._queue_set(pipe, key, value, timeout, tags.get(key, ()), grace)
+                      for key, value in mapping.items()]
+            pipe.execute()
+            for write in writes:
+                write()
+            return True
+        except Exception as e:
+            logger.error(f"Cache set_many error for {len(mapping)} keys: {e}")
+            return False
+    
     def delete(self, key: str) -> bool:
         """Delete value from cache."""
         if not self.redis_client:
@@ -87,63 +336,220 @@ class CacheManager:
         try:
             cache_key = self._make_key(key)
             result = self.redis_client.delete(cache_key)
+            self._broadcast([cache_key])
+            self.metrics.incr(namespace_of(key), 'evictions', 1 if result else 0)
             return bool(result)
         except Exception as e:
             logger.error(f"Cache delete error for key {key}: {e}")
             return False
     
-    def delete_pattern(self, pattern: str) -> int:
-        """Delete all keys matching pattern."""
+    def acquire_lock(self, key: str, timeout: int) -> Optional[str]:
+        """
+        Try to take the single-flight lock for ``key`` without blocking.
+        Returns a token for ``release_lock``, ``None`` if another caller holds
+        the lock, or ``''`` if Redis failed (proceed uncoordinated).
+        """
         if not self.redis_client:
+            return ''
+        
+        try:
+            token = uuid.uuid4().hex
+            if self.redis_client.set(self._make_key(f"lock:{key}"), token, nx=True, ex=timeout):
+                return token
+            return None
+        except Exception as e:
+            logger.error(f"Cache lock error for key {key}: {e}")
+            return ''
+    
+    def release_lock(self, key: str, token: str) -> bool:
+        """Release the lock for ``key`` if ``token`` still owns it."""
+        if not self.redis_client or not token:
+            return False
+        
+        try:
+            return bool(self.redis_client.eval(RELEASE_LOCK_SCRIPT, 1, self._make_key(f"lock:{key}"), token))
+        except Exception as e:
+            logger.error(f"Cache lock release error for key {key}: {e}")
+            return False
+    
+    def invalidate_tags(self, *tags: str) -> int:
+        """
+        Delete every entry registered under any of ``tags``, and the tag
+        sets themselves. Cost is proportional to the entries tagged.
+        """
+        if not self.redis_client or not tags:
             return 0
         
         try:
-            cache_pattern = self._make_key(pattern)
-            keys = self.redis_client.keys(cache_pattern)
+            tag_keys = [self._tag_key(tag) for tag in tags]
+            pipe = self.redis_client.pipeline(transaction=False)
+            for tag_key in tag_keys:
+                pipe.zrangebyscore(tag_key, time.time(), '+inf')
+            keys = sorted(set().union(*pipe.execute()))
+            
+            deleted = 0
+            for start in range(0, len(keys), INVALIDATE_BATCH):
+                deleted += self.redis_client.delete(*keys[start:start + INVALIDATE_BATCH])
+            self.redis_client.delete(*tag_keys)
             if keys:
-                deleted = self.redis_client.delete(*keys)
-                logger.info(f"Deleted {deleted} cache keys matching pattern: {pattern}")
-                return deleted
-            return 0
+                keys = [k.decode() if isinstance(k, bytes) else k for k in keys]
+                self._broadcast(keys)
+                for key in keys:
+                    self.metrics.incr(namespace_of(key[len(self.key_prefix):]), 'evictions')
+                logger.info(f"Deleted {deleted} cache keys tagged {', '.join(tags)}")
+            return deleted
         except Exception as e:
-            logger.error(f"Cache pattern delete error for {pattern}: {e}")
+            logger.error(f"Cache tag invalidation error for {tags}: {e}")
             return 0
     
+    @property
+    def _metrics_workers_key(self) -> str:
+        return f"{self.key_prefix}metrics:workers"
+    
+    def _metrics_key(self, worker_id: str) -> str:
+        return f"{self.key_prefix}metrics:worker:{worker_id}"
+    
+    def publish_metrics(self, force: bool = False) -> None:
+        """
+        Share this worker's metrics snapshot, at most every
+        ``PUBLISH_INTERVAL`` seconds unless ``force``d. Snapshots of idle
+        workers expire after ``METRICS_TIMEOUT``.
+        """
+        if not self.redis_client or not (force or self.metrics.publish_due()):
+            return
+        
+        try:
+            worker_id = self.metrics.worker_id
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.setex(self._metrics_key(worker_id), METRICS_TIMEOUT, json.dumps(self.metrics.snapshot()))
+            pipe.sadd(self._metrics_workers_key, worker_id)
+            pipe.expire(self._metrics_workers_key, METRICS_TIMEOUT)
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"Cache metrics publish error: {e}")
+    
+    def collect_metrics(self) -> Dict[str, dict]:
+        """
+        Per-cache-type metrics merged across every worker that published
+        recently (this process's are always current).
+        """
+        snapshots = {self.metrics.worker_id: self.metrics.snapshot()}
+        if self.redis_client:
+            try:
+                workers = sorted(
+                    w.decode() if isinstance(w, bytes) else w
+                    for w in self.redis_client.smembers(self._metrics_workers_key)
+                )
+                pipe = self.redis_client.pipeline(transaction=False)
+                for worker_id in workers:
+                    pipe.get(self._metrics_key(worker_id))
+                for worker_id, data in zip(workers, pipe.execute()):
+                    if data is None:
+                        self.redis_client.srem(self._metrics_workers_key, worker_id)
+                    elif worker_id not in snapshots:
+                        snapshots[worker_id] = json.loads(data)
+            except Exception as e:
+                logger.error(f"Cache metrics collect error: {e}")
+        return CacheMetrics.summarize(snapshots.values())
+    
+    def _namespaces(self) -> list:
+        return sorted(
+            n.decode() if isinstance(n, bytes) else n
+            for n in self.redis_client.smembers(self._namespaces_key)
+        )
+    
     def clear_all(self) -> bool:
-        """Clear all cache entries with our prefix."""
+        """Clear all cache entries, one namespace tag at a time."""
         if not self.redis_client:
             return False
         
         try:
-            pattern = f"{self.key_prefix}*"
-            keys = self.redis_client.keys(pattern)
-            if keys:
-                self.redis_client.delete(*keys)
-                logger.info(f"Cleared all cache entries ({len(keys)} keys)")
+            namespaces = self._namespaces()
+            deleted = self.invalidate_tags(*(namespace_tag(n) for n in namespaces))
+            self.redis_client.delete(self._namespaces_key)
+            self._broadcast('*')
+            logger.info(f"Cleared all cache entries ({deleted} keys)")
             return True
         except Exception as e:
             logger.error(f"Cache clear all error: {e}")
             return False
     
+    def incr_score(self, key: str, member: str, amount: float = 1,
+                   keep: Optional[int] = None) -> float:
+        """
+        Add ``amount`` to ``member`` in the sorted set ``key``; returns the
+        new score. With ``keep``, the set is trimmed to its ``keep``
+        highest-scoring members in the same round trip.
+        """
+        if not self.redis_client:
+            return 0
+        
+        try:
+            name = self._make_key(key)
+            if keep is None:
+                return float(self.redis_client.zincrby(name, amount, member))
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.zincrby(name, amount, member)
+            pipe.zremrangebyrank(name, 0, -keep - 1)
+            return float(pipe.execute()[0])
+        except Exception as e:
+            logger.error(f"Cache score increment error for key {key}: {e}")
+            return 0
+    
+    def top_members(self, key: str, count: int) -> list:
+        """Highest-scoring ``count`` members of the sorted set ``key``."""
+        if not self.redis_client or count <= 0:
+            return []
+        
+        try:
+            members = self.redis_client.zrevrange(self._make_key(key), 0, count - 1)
+            return [m.decode() if isinstance(m, bytes) else m for m in members]
+        except Exception as e:
+            logger.error(f"Cache top members error for key {key}: {e}")
+            return []
+    
+    def trim_scores(self, key: str, keep: int) -> int:
+        """Drop all but the ``keep`` highest-scoring members of ``key``."""
+        if not self.redis_client:
+            return 0
+        
+        try:
+            return self.redis_client.zremrangebyrank(self._make_key(key), 0, -keep - 1)
+        except Exception as e:
+            logger.error(f"Cache score trim error for key {key}: {e}")
+            return 0
+    
     def get_stats(self) -> Dict[str, Any]:
-        """Get cache statistics."""
+        """
+        Get cache statistics. Entry counts are the unexpired members of
+        each namespace tag; entries deleted by key count until they expire.
+        """
         if not self.redis_client:
             return {'status': 'unavailable'}
         
         try:
             info = self.redis_client.info()
-            pattern = f"{self.key_prefix}*"
-            our_keys = len(self.redis_client.keys(pattern))
+            namespaces = self._namespaces()
+            pipe = self.redis_client.pipeline(transaction=False)
+            now = time.time()
+            for namespace in namespaces:
+                pipe.zcount(self._tag_key(namespace_tag(namespace)), now, '+inf')
+            namespace_keys = dict(zip(namespaces, pipe.execute()))
             
-            return {
+            stats = {
                 'status': 'active',
+                'backend': self.backend,
                 'redis_version': info.get('redis_version'),
                 'used_memory_human': info.get('used_memory_human'),
                 'total_keys': info.get('db1', {}).get('keys', 0),
-                'our_keys': our_keys,
+                'our_keys': sum(namespace_keys.values()),
+                'namespace_keys': namespace_keys,
                 'uptime_in_seconds': info.get('uptime_in_seconds'),
                 'connected_clients': info.get('connected_clients')
             }
+            if self.local is not None:
+                stats['l1'] = {'items': len(self.local), 'bytes': self.local.size_bytes}
+            return stats
         except Exception as e:
             logger.error(f"Error getting cache stats: {e}")
             return {'status': 'error', 'message': str(e)}
@@ -160,13 +566,110 @@ def cache_key(*args, **kwargs) -> str:
     return hashlib.md5(key_data.encode()).hexdigest()
 
 
-def cached(timeout: Optional[int] = None, key_func: Optional[Callable] = None):
+# Stampede protection for the caching decorators
+LOCK_TIMEOUT = 10           # Seconds before an abandoned recompute lock expires
+LOCK_WAIT = 2.0             # Seconds a caller with nothing to serve waits for the lock holder
+LOCK_POLL_INTERVAL = 0.05
+XFETCH_BETA = 1.0           # > 1 refreshes earlier, < 1 later
+
+
+class CacheEntry(NamedTuple):
+    """A decorator-cached value with its logical expiry and recompute cost."""
+    value: Any
+    expires_at: float  # Unix time after which the value is stale
+    delta: float       # Seconds the last recompute took
+
+
+def _needs_refresh(entry: CacheEntry, now: float) -> bool:
+    """
+    XFetch: refresh with a probability rising towards expiry, earlier for
+    values that are slow to compute; always once the value is stale.
     """
-    Decorator for caching function results.
+    return now - entry.delta * XFETCH_BETA * math.log(1.0 - random.random()) >= entry.expires_at
+
+
+def timed_get(key: str) -> Any:
+    """``cache_manager.get`` that records the lookup latency for ``key``'s cache type."""
+    started = time.perf_counter()
+    value = cache_manager.get(key)
+    cache_manager.metrics.record_lookup(namespace_of(key), time.perf_counter() - started)
+    return value
+
+
+def counted_get(key: str) -> Any:
+    """``timed_get`` that also counts a hit or miss, for reads outside the decorators."""
+    value = timed_get(key)
+    cache_manager.metrics.incr(namespace_of(key), 'hits' if value is not None else 'misses')
+    return value
+
+
+def _wait_for_refresh(key: str) -> Optional[CacheEntry]:
+    """Poll for the value another caller is computing, up to ``LOCK_WAIT``."""
+    deadline = time.monotonic() + LOCK_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(LOCK_POLL_INTERVAL)
+        entry = cache_manager.get(key)
+        if isinstance(entry, CacheEntry):
+            return entry
+    return None
+
+
+def _fetch(key: str, compute: Callable, timeout: int, stale_ttl: int,
+           tags_func: Optional[Callable] = None) -> Any:
+    """
+    Serve ``key`` from cache, recomputing through a single-flight lock.
+
+    Fresh values are returned directly. A miss, a stale value (kept
+    ``stale_ttl`` seconds past expiry) or an XFetch early refresh sends
+    one caller to recompute under the lock; concurrent callers serve the
+    stale value, or wait briefly for the new one when there is none.
+    Results of ``None`` are not stored.
+    """
+    metrics = cache_manager.metrics
+    cache_type = namespace_of(key)
+    entry = timed_get(key)
+    if entry is not None and not isinstance(entry, CacheEntry):
+        metrics.incr(cache_type, 'hits')
+        return entry  # Stored by a plain cache_manager.set
+    if entry is not None and not _needs_refresh(entry, time.time()):
+        metrics.incr(cache_type, 'hits')
+        return entry.value
+    
+    token = cache_manager.acquire_lock(key, LOCK_TIMEOUT)
+    if token is None and entry is not None:
+        metrics.incr(cache_type, 'stale')
+        return entry.value
+    metrics.incr(cache_type, 'misses' if entry is None else 'refreshes')
+    if token is None:
+        entry = _wait_for_refresh(key)
+        if entry is not None:
+            return entry.value
+        logger.warning(f"Timed out waiting for cache refresh of {key}")
+        return compute()
+    
+    try:
+        started = time.monotonic()
+        result = compute()
+        delta = time.monotonic() - started
+        if result is not None:
+            tags = tags_func(result) if tags_func else ()
+            cache_manager.set(key, CacheEntry(result, time.time() + timeout, delta),
+                              timeout, tags=tags, grace=stale_ttl)
+        return result
+    finally:
+        cache_manager.release_lock(key, token)
+
+
+def cached(timeout: Optional[int] = None, key_func: Optional[Callable] = None,
+           stale_ttl: Optional[int] = None):
+    """
+    Decorator for caching function results, with stampede protection.
     
     Args:
         timeout: Cache timeout in seconds
         key_func: Function to generate cache key
+        stale_ttl: Seconds a stale value may be served while one caller
+            recomputes it (defaults to ``timeout``)
     """
     def decorator(func: Callable) -> Callable:
         @wraps(func)
@@ -182,32 +685,32 @@ def cached(timeout: Optional[int] = None, key_func: Optional[Callable] = None):
                 func_name = f"{func.__module__}.{func.__name__}"
                 cache_key_str = f"func:{func_name}:{cache_key(*args, **kwargs)}"
             
-            # Try to get from cache
-            cached_result = cache_manager.get(cache_key_str)
-            if cached_result is not None:
-                logger.debug(f"Cache hit for {func.__name__}")
-                return cached_result
-            
-            # Cache miss - call function
-            logger.debug(f"Cache miss for {func.__name__}")
-            result = func(*args, **kwargs)
-            
-            # Store in cache
             cache_timeout = timeout or cache_manager.default_timeout
-            cache_manager.set(cache_key_str, result, cache_timeout)
-            
-            return result
+            return _fetch(
+                cache_key_str, lambda: func(*args, **kwargs), cache_timeout,
+                cache_timeout if stale_ttl is None else stale_ttl
+            )
         
         return wrapper
     return decorator
 
 
-def smart_cached(cache_type: str):
+def smart_cached(cache_type: str, key_func: Optional[Callable] = None,
+                 tags_func: Optional[Callable] = None, stale_ttl: Optional[int] = None):
     """
-    Smart caching decorator that uses config-based timeouts.
+    Smart caching decorator that uses config-based timeouts, with
+    stampede protection.
     
     Args:
         cache_type: Type of data being cached (from CACHE_TIMEOUTS config)
+        key_func: Function building the full cache key from the call's
+            arguments; use the structured ``*_key`` helpers below so write
+            paths can invalidate the same keys
+        tags_func: Function returning the entity tags (``post_tag``,
+            ``user_tag``) of a result, so it is invalidated whenever one of
+            the entities it embeds changes
+        stale_ttl: Seconds a stale value may be served while one caller
+            recomputes it (defaults to the type's timeout)
     """
     def decorator(func: Callable) -> Callable:
         @wraps(func)
@@ -220,64 +723,243 @@ def smart_cached(cache_type: str):
             timeout = cache_timeouts.get(cache_type, 300)  # 5 min default
             
             # Generate cache key
-            func_name = f"{func.__module__}.{func.__name__}"
-            cache_key_str = f"{cache_type}:{func_name}:{cache_key(*args, **kwargs)}"
-            
-            # Try cache first
-            cached_result = cache_manager.get(cache_key_str)
-            if cached_result is not None:
-                return cached_result
-            
-            # Execute and cache
-            result = func(*args, **kwargs)
-            cache_manager.set(cache_key_str, result, timeout)
+            if key_func:
+                cache_key_str = key_func(*args, **kwargs)
+            else:
+                func_name = f"{func.__module__}.{func.__name__}"
+                cache_key_str = f"{cache_type}:{func_name}:{cache_key(*args, **kwargs)}"
             
-            return result
+            return _fetch(
+                cache_key_str, lambda: func(*args, **kwargs), timeout,
+                timeout if stale_ttl is None else stale_ttl, tags_func
+            )
         
         return wrapper
     return decorator
 
 
-def invalidate_cache_pattern(pattern: str):
-    """Invalidate all cache entries matching pattern."""
-    return cache_manager.delete_pattern(pattern)
+class EntityCache(NamedTuple):
+    """How one entity type is cached by id and bulk-loaded on misses."""
+    cache_type: str                                # CACHE_TIMEOUTS entry and key namespace
+    key_func: Callable[[Any], str]                 # id -> structured key
+    load_many: Callable[[list], Dict[Any, Any]]    # ids -> {id: payload}, in one query
+    tags_func: Optional[Callable[[Any], Iterable[str]]] = None
+
+
+def hydrate(*batches: Tuple[EntityCache, Iterable]) -> List[Dict[Any, Any]]:
+    """
+    Payloads for ``(entity, ids)`` batches, one ``{id: payload}`` dict per
+    batch; ids without a row are left out.
+
+    Every key of every batch is read in one ``get_many`` round trip; each
+    entity's misses (and stale entries) are loaded with one ``load_many``
+    call and written back in one pipeline. There is no single-flight lock:
+    a miss costs one bulk query shared by the whole page.
+    """
+    batches = [(entity, list(dict.fromkeys(ids))) for entity, ids in batches]
+    started = time.perf_counter()
+    found = cache_manager.get_many(entity.key_func(entity_id) for entity, ids in batches for entity_id in ids)
+    elapsed = time.perf_counter() - started
+    
+    metrics = cache_manager.metrics
+    cache_timeouts = current_app.config.get('CACHE_TIMEOUTS', {})
+    now = time.time()
+    results = []
+    for entity, ids in batches:
+        metrics.record_lookup(entity.cache_type, elapsed)
+        payloads, missing, stale = {}, [], 0
+        for entity_id in ids:
+            entry = found.get(entity.key_func(entity_id))
+            if isinstance(entry, CacheEntry):
+                if entry.expires_at > now:
+                    payloads[entity_id] = entry.value
+                    continue
+                stale += 1
+            elif entry is not None:
+                payloads[entity_id] = entry  # Stored by a plain cache_manager.set
+                continue
+            missing.append(entity_id)
+        metrics.incr(entity.cache_type, 'hits', len(payloads))
+        metrics.incr(entity.cache_type, 'misses', len(missing) - stale)
+        metrics.incr(entity.cache_type, 'refreshes', stale)
+        
+        if missing:
+            timeout = cache_timeouts.get(entity.cache_type, 300)
+            started = time.monotonic()
+            loaded = entity.load_many(missing)
+            delta = (time.monotonic() - started) / len(missing)
+            cache_manager.set_many(
+                {entity.key_func(entity_id): CacheEntry(payload, now + timeout, delta)
+                 for entity_id, payload in loaded.items()},
+                timeout,
+                tags={entity.key_func(entity_id): entity.tags_func(payload)
+                      for entity_id, payload in loaded.items()} if entity.tags_func else None,
+            )
+            payloads.update(loaded)
+        results.append(payloads)
+    return results
+
+
+# Structured keys: one entry per entity, so writes delete exact keys
+def post_details_key(post_id) -> str:
+    """Key for a post with its author and comments."""
+    return f"post_details:post_id:{post_id}"
+
+
+def user_profile_key(user_id) -> str:
+    """Key for a user's profile header."""
+    return f"user_profile:user_id:{user_id}"
+
+
+def user_summary_key(user_id) -> str:
+    """Key for a user's public fields, as embedded in posts and lists."""
+    return f"user_summary:user_id:{user_id}"
+
+
+def post_scroll_key(offset) -> str:
+    """Key for one page of the global scroll."""
+    return f"post_scroll:offset:{offset}"
+
+
+# Entity tags: a cached payload embedding a post or user carries its tag
+def post_tag(post_id) -> str:
+    return f"post:{post_id}"
+
+
+def user_tag(user_id) -> str:
+    return f"user:{user_id}"
+
+
+def post_dict_tags(post_dict: dict) -> set:
+    """Tags of a serialized post: the post, its author and its commenters."""
+    tags = {post_tag(post_dict["id"]), user_tag(post_dict["user_id"])}
+    tags.update(user_tag(comment["user_id"]) for comment in post_dict.get("comments", ()))
+    return tags
+
+
+def post_list_tags(post_dicts: list) -> set:
+    """Tags of a page of serialized posts."""
+    return set().union(*(post_dict_tags(post_dict) for post_dict in post_dicts))
+
+
+def profile_tags(profile: dict) -> set:
+    """Tags of a profile header: the user and the posts in its grid."""
+    return {user_tag(profile["user"]["id"]), *(post_tag(post["id"]) for post in profile["posts"])}
 
 
 def invalidate_user_cache(user_id: int):
-    """Invalidate all cache entries for a specific user."""
-    patterns = [
-        f"user_profile:*user_id:{user_id}*",
-        f"post_details:*user_id:{user_id}*",
-        f"user_followers:*user_id:{user_id}*",
-    ]
-    
-    total_deleted = 0
-    for pattern in patterns:
-        total_deleted += cache_manager.delete_pattern(pattern)
-    
-    logger.info(f"Invalidated {total_deleted} cache entries for user {user_id}")
-    return total_deleted
+    """Invalidate the cached profile of a user (profile, counts, follow lists)."""
+    deleted = int(cache_manager.delete(user_profile_key(user_id)))
+    logger.info(f"Invalidated {deleted} cache entries for user {user_id}")
+    return deleted
+
+
+def invalidate_user_content(user_id: int):
+    """
+    Invalidate every cached payload embedding a user (profile, posts and
+    scroll pages showing their name or avatar) after a profile edit.
+    """
+    deleted = cache_manager.invalidate_tags(user_tag(user_id))
+    logger.info(f"Invalidated {deleted} cache entries showing user {user_id}")
+    return deleted
+
+
+def invalidate_post_details(post_id: int):
+    """Invalidate one cached post after a like or comment changes it."""
+    return int(cache_manager.delete(post_details_key(post_id)))
+
+
+def invalidate_scroll_cache():
+    """Invalidate every cached page of the global scroll."""
+    return cache_manager.invalidate_tags(namespace_tag('post_scroll'))
 
 
 def invalidate_post_cache(post_id: int):
-    """Invalidate all cache entries for a specific post."""
-    patterns = [
-        f"post_details:*post_id:{post_id}*",
-        f"post_scroll:*",  # Scroll includes this post
-        f"explore_posts:*",  # Explore might include this post
-    ]
-    
-    total_deleted = 0
-    for pattern in patterns:
-        total_deleted += cache_manager.delete_pattern(pattern)
-    
+    """Invalidate a post and every cached page (scroll, profile grid) showing it."""
+    total_deleted = cache_manager.invalidate_tags(post_tag(post_id))
     logger.info(f"Invalidated {total_deleted} cache entries for post {post_id}")
     return total_deleted
 
 
+# Search result caching
+SEARCH_HOT_KEY = 'search_hot'
+HOT_SEARCH_TRACKED = 1000     # Distinct terms kept in the popularity set
+HOT_SEARCH_TTL_MULTIPLIER = 8  # Cap on how much popularity stretches the TTL
+HOT_SEARCH_TRIM_EVERY = 100   # Searches per inline trim of the popularity set, on average
+MAX_SEARCH_TERM_LENGTH = 255  # Longest username or full name; longer terms are cut
+
+
+def normalize_search_term(term: str) -> str:
+    """
+    Case-folded, whitespace-collapsed form used for search keys and
+    lookups, cut to ``MAX_SEARCH_TERM_LENGTH`` so keys and popularity
+    members stay bounded.
+    """
+    return ' '.join(term.casefold().split())[:MAX_SEARCH_TERM_LENGTH].rstrip()
+
+
+def search_cache_key(term: str, limit: int, offset: int) -> str:
+    """Cache key for one page of user search results."""
+    return f"search_results:{normalize_search_term(term)}:{limit}:{offset}"
+
+
+def record_search(term: str) -> float:
+    """
+    Count a search towards its term's popularity; returns the new count.
+    About one search in ``HOT_SEARCH_TRIM_EVERY`` also trims the set to
+    the ``HOT_SEARCH_TRACKED`` most popular terms, so it stays bounded
+    without the warm-up job.
+    """
+    keep = HOT_SEARCH_TRACKED if random.randrange(HOT_SEARCH_TRIM_EVERY) == 0 else None
+    return cache_manager.incr_score(SEARCH_HOT_KEY, normalize_search_term(term), keep=keep)
+
+
+def hot_searches(count: int) -> list:
+    """The ``count`` most searched normalized terms, most popular first."""
+    return cache_manager.top_members(SEARCH_HOT_KEY, count)
+
+
+def _search_base_timeout() -> int:
+    return current_app.config.get('CACHE_TIMEOUTS', {}).get('search_results', 120)
+
+
+def search_timeout(popularity: float) -> int:
+    """
+    TTL for a search page: the configured ``search_results`` timeout,
+    stretched logarithmically for popular terms (up to
+    ``HOT_SEARCH_TTL_MULTIPLIER`` times) so hot queries stay cached.
+    """
+    multiplier = min(1 + math.log2(max(popularity, 1)), HOT_SEARCH_TTL_MULTIPLIER)
+    return int(_search_base_timeout() * multiplier)
+
+
+def hot_search_timeout() -> int:
+    """TTL for pre-warmed pages of the most popular terms."""
+    return _search_base_timeout() * HOT_SEARCH_TTL_MULTIPLIER
+
+
+def warm_hot_searches(results_page: Callable[[str, int], dict], count: int, limit: int) -> list:
+    """
+    Recompute with ``results_page(term, limit)`` and cache the first page
+    of the ``count`` most popular search terms; returns the terms warmed.
+    """
+    terms = hot_searches(count)
+    timeout = hot_search_timeout()
+    for term in terms:
+        cache_manager.set(search_cache_key(term, limit, 0), results_page(term, limit), timeout)
+    return terms
+
+
+def invalidate_search_cache():
+    """Invalidate every cached search page (e.g. after a signup, rename or avatar change)."""
+    deleted = cache_manager.invalidate_tags(namespace_tag('search_results'))
+    logger.info(f"Invalidated {deleted} cached search pages")
+    return deleted
+
+
 # Convenience decorators for common cache types
-user_profile_cache = lambda: smart_cached('user_profile')
-post_details_cache = lambda: smart_cached('post_details')
-post_scroll_cache = lambda: smart_cached('post_scroll')
+user_profile_cache = lambda: smart_cached('user_profile', key_func=user_profile_key, tags_func=profile_tags)
+post_details_cache = lambda: smart_cached('post_details', key_func=post_details_key, tags_func=post_dict_tags)
+post_scroll_cache = lambda: smart_cached('post_scroll', key_func=post_scroll_key, tags_func=post_list_tags)
 explore_posts_cache = lambda: smart_cached('explore_posts')
 search_results_cache = lambda: smart_cached('search_results')
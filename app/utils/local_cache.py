@@ -0,0 +1,78 @@
+"""
+Bounded in-process LRU cache with per-entry TTL.
+Used as a per-worker first tier in front of Redis, so hot reads skip the
+network round trip; entries are bounded by count and by total byte size.
+"""
+
+from collections import OrderedDict
+from typing import Optional, Tuple
+import threading
+import time
+
+
+class LocalCache:
+    """
+    LRU of serialized values keyed by full cache key.
+
+    Values are stored as ``bytes`` so the byte budget is exact and callers
+    always get a fresh object back after deserializing; an entry lives for
+    at most ``ttl`` seconds, which bounds staleness should an invalidation
+    message be lost.
+    """
+
+    def __init__(self, max_items: int, max_bytes: int, ttl: float):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str) -> Optional[bytes]:
+        """The stored bytes for ``key``, or ``None`` if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, timeout: Optional[float] = None) -> None:
+        """Store ``value`` for ``min(timeout, ttl)`` seconds, evicting least recently used entries."""
+        if len(value) > self.max_bytes:
+            self.delete(key)
+            return
+        ttl = self.ttl if timeout is None else min(timeout, self.ttl)
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._bytes += len(value)
+            while len(self._entries) > self.max_items or self._bytes > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+
+    def delete(self, *keys: str) -> None:
+        """Drop ``keys`` if present."""
+        with self._lock:
+            for key in keys:
+                self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[1])
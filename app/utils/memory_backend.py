@@ -0,0 +1,305 @@
+"""
+In-process stand-in for the Redis commands ``CacheManager`` issues.
+Lets caching (TTLs, tag invalidation, locks, stats) run without a Redis
+server in local development, tests and benchmarks. State is per process,
+so it is not a substitute for Redis across several workers.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
+import threading
+import time
+
+# Expired keys are purged lazily on access, and in a sweep every this many writes
+PURGE_INTERVAL = 1000
+
+
+def _str(value) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+def _stop(stop: int, length: int) -> int:
+    """Exclusive slice end for an inclusive, possibly negative, Redis stop index."""
+    return max(length + stop + 1 if stop < 0 else stop + 1, 0)
+
+
+def _bytes(value) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    return str(value).encode()
+
+
+_score = itemgetter(0)
+
+
+class _SortedSet:
+    """
+    A sorted set kept in Redis rank order: ``entries`` is a bisect-maintained
+    list of ``(score, member)`` beside a member -> score dict, so writes and
+    range reads touch only the affected slice instead of re-sorting.
+    """
+
+    __slots__ = ('scores', 'entries')
+
+    def __init__(self):
+        self.scores: Dict[bytes, float] = {}
+        self.entries: List[Tuple[float, bytes]] = []
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, member: bytes, score: float) -> bool:
+        """Set ``member``'s score; True if it was not in the set before."""
+        old = self.scores.get(member)
+        if old is not None:
+            if old == score:
+                return False
+            del self.entries[bisect_left(self.entries, (old, member))]
+        self.scores[member] = score
+        insort(self.entries, (score, member))
+        return old is None
+
+    def span(self, low: float, high: float) -> Tuple[int, int]:
+        """Index range of the entries scored within ``low .. high``."""
+        return (bisect_left(self.entries, low, key=_score),
+                bisect_right(self.entries, high, key=_score))
+
+    def remove_span(self, start: int, end: int) -> int:
+        for _, member in self.entries[start:end]:
+            del self.scores[member]
+        del self.entries[start:end]
+        return end - start
+
+
+class MemoryBackend:
+    """
+    Thread-safe dict of strings, sets and sorted sets with expiry, exposing
+    the redis-py method signatures ``CacheManager`` relies on.
+    """
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[Any, Optional[float]]] = {}
+        self._lock = threading.RLock()
+        self._writes = 0
+
+    # Keyspace helpers
+
+    def _live(self, key) -> Any:
+        key = _str(key)
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def _store(self, key, value, ttl: Optional[float] = None, keep_ttl: bool = False) -> None:
+        key = _str(key)
+        if keep_ttl and key in self._data:
+            expires_at = self._data[key][1]
+        else:
+            expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._data[key] = (value, expires_at)
+        self._writes += 1
+        if self._writes % PURGE_INTERVAL == 0:
+            self._purge()
+
+    def _purge(self) -> None:
+        now = time.monotonic()
+        for key in [k for k, (_, expires_at) in self._data.items()
+                    if expires_at is not None and expires_at <= now]:
+            del self._data[key]
+
+    # Connection
+
+    def ping(self) -> bool:
+        return True
+
+    def info(self) -> Dict[str, Any]:
+        with self._lock:
+            self._purge()
+            size = sum(len(v) for v, _ in self._data.values() if isinstance(v, bytes))
+            return {
+                'redis_version': 'memory',
+                'used_memory_human': f"{size / 1024:.1f}K",
+                'db1': {'keys': len(self._data)},
+            }
+
+    # Strings
+
+    def get(self, key) -> Optional[bytes]:
+        with self._lock:
+            value = self._live(key)
+            return value if isinstance(value, bytes) else None
+
+    def set(self, key, value, ex: Optional[int] = None, nx: bool = False) -> Optional[bool]:
+        with self._lock:
+            if nx and self._live(key) is not None:
+                return None
+            self._store(key, _bytes(value), ex)
+            return True
+
+    def mget(self, keys) -> list:
+        with self._lock:
+            return [self.get(key) for key in keys]
+
+    def setex(self, key, time_seconds: int, value) -> bool:
+        with self._lock:
+            self._store(key, _bytes(value), time_seconds)
+            return True
+
+    def delete(self, *keys) -> int:
+        with self._lock:
+            deleted = 0
+            for key in keys:
+                if self._live(key) is not None:
+                    del self._data[_str(key)]
+                    deleted += 1
+            return deleted
+
+    def expire(self, key, time_seconds: int) -> bool:
+        with self._lock:
+            value = self._live(key)
+            if value is None:
+                return False
+            self._data[_str(key)] = (value, time.monotonic() + time_seconds)
+            return True
+
+    # Sets
+
+    def sadd(self, key, *members) -> int:
+        with self._lock:
+            current = self._live(key)
+            current = set(current) if isinstance(current, set) else set()
+            added = {_bytes(member) for member in members} - current
+            self._store(key, current | added, keep_ttl=True)
+            return len(added)
+
+    def srem(self, key, *members) -> int:
+        with self._lock:
+            current = self._live(key)
+            if not isinstance(current, set):
+                return 0
+            removed = current & {_bytes(member) for member in members}
+            self._store(key, current - removed, keep_ttl=True)
+            return len(removed)
+
+    def smembers(self, key) -> set:
+        with self._lock:
+            value = self._live(key)
+            return set(value) if isinstance(value, set) else set()
+
+    def scard(self, key) -> int:
+        return len(self.smembers(key))
+
+    # Sorted sets
+
+    def _zset(self, key, create: bool = False) -> Optional[_SortedSet]:
+        value = self._live(key)
+        if isinstance(value, _SortedSet):
+            return value
+        return _SortedSet() if create else None
+
+    def zadd(self, key, mapping: Dict[Any, float]) -> int:
+        with self._lock:
+            zset = self._zset(key, create=True)
+            added = sum(zset.add(_bytes(member), float(score)) for member, score in mapping.items())
+            self._store(key, zset, keep_ttl=True)
+            return added
+
+    def zincrby(self, key, amount: float, member) -> float:
+        with self._lock:
+            zset = self._zset(key, create=True)
+            member = _bytes(member)
+            score = zset.scores.get(member, 0) + amount
+            zset.add(member, score)
+            self._store(key, zset, keep_ttl=True)
+            return score
+
+    def _span(self, key, low, high) -> Tuple[Optional[_SortedSet], int, int]:
+        zset = self._zset(key)
+        if zset is None:
+            return None, 0, 0
+        return (zset, *zset.span(float(low), float(high)))
+
+    def zrangebyscore(self, key, low, high) -> list:
+        with self._lock:
+            zset, start, end = self._span(key, low, high)
+            return [member for _, member in zset.entries[start:end]] if zset else []
+
+    def zcount(self, key, low, high) -> int:
+        with self._lock:
+            _, start, end = self._span(key, low, high)
+            return end - start
+
+    def zremrangebyscore(self, key, low, high) -> int:
+        with self._lock:
+            zset, start, end = self._span(key, low, high)
+            if start == end:
+                return 0
+            removed = zset.remove_span(start, end)
+            self._store(key, zset, keep_ttl=True)
+            return removed
+
+    def zrevrange(self, key, start: int, end: int) -> list:
+        with self._lock:
+            zset = self._zset(key)
+            if zset is None:
+                return []
+            last = len(zset) - 1
+            ranks = range(len(zset))[start:_stop(end, len(zset))]
+            return [zset.entries[last - rank][1] for rank in ranks]
+
+    def zremrangebyrank(self, key, start: int, stop: int) -> int:
+        with self._lock:
+            zset = self._zset(key)
+            if zset is None:
+                return 0
+            ranks = range(len(zset))[start:_stop(stop, len(zset))]
+            if not ranks:
+                return 0
+            removed = zset.remove_span(ranks.start, ranks.stop)
+            self._store(key, zset, keep_ttl=True)
+            return removed
+
+    # Scripts, pub/sub, pipelines
+
+    def eval(self, script: str, numkeys: int, *keys_and_args) -> int:
+        """Only the lock release script is supported: compare-and-delete."""
+        key, token = keys_and_args[0], keys_and_args[1]
+        with self._lock:
+            if self.get(key) == _bytes(token):
+                return self.delete(key)
+            return 0
+
+    def publish(self, channel, message) -> int:
+        # No other processes to notify
+        return 0
+
+    def pipeline(self, transaction: bool = True) -> "MemoryPipeline":
+        return MemoryPipeline(self)
+
+
+class MemoryPipeline:
+    """Queues backend calls and runs them together under the backend lock."""
+
+    def __init__(self, backend: MemoryBackend):
+        self._backend = backend
+        self._calls = []
+
+    def __getattr__(self, name):
+        method = getattr(self._backend, name)
+
+        def queue(*args, **kwargs):
+            self._calls.append((method, args, kwargs))
+            return self
+        return queue
+
+    def execute(self) -> list:
+        with self._backend._lock:
+            results = [method(*args, **kwargs) for method, args, kwargs in self._calls]
+        self._calls = []
+        return results
@@ -0,0 +1,121 @@
+"""
+Keyset (cursor) pagination utilities.
+Cursors are opaque tokens encoding the (created_at, id) of the last row on a
+page, so every page is an index range scan instead of an OFFSET scan.
+"""
+
+from typing import Callable, Optional, Tuple
+from datetime import datetime
+import base64
+import json
+
+from flask import request
+from sqlalchemy import DateTime, String, and_, bindparam, or_
+from sqlalchemy.types import TypeDecorator
+
+
+DEFAULT_PAGE_SIZE = 3
+MAX_PAGE_SIZE = 50
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor token cannot be decoded."""
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor."""
+    payload = [created_at.isoformat(), row_id]
+    raw = json.dumps(payload, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor into ``(created_at, id)``."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        created_at = datetime.fromisoformat(payload[0])
+        row_id = int(payload[1])
+    except (ValueError, TypeError, IndexError, KeyError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+    return created_at, row_id
+
+
+def page_args(default_limit: int = DEFAULT_PAGE_SIZE) -> Tuple[Optional[str], int]:
+    """Read ``cursor`` and a clamped ``limit`` from the query string."""
+    cursor = request.args.get('cursor') or None
+    limit = request.args.get('limit', default_limit, type=int)
+    return cursor, max(1, min(limit, MAX_PAGE_SIZE))
+
+
+class CursorTimestamp(TypeDecorator):
+    """
+    Timestamp type for binding cursor values.
+
+    SQLite stores timestamps as text and rows written by ``CURRENT_TIMESTAMP``
+    have no fractional part, so whole-second values are bound without one;
+    otherwise equal timestamps would compare as less-than.
+    """
+
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == 'sqlite':
+            return dialect.type_descriptor(String())
+        return dialect.type_descriptor(DateTime(timezone=True))
+
+    def process_bind_param(self, value, dialect):
+        if value is not None and dialect.name == 'sqlite':
+            fmt = '%Y-%m-%d %H:%M:%S' if value.microsecond == 0 else '%Y-%m-%d %H:%M:%S.%f'
+            return value.strftime(fmt)
+        return value
+
+
+def cursor_timestamp(created_at: datetime):
+    """Bind a cursor timestamp so it compares exactly against stored values."""
+    return bindparam(None, created_at, type_=CursorTimestamp(), unique=True)
+
+
+def same_instant(created_col, created_at: datetime):
+    """Rows whose ``created_col`` equals the cursor timestamp."""
+    clause = created_col == cursor_timestamp(created_at)
+    if created_at.microsecond == 0:
+        # Whole seconds written through the ORM carry a '.000000' suffix on SQLite
+        clause = or_(clause, created_col == bindparam(None, created_at, type_=created_col.type, unique=True))
+    return clause
+
+
+def keyset_before(created_col, id_col, created_at: datetime, row_id: int):
+    """Rows strictly after ``(created_at, id)`` in ``created_at DESC, id DESC`` order."""
+    return or_(
+        created_col < cursor_timestamp(created_at),
+        and_(same_instant(created_col, created_at), id_col < row_id),
+    )
+
+
+def keyset_page(query, created_col, id_col, cursor: Optional[str], limit: int,
+                row_key: Optional[Callable] = None) -> Tuple[list, Optional[str]]:
+    """
+    Fetch one page of ``query`` ordered newest first.
+
+    Returns the rows and the cursor for the next page (``None`` on the last
+    page). Fetches ``limit + 1`` rows to detect the end without a COUNT.
+    ``row_key`` maps a row to its ``(created_at, id)`` when the sort columns
+    are not attributes of the returned rows (e.g. when ordering by a join).
+    """
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.filter(keyset_before(created_col, id_col, created_at, row_id))
+
+    rows = query.order_by(created_col.desc(), id_col.desc()).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        if row_key:
+            next_cursor = encode_cursor(*row_key(last))
+        else:
+            next_cursor = encode_cursor(getattr(last, created_col.key), getattr(last, id_col.key))
+    return rows, next_cursor
@@ -0,0 +1,98 @@
+"""
+In-memory prefix index for type-ahead lookups.
+Keys are held in one sorted list, so a prefix query is a ``bisect`` to the
+first candidate followed by a short forward walk; no database round trip.
+"""
+
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import threading
+import time
+
+
+def normalize_key(value: Optional[str]) -> str:
+    """Case-insensitive form a key is stored and queried under."""
+    return (value or "").strip().casefold()
+
+
+class PrefixIndex:
+    """
+    Sorted ``(key, item_id)`` pairs with a payload per item.
+
+    An item may be stored under several keys (e.g. a username and each word
+    of a full name); a search returns each matching item once, in key order.
+    """
+
+    def __init__(self):
+        self._keys: List[Tuple[str, int]] = []
+        self._items: Dict[int, Tuple[Tuple[str, ...], Any]] = {}
+        self._lock = threading.RLock()
+        self.loaded_at: Optional[float] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self.loaded_at is not None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @staticmethod
+    def _normalize(keys: Iterable[str]) -> Tuple[str, ...]:
+        return tuple(sorted({normalize_key(key) for key in keys} - {""}))
+
+    def load(self, items: Iterable[Tuple[int, Iterable[str], Any]]) -> None:
+        """Replace the whole index with ``(item_id, keys, payload)`` triples."""
+        entries = []
+        item_map = {}
+        for item_id, keys, payload in items:
+            normalized = self._normalize(keys)
+            item_map[item_id] = (normalized, payload)
+            entries.extend((key, item_id) for key in normalized)
+        entries.sort()
+        with self._lock:
+            self._keys = entries
+            self._items = item_map
+            self.loaded_at = time.monotonic()
+
+    def put(self, item_id: int, keys: Iterable[str], payload: Any) -> None:
+        """Insert or replace one item."""
+        normalized = self._normalize(keys)
+        with self._lock:
+            self._discard(item_id)
+            for key in normalized:
+                insort(self._keys, (key, item_id))
+            self._items[item_id] = (normalized, payload)
+
+    def remove(self, item_id: int) -> None:
+        """Drop one item, if present."""
+        with self._lock:
+            self._discard(item_id)
+
+    def _discard(self, item_id: int) -> None:
+        previous = self._items.pop(item_id, None)
+        if previous is None:
+            return
+        for key in previous[0]:
+            position = bisect_left(self._keys, (key, item_id))
+            if position < len(self._keys) and self._keys[position] == (key, item_id):
+                del self._keys[position]
+
+    def search(self, prefix: str, limit: int) -> List[Any]:
+        """Payloads of up to ``limit`` items with a key starting with ``prefix``."""
+        prefix = normalize_key(prefix)
+        if not prefix or limit <= 0:
+            return []
+
+        results = []
+        seen = set()
+        with self._lock:
+            position = bisect_left(self._keys, (prefix,))
+            while position < len(self._keys) and len(results) < limit:
+                key, item_id = self._keys[position]
+                if not key.startswith(prefix):
+                    break
+                if item_id not in seen:
+                    seen.add(item_id)
+                    results.append(self._items[item_id][1])
+                position += 1
+        return results
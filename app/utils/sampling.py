@@ -0,0 +1,59 @@
+"""
+Seeded random sampling utilities.
+Explore pages walk a pseudo-random permutation of the post id range instead
+of sorting the posts table with ``ORDER BY random()``; each page is a
+primary-key ``IN`` lookup, so its cost does not grow with the table.
+"""
+
+from typing import List, Optional
+import random
+
+FEISTEL_ROUNDS = 4
+_MIX = 0x45D9F3B
+
+
+class IdPermutation:
+    """
+    Keyed permutation of ids ``1..span``: a small Feistel network over the
+    next power of four, cycle-walked back into the span.
+
+    Unlike an affine map, neighbouring positions land on unrelated ids. The
+    same ``(seed, span)`` always yields the same order, so a session can page
+    through it by position without repeating or skipping ids.
+    """
+
+    def __init__(self, seed: int, span: int):
+        self.seed = seed
+        self.span = max(span, 0)
+        rng = random.Random(seed)
+        self.half_bits = max(1, ((self.span - 1).bit_length() + 1) // 2)
+        self.keys = [rng.getrandbits(32) for _ in range(FEISTEL_ROUNDS)]
+
+    def _round(self, value: int, key: int) -> int:
+        value = ((value ^ key) * _MIX) & 0xFFFFFFFF
+        value ^= value >> 16
+        return (value * _MIX) & 0xFFFFFFFF
+
+    def _encrypt(self, value: int) -> int:
+        mask = (1 << self.half_bits) - 1
+        left, right = value >> self.half_bits, value & mask
+        for key in self.keys:
+            left, right = right, left ^ (self._round(right, key) & mask)
+        return (left << self.half_bits) | right
+
+    def position_id(self, position: int) -> int:
+        """Id at one permutation position; the domain is under 4x the span, so few walks."""
+        value = self._encrypt(position)
+        while value >= self.span:
+            value = self._encrypt(value)
+        return value + 1
+
+    def ids(self, start: int, count: int) -> List[int]:
+        """Ids at permutation positions ``start .. start + count`` (clipped to the span)."""
+        end = min(start + count, self.span)
+        return [self.position_id(p) for p in range(start, end)]
+
+
+def new_seed(rng: Optional[random.Random] = None) -> int:
+    """A fresh 32-bit seed for a sampling session."""
+    return (rng or random).getrandbits(32)
@@ -0,0 +1,180 @@
+"""
+Value encodings for the cache layer.
+Route payloads are plain dicts and lists of JSON types, so a compact data
+format is smaller and faster than pickle, and decoding it cannot execute
+code planted in a shared cache.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+import json
+import pickle
+import time
+import zlib
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+
+class Serializer(ABC):
+    """Encodes cache values to ``bytes`` and back."""
+
+    name = ""
+
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        """Encode ``value``."""
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """Decode bytes produced by ``dumps``."""
+
+
+class PickleSerializer(Serializer):
+    """Any Python object; only safe when every cache writer is trusted."""
+
+    name = "pickle"
+
+    def dumps(self, value: Any) -> bytes:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def loads(self, data: bytes) -> Any:
+        return pickle.loads(data)
+
+
+class JSONSerializer(Serializer):
+    """Compact JSON, via ``orjson`` when installed. Tuples come back as lists."""
+
+    name = "json"
+
+    def dumps(self, value: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(value)
+        return json.dumps(value, separators=(",", ":")).encode()
+
+    def loads(self, data: bytes) -> Any:
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+
+
+class MsgpackSerializer(Serializer):
+    """MessagePack; requires the optional ``msgpack`` package."""
+
+    name = "msgpack"
+
+    def __init__(self):
+        if msgpack is None:
+            raise ImportError("The 'msgpack' serializer requires the msgpack package")
+
+    def dumps(self, value: Any) -> bytes:
+        return msgpack.packb(value, use_bin_type=True)
+
+    def loads(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, raw=False)
+
+
+SERIALIZERS = {
+    "pickle": PickleSerializer,
+    "json": JSONSerializer,
+    "msgpack": MsgpackSerializer,
+}
+
+# Leading byte of every encoded value: how the rest is compressed
+RAW = b"\x00"
+COMPRESSORS = {
+    "zlib": (b"z", lambda data: zlib.compress(data, 6), zlib.decompress),
+}
+if lz4_frame is not None:
+    COMPRESSORS["lz4"] = (b"4", lz4_frame.compress, lz4_frame.decompress)
+_DECOMPRESSORS = {header: decompress for header, _, decompress in COMPRESSORS.values()}
+
+
+class CacheCodec:
+    """
+    A serializer plus optional compression of values at least
+    ``compress_min_bytes`` long. Each encoded value carries a one-byte
+    header, so compressed and raw values can be read by any configuration.
+    """
+
+    def __init__(self, serializer: str = "json", compression: Optional[str] = None,
+                 compress_min_bytes: int = 1024):
+        if serializer not in SERIALIZERS:
+            raise ValueError(f"Unknown cache serializer: {serializer}")
+        if compression and compression not in COMPRESSORS:
+            raise ValueError(f"Unavailable cache compression: {compression}")
+        self.serializer = SERIALIZERS[serializer]()
+        self.compression = compression or None
+        self.compress_min_bytes = compress_min_bytes
+
+    @property
+    def name(self) -> str:
+        if self.compression:
+            return f"{self.serializer.name}+{self.compression}"
+        return self.serializer.name
+
+    def dumps(self, value: Any) -> bytes:
+        data = self.serializer.dumps(value)
+        if self.compression and len(data) >= self.compress_min_bytes:
+            header, compress, _ = COMPRESSORS[self.compression]
+            return header + compress(data)
+        return RAW + data
+
+    def loads(self, data: bytes) -> Any:
+        header, body = data[:1], data[1:]
+        if header != RAW:
+            body = _DECOMPRESSORS[header](body)
+        return self.serializer.loads(body)
+
+
+def available_codecs(compress_min_bytes: int = 1024) -> Dict[str, CacheCodec]:
+    """Every serializer and compression combination usable in this environment."""
+    codecs = {}
+    for serializer in SERIALIZERS:
+        for compression in (None, *COMPRESSORS):
+            try:
+                codec = CacheCodec(serializer, compression, compress_min_bytes)
+            except ImportError:
+                continue
+            codecs[codec.name] = codec
+    return codecs
+
+
+def benchmark(codecs: Dict[str, CacheCodec], payloads: list, rounds: int = 100) -> list:
+    """
+    Encoded size and mean encode/decode time per payload for each codec,
+    smallest encoding first.
+    """
+    results = []
+    for name, codec in codecs.items():
+        encoded = [codec.dumps(payload) for payload in payloads]
+        started = time.perf_counter()
+        for _ in range(rounds):
+            for payload in payloads:
+                codec.dumps(payload)
+        encode_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        for _ in range(rounds):
+            for data in encoded:
+                codec.loads(data)
+        decode_seconds = time.perf_counter() - started
+        calls = rounds * len(payloads)
+        results.append({
+            "codec": name,
+            "bytes": sum(len(data) for data in encoded),
+            "encode_us": encode_seconds / calls * 1e6,
+            "decode_us": decode_seconds / calls * 1e6,
+        })
+    return sorted(results, key=lambda row: row["bytes"])
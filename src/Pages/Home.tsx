@@ -83,7 +83,6 @@ const Home: React.FC = () => {
         const postForComponent = {
           ...post,
           comments: post.comments ?? [],
-          likes: post.likes ?? [],
         };
         nodeList.push(
           <Post key={`feedPost-${postId}`} post={postForComponent} />
@@ -54,6 +54,11 @@ const Profile: React.FC = () => {
           posts: profileResponse.data.posts ?? [],
           followers: profileResponse.data.followersList ?? [],
           following: profileResponse.data.followingList ?? [],
+          // The lists above are first pages; the header shows the counters
+          numPosts: profileResponse.data.numPosts ?? 0,
+          followerCount: profileResponse.data.followerCount ?? 0,
+          followingCount: profileResponse.data.followingCount ?? 0,
+          postsNextCursor: profileResponse.data.postsNextCursor ?? null,
         };
 
         setProfileData(profileUser);
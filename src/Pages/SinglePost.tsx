@@ -11,7 +11,7 @@ import { useApi } from '../utils/apiComposable';
 
 const SinglePost: React.FC = () => {
   const { postId } = useParams<{ postId?: string }>();
-  const { posts } = usePosts();
+  const { posts, setPosts } = usePosts();
   const { getPost } = useApi();
   const [post, setPost] = useState<PostDetail | null>(null);
 
@@ -21,8 +21,11 @@ const SinglePost: React.FC = () => {
     const loadPost = async () => {
       try {
         const response = await getPost(parseInt(postId));
-        if (response.data?.post) {
-          setPost(response.data.post);
+        const fetched = response.data?.post;
+        if (fetched) {
+          // Keep it in context so like toggles update its count and state
+          setPosts((currentPosts) => ({ ...currentPosts, [fetched.id]: fetched }));
+          setPost(fetched);
         }
       } catch (error) {
         console.error('Error loading post:', error);
@@ -37,7 +40,7 @@ const SinglePost: React.FC = () => {
       // If not in context, fetch from API
       loadPost();
     }
-  }, [postId, posts, getPost]);
+  }, [postId, posts, setPosts, getPost]);
 
   if (!post?.user) {
     return <div>Loading...</div>;
@@ -60,7 +63,7 @@ const SinglePost: React.FC = () => {
           comments={post.comments ?? []}
           createdAt={post.createdAt}
           isSinglePost={true}
-          likes={post.likes ?? []}
+          likeCount={post.likeCount ?? 0}
           caption={post.caption ?? ''}
         />
         <CommentInputField id={post.id} isSinglePost={true} />
@@ -32,7 +32,7 @@ const mockPost = {
     username: 'testuser',
     profile_image_url: 'https://example.com/profile.jpg',
   },
-  likes: [],
+  likeCount: 0,
   comments: [],
   created_at: '2023-01-01T00:00:00Z',
 };
@@ -94,7 +94,7 @@ describe('Post Component', () => {
     });
 
     it('renders post with likes count', () => {
-      const postWithLikes = { ...mockPost, likes: [{ id: 1 }, { id: 2 }] };
+      const postWithLikes = { ...mockPost, likeCount: 2 };
       renderWithProviders(<Post post={postWithLikes} />);
 
       expect(screen.getByText('2 likes')).toBeInTheDocument();
@@ -185,7 +185,7 @@ describe('Post Component', () => {
     it('renders efficiently with large data', () => {
       const largePost = {
         ...mockPost,
-        likes: Array.from({ length: 1000 }, (_, i) => ({ id: i })),
+        likeCount: 1000,
         comments: Array.from({ length: 1000 }, (_, i) => ({
           id: i,
           text: `Comment ${i}`,
@@ -36,8 +36,8 @@ jest.mock('../../../utils/apiComposable', () => ({
   useApi: () => ({
     followUser: jest.fn(),
     unfollowUser: jest.fn(),
-    getFollowing: jest.fn().mockResolvedValue({
-      data: { follows: [] },
+    getRelationships: jest.fn().mockResolvedValue({
+      data: { viewerId: 1, following: [], likedPosts: [], likedComments: [] },
       error: null,
     }),
     logout: jest.fn(),
@@ -58,6 +58,9 @@ let mockProfileData = {
   posts: [],
   followers: [],
   following: [],
+  numPosts: 0,
+  followerCount: 0,
+  followingCount: 0,
   createdAt: new Date().toISOString(),
   updatedAt: new Date().toISOString(),
 };
@@ -112,6 +115,9 @@ describe('ProfileHeader Component', () => {
       posts: [],
       followers: [],
       following: [],
+      numPosts: 0,
+      followerCount: 0,
+      followingCount: 0,
       createdAt: new Date().toISOString(),
       updatedAt: new Date().toISOString(),
     };
@@ -132,6 +138,19 @@ describe('ProfileHeader Component', () => {
       expect(screen.getByText('This is a test bio')).toBeInTheDocument();
     });
 
+    it('shows the stored counters rather than the first-page list lengths', () => {
+      mockProfileData.numPosts = 57;
+      mockProfileData.followerCount = 1234;
+      mockProfileData.followingCount = 89;
+      renderWithProviders(<ProfileHeader windowSize={1024} />, {
+        initialUser: mockUser,
+      });
+
+      expect(screen.getByText('57')).toBeInTheDocument();
+      expect(screen.getByText('1234')).toBeInTheDocument();
+      expect(screen.getByText('89')).toBeInTheDocument();
+    });
+
     it('renders profile image when available', () => {
       renderWithProviders(<ProfileHeader windowSize={1024} />, {
         initialUser: mockUser,
@@ -297,6 +316,9 @@ describe('ProfileHeader Component', () => {
         posts: [],
         followers: [],
         following: [],
+        numPosts: 0,
+        followerCount: 0,
+        followingCount: 0,
         createdAt: new Date().toISOString(),
         updatedAt: new Date().toISOString(),
       };
@@ -1,4 +1,5 @@
 import React, { useContext, useEffect, useState } from 'react';
+import InfiniteScroll from 'react-infinite-scroll-component';
 import { Link } from 'react-router-dom';
 import { useUser } from '../hooks/useContexts';
 import { ProfileContext } from '../Contexts/profileContext';
@@ -24,13 +25,15 @@ const DynamicModal: React.FC<DynamicModalProps> = (props) => {
   const [userArray, setUserArray] = useState<User[]>([]);
   const [currentUserFollows, setCurrentUserFollows] = useState<number[]>([]);
   const [endpoint, setEndpoint] = useState<string>('');
+  const [nextCursor, setNextCursor] = useState<string | null>(null); // follow lists only
 
   const { currentUser } = useUser();
   const profileContext = useContext(ProfileContext);
   const {
     followUser,
     unfollowUser,
-    getFollowing,
+    getProfileFollows,
+    getRelationships,
     isLoading,
     error,
     clearError,
@@ -44,50 +47,73 @@ const DynamicModal: React.FC<DynamicModalProps> = (props) => {
 
   const { profileData, setProfileData } = profileContext;
   const id = profileData?.id ?? 0;
-
-  useEffect(() => {
-    if (!currentUser?.id) {
+  const followList =
+    title === 'Followers'
+      ? 'followers'
+      : title === 'Following'
+        ? 'following'
+        : null;
+
+  // Follow state of just the listed users, one bulk lookup per loaded page
+  const loadFollowState = async (userIds: number[]) => {
+    if (!currentUser?.id || userIds.length === 0) return;
+
+    const response = await getRelationships({
+      viewerId: currentUser.id,
+      userIds,
+    });
+    if (response.error || !response.data) {
+      console.error('Failed to load follow state:', response.error);
       return;
     }
 
-    const loadFollowing = async () => {
-      try {
-        const response = await getFollowing(currentUser.id);
-
-        if (response.error) {
-          console.error('Failed to load following:', response.error);
-          return;
-        }
-
-        if (response.data?.follows) {
-          const userIds = response.data.follows.map(
-            (follow: Follow) => follow.userFollowedId
-          );
-          setCurrentUserFollows(userIds);
-        }
-      } catch (error) {
-        console.error('Error loading following:', error);
-      }
-    };
-
-    loadFollowing();
-  }, [currentUser?.id, getFollowing]);
+    const following = response.data.following;
+    setCurrentUserFollows((current) => [
+      ...current.filter((userId) => !userIds.includes(userId)),
+      ...following,
+    ]);
+  };
 
   useEffect(() => {
-    let url;
+    let url = '';
     if (title === 'Likes' && type === 'post') {
       url = `post/${id}`;
     } else if (title === 'Likes' && type === 'comment') {
       url = `comment/${id}`;
-    } else if (title === 'Followers') {
-      url = `follow/${id}`;
-    } else {
-      url = `follow/${id}/following`;
     }
     setEndpoint(url);
   }, [id, title, type]);
 
+  // Follow lists page through /api/profile/<username>/<list> by next_cursor
+  const loadFollows = async (cursor: string | null) => {
+    if (!followList || !profileData) return;
+
+    const response = await getProfileFollows(
+      profileData.username,
+      followList,
+      cursor
+    );
+    if (response.error || !response.data) {
+      console.error('Failed to load follows:', response.error);
+      return;
+    }
+
+    const users = response.data.follows.map((follow: Follow) => ({
+      id: follow.user.id,
+      username: follow.user.username,
+      fullName: follow.user.fullName,
+      profileImageUrl: follow.user.profileImageUrl ?? '',
+    }));
+    setUserArray((current) => (cursor ? [...current, ...users] : users));
+    setNextCursor(response.data.nextCursor);
+    await loadFollowState(users.map((user) => user.id));
+  };
+
   useEffect(() => {
+    if (followList) {
+      loadFollows(null);
+      return;
+    }
     if (!endpoint) {
       return;
     }
@@ -104,13 +130,14 @@ const DynamicModal: React.FC<DynamicModalProps> = (props) => {
 
         const responseData = (await response.json()) as { users: User[] };
         setUserArray(responseData.users);
+        await loadFollowState(responseData.users.map((user) => user.id));
       } catch (error) {
         console.error('Error loading users:', error);
       }
     };
 
     loadUsers();
-  }, [currentUserFollows, endpoint]);
+  }, [endpoint, followList, profileData?.username]); // eslint-disable-line react-hooks/exhaustive-deps
 
   const handleFollowUser = async (
     e: React.MouseEvent<HTMLButtonElement>,
@@ -145,6 +172,7 @@ const DynamicModal: React.FC<DynamicModalProps> = (props) => {
           setProfileData({
             ...profileData,
             following: updatedFollowingList,
+            followingCount: (profileData.followingCount ?? 0) + 1,
           });
         }
       }
@@ -190,6 +218,7 @@ const DynamicModal: React.FC<DynamicModalProps> = (props) => {
         setProfileData({
           ...profileData,
           following: updatedFollowingList,
+          followingCount: Math.max((profileData.followingCount ?? 0) - 1, 0),
         });
       }
     } catch (error) {
@@ -212,55 +241,63 @@ const DynamicModal: React.FC<DynamicModalProps> = (props) => {
       <h1 className='px-8 pt-8 pb-4 border-b border-gray-300 m-0 text-gray-800 text-base font-bold text-center'>
         {title}
       </h1>
-      {userArray.map((user) => {
-        const { username, fullName, id, profileImageUrl: profileImg } = user;
-        return (
-          <div
-            key={`userRow ${id}`}
-            className='px-4 py-2 flex flex-row items-center justify-between'
-          >
-            <div className='flex flex-row items-center'>
-              <Link onClick={() => closeModal()} to={`/profile/${id}`}>
-                <img
-                  className='h-8 w-8 rounded-full mr-3'
-                  src={profileImg}
-                  alt='user profile'
-                />
-              </Link>
-
-              <div>
+      <InfiniteScroll
+        dataLength={userArray.length}
+        next={() => loadFollows(nextCursor)}
+        hasMore={nextCursor !== null}
+        loader={<div className='text-center py-2 text-sm'>Loading...</div>}
+        height={280}
+      >
+        {userArray.map((user) => {
+          const { username, fullName, id, profileImageUrl: profileImg } = user;
+          return (
+            <div
+              key={`userRow ${id}`}
+              className='px-4 py-2 flex flex-row items-center justify-between'
+            >
+              <div className='flex flex-row items-center'>
                 <Link onClick={() => closeModal()} to={`/profile/${id}`}>
-                  <div className='w-24 whitespace-nowrap overflow-hidden text-ellipsis text-sm font-bold text-gray-800'>
-                    {username}
-                  </div>
+                  <img
+                    className='h-8 w-8 rounded-full mr-3'
+                    src={profileImg}
+                    alt='user profile'
+                  />
                 </Link>
-                <div className='w-24 whitespace-nowrap overflow-hidden text-ellipsis text-sm text-gray-500'>
-                  {fullName}
+
+                <div>
+                  <Link onClick={() => closeModal()} to={`/profile/${id}`}>
+                    <div className='w-24 whitespace-nowrap overflow-hidden text-ellipsis text-sm font-bold text-gray-800'>
+                      {username}
+                    </div>
+                  </Link>
+                  <div className='w-24 whitespace-nowrap overflow-hidden text-ellipsis text-sm text-gray-500'>
+                    {fullName}
+                  </div>
                 </div>
               </div>
+              {currentUser?.id === id ? (
+                ''
+              ) : currentUserFollows.includes(id) ? (
+                <button
+                  onClick={(e) => handleUnfollowUser(e, id)}
+                  className='px-4 py-1.5 bg-white text-gray-800 font-bold border border-gray-300 rounded cursor-pointer text-sm hover:bg-gray-50 transition-colors outline-none disabled:opacity-50 disabled:cursor-not-allowed'
+                  disabled={isLoading}
+                >
+                  {isLoading ? 'Unfollowing...' : 'Following'}
+                </button>
+              ) : (
+                <button
+                  onClick={(e) => handleFollowUser(e, id)}
+                  className='px-4 py-1.5 bg-blue-500 text-white font-bold border-none rounded cursor-pointer text-sm hover:bg-blue-600 transition-colors disabled:opacity-50 disabled:cursor-not-allowed'
+                  disabled={isLoading}
+                >
+                  {isLoading ? 'Following...' : 'Follow'}
+                </button>
+              )}
             </div>
-            {currentUser?.id === id ? (
-              ''
-            ) : currentUserFollows.includes(id) ? (
-              <button
-                onClick={(e) => handleUnfollowUser(e, id)}
-                className='px-4 py-1.5 bg-white text-gray-800 font-bold border border-gray-300 rounded cursor-pointer text-sm hover:bg-gray-50 transition-colors outline-none disabled:opacity-50 disabled:cursor-not-allowed'
-                disabled={isLoading}
-              >
-                {isLoading ? 'Unfollowing...' : 'Following'}
-              </button>
-            ) : (
-              <button
-                onClick={(e) => handleFollowUser(e, id)}
-                className='px-4 py-1.5 bg-blue-500 text-white font-bold border-none rounded cursor-pointer text-sm hover:bg-blue-600 transition-colors disabled:opacity-50 disabled:cursor-not-allowed'
-                disabled={isLoading}
-              >
-                {isLoading ? 'Following...' : 'Follow'}
-              </button>
-            )}
-          </div>
-        );
-      })}
+          );
+        })}
+      </InfiniteScroll>
     </div>
   );
 };
@@ -16,6 +16,7 @@ const ExploreGrid: React.FC = () => {
   const [hasMore, setHasMore] = useState<boolean>(true);
   const [loading, setLoading] = useState<boolean>(false);
   const totalPostsLoadedRef = useRef<number>(0);
+  const cursorRef = useRef<string | null>(null); // next_cursor of the last page
   const componentCounterRef = useRef<number>(0);
   const fetchingRef = useRef<boolean>(false); // Immediate lock to prevent race conditions
   const initialLoadCompleteRef = useRef<boolean>(false); // Track if we've done initial bulk loading
@@ -44,11 +45,12 @@ const ExploreGrid: React.FC = () => {
     const minComponentsNeeded = 4; // Load at least 4 layout components (12+ posts)
     let componentsLoaded = 0;
     let currentOffset = 0;
+    let cursor: string | null = null;
     let stillHasMore = true;
 
     try {
       while (componentsLoaded < minComponentsNeeded && stillHasMore) {
-        const response = await getExplorePosts(currentOffset);
+        const response = await getExplorePosts(currentOffset, cursor);
 
         if (response.error) {
           console.error('Failed to load explore posts:', response.error);
@@ -56,14 +58,12 @@ const ExploreGrid: React.FC = () => {
         }
 
         const photoArray = response.data?.posts || [];
+        // The server reports the end of the feed; a short page is not the end
+        cursor = response.data?.nextCursor ?? null;
+        stillHasMore = cursor !== null;
 
         if (photoArray.length === 0) {
-          stillHasMore = false;
-          break;
-        }
-
-        if (photoArray.length < 3) {
-          stillHasMore = false;
+          continue;
         }
 
         const componentToRender = getTemplate(photoArray);
@@ -78,6 +78,7 @@ const ExploreGrid: React.FC = () => {
       }
 
       totalPostsLoadedRef.current = currentOffset;
+      cursorRef.current = cursor;
       setHasMore(stillHasMore);
       initialLoadCompleteRef.current = true;
     } catch (error) {
@@ -137,7 +138,7 @@ const ExploreGrid: React.FC = () => {
     totalPostsLoadedRef.current = currentOffset + 3; // Reserve 3 spots optimistically
 
     try {
-      const response = await getExplorePosts(currentOffset);
+      const response = await getExplorePosts(currentOffset, cursorRef.current);
 
       if (response.error) {
         console.error('Failed to fetch more posts:', response.error);
@@ -148,19 +149,18 @@ const ExploreGrid: React.FC = () => {
       }
 
       const photoArray = response.data?.posts || [];
+      cursorRef.current = response.data?.nextCursor ?? null;
+      if (cursorRef.current === null) {
+        setHasMore(false);
+      }
 
       if (photoArray.length === 0) {
         totalPostsLoadedRef.current = currentOffset; // Reset
-        setHasMore(false);
         setLoading(false);
         fetchingRef.current = false;
         return;
       }
 
-      if (photoArray.length < 3) {
-        setHasMore(false);
-      }
-
       // Adjust the counter to the actual number received
       totalPostsLoadedRef.current = currentOffset + photoArray.length;
 
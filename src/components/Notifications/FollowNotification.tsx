@@ -1,4 +1,4 @@
-import React, { useContext, useState, useEffect, CSSProperties } from 'react';
+import React, { useContext, useState, CSSProperties } from 'react';
 import { ProfileContext } from '../../Contexts';
 import { useUser } from '../../hooks/useContexts';
 import { useApi } from '../../utils/apiComposable';
@@ -14,29 +14,19 @@ interface FollowNotificationProps {
     profileImageUrl: string;
   };
   post?: Post;
+  isFollowing?: boolean; // Viewer already follows user (from a bulk relationships lookup)
 }
 
 const FollowNotification: React.FC<FollowNotificationProps> = ({
   style,
   user,
+  isFollowing = false,
 }) => {
   const { currentUser } = useUser();
   const profileContext = useContext(ProfileContext);
-  const [followingList, setFollowingList] = useState<number[]>([]);
+  const [following, setFollowing] = useState<boolean>(isFollowing);
   const { followUser, unfollowUser, isLoading, error, clearError } = useApi();
 
-  // All hooks must be called before any conditional returns
-  useEffect(() => {
-    if (!profileContext?.profileData) {
-      return;
-    }
-    const resFollowingList =
-      profileContext.profileData.following?.map((followingEntry: Follow) => {
-        return followingEntry.userFollowedId;
-      }) ?? [];
-    setFollowingList(resFollowingList);
-  }, [profileContext?.profileData]);
-
   // Handle undefined context after all hooks are called
   if (!profileContext) {
     return null;
@@ -62,6 +52,7 @@ const FollowNotification: React.FC<FollowNotificationProps> = ({
         return;
       }
 
+      setFollowing(true);
       if (response.data?.follow) {
         const updatesList = [
           ...(profileData?.following ?? []),
@@ -97,6 +88,7 @@ const FollowNotification: React.FC<FollowNotificationProps> = ({
         return;
       }
 
+      setFollowing(false);
       const filteredList = (profileData?.following ?? []).filter(
         (user: Follow) => user.userFollowedId !== user.id
       );
@@ -111,10 +103,6 @@ const FollowNotification: React.FC<FollowNotificationProps> = ({
     }
   };
 
-  if (!followingList) {
-    return null;
-  }
-
   return (
     <div
       className='flex justify-between items-center p-1.5 border-b border-gray-300 h-12 w-full object-cover animate-fadeIn'
@@ -142,7 +130,7 @@ const FollowNotification: React.FC<FollowNotificationProps> = ({
           </a>
           started following you!
         </p>
-        {followingList.includes(user.id) ? (
+        {following ? (
           <div>
             <button
               className='h-6 bg-transparent px-2 py-1 border border-gray-300 rounded-sm text-xs font-bold w-[85px] hover:bg-gray-50 transition-colors disabled:opacity-50 disabled:cursor-not-allowed'
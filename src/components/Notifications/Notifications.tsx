@@ -19,7 +19,7 @@ interface Notification {
 const Notifications: React.FC = () => {
   const { currentUser } = useUser();
   const profileContext = useContext(ProfileContext);
-  const { isLoading, error, clearError } = useApi();
+  const { getRelationships, isLoading, error, clearError } = useApi();
 
   if (!profileContext) {
     throw new Error(
@@ -84,6 +84,20 @@ const Notifications: React.FC = () => {
       const responseData = (await response.json()) as { notes: Notification[] };
       const { notes } = responseData;
 
+      // Follow-back state for this page's followers in one bulk lookup
+      const followerIds = notes
+        .filter((notification) => notification.type === 'follow')
+        .map((notification) => notification.user?.id)
+        .filter((id): id is number => id !== undefined);
+      let followedBack: number[] = [];
+      if (followerIds.length > 0) {
+        const relationships = await getRelationships({
+          viewerId: currentUser.id,
+          userIds: followerIds,
+        });
+        followedBack = relationships.data?.following ?? [];
+      }
+
       const nodeList = notes
         .filter(
           (notification) =>
@@ -124,6 +138,7 @@ const Notifications: React.FC = () => {
                 <FollowNotification
                   style={style}
                   user={user}
+                  isFollowing={followedBack.includes(user.id)}
                   key={`${notification.type}-${notification.id}`}
                 />
               );
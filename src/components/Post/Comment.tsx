@@ -1,9 +1,8 @@
 import React from 'react';
 import { Link } from 'react-router-dom';
 import { RiHeartLine } from 'react-icons/ri';
-import { useLikes, usePosts, useUser } from '../../hooks/useContexts';
+import { useLikes, useUser } from '../../hooks/useContexts';
 import { toast } from 'react-toastify';
-import { Like } from '../../types';
 import { useApi } from '../../utils/apiComposable';
 import type { ToggleLikeRequest } from '../../types/api';
 
@@ -15,10 +14,9 @@ interface CommentProps {
   id: number;
 }
 
-const Comment: React.FC<CommentProps> = ({ username, content, postId, id }) => {
+const Comment: React.FC<CommentProps> = ({ username, content, id }) => {
   const { currentUser } = useUser();
   const { likes, setLikes } = useLikes();
-  const { setPosts } = usePosts();
   const { toggleLike, isLoading, error, clearError } = useApi();
 
   const likeComment = async () => {
@@ -81,17 +79,6 @@ const Comment: React.FC<CommentProps> = ({ username, content, postId, id }) => {
         delete newLikes[`comment-${id}`];
         setLikes(newLikes);
 
-        setPosts((posts) => {
-          const newPost = { ...posts[postId] };
-          const filtered = (newPost.likes ?? []).filter(
-            (ele: Like) => ele.likeableId !== id
-          );
-          return {
-            ...posts,
-            [postId]: { ...posts[postId], likes: filtered },
-          };
-        });
-
         toast.info('Unliked comment!', { autoClose: 1500 });
       }
     } catch (error) {
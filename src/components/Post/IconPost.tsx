@@ -5,7 +5,6 @@ import { Link } from 'react-router-dom';
 import { useLikes, usePosts, useUser } from '../../hooks/useContexts';
 import { toast } from 'react-toastify';
 import { useApi } from '../../utils/apiComposable';
-import { Like } from '../../types';
 import type { ToggleLikeRequest } from '../../types/api';
 
 interface IconPostProps {
@@ -16,9 +15,13 @@ interface IconPostProps {
 const IconPost: React.FC<IconPostProps> = ({ id: postId, isSinglePost }) => {
   const { currentUser } = useUser();
   const { likes, setLikes } = useLikes();
-  const { setPosts } = usePosts();
+  const { posts, setPosts } = usePosts();
   const { toggleLike, isLoading, error, clearError } = useApi();
 
+  const likeKey = `post-${postId}`;
+  // Feed payloads carry viewerHasLiked; the likes context covers other pages
+  const liked = Boolean(likes?.[likeKey] ?? posts[postId]?.viewerHasLiked);
+
   const likePost = async () => {
     if (!currentUser?.id) return;
 
@@ -40,10 +43,9 @@ const IconPost: React.FC<IconPostProps> = ({ id: postId, isSinglePost }) => {
       if (response.data?.liked) {
         // Note: This may need adjustment based on actual likes context structure
         if (likes && setLikes) {
-          const key = `post-${postId}`;
           setLikes({
             ...likes,
-            [key]: {
+            [likeKey]: {
               id: Date.now(), // Temporary ID
               userId: currentUser.id,
               postId: postId,
@@ -55,16 +57,8 @@ const IconPost: React.FC<IconPostProps> = ({ id: postId, isSinglePost }) => {
           ...posts,
           [postId]: {
             ...posts[postId],
-            likes: [
-              ...(posts[postId]?.likes ?? []),
-              {
-                id: Date.now(),
-                userId: currentUser.id,
-                likeableId: postId,
-                likeableType: 'post',
-                createdAt: new Date().toISOString(),
-              },
-            ],
+            likeCount: (posts[postId]?.likeCount ?? 0) + 1,
+            viewerHasLiked: true,
           },
         }));
 
@@ -76,8 +70,7 @@ const IconPost: React.FC<IconPostProps> = ({ id: postId, isSinglePost }) => {
   };
 
   const unlikePost = async () => {
-    const likeKey = `post-${postId}`;
-    if (!likes?.[likeKey]) {
+    if (!liked) {
       return;
     }
 
@@ -103,16 +96,14 @@ const IconPost: React.FC<IconPostProps> = ({ id: postId, isSinglePost }) => {
           setLikes(newLikes);
         }
 
-        setPosts((posts) => {
-          const newPost = { ...posts[postId] };
-          const filtered = (newPost.likes ?? []).filter(
-            (ele: Like) => ele.likeableId !== postId
-          );
-          return {
-            ...posts,
-            [postId]: { ...posts[postId], likes: filtered },
-          };
-        });
+        setPosts((posts) => ({
+          ...posts,
+          [postId]: {
+            ...posts[postId],
+            likeCount: Math.max((posts[postId]?.likeCount ?? 1) - 1, 0),
+            viewerHasLiked: false,
+          },
+        }));
 
         toast.info('Unliked post!', { autoClose: 1500 });
       }
@@ -131,9 +122,9 @@ const IconPost: React.FC<IconPostProps> = ({ id: postId, isSinglePost }) => {
       <div className='flex items-center'>
         <RiHeartLine
           size={24}
-          onClick={likes?.[`post-${postId}`] ? unlikePost : likePost}
+          onClick={liked ? unlikePost : likePost}
           className={
-            likes?.[`post-${postId}`]
+            liked
               ? 'text-red-500 cursor-pointer'
               : 'cursor-pointer text-gray-800'
           }
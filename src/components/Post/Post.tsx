@@ -1,5 +1,5 @@
 import React from 'react';
-import { Post as PostType, Comment, Like } from '../../types';
+import { Post as PostType, Comment } from '../../types';
 import PostHeader from './PostHeader';
 import PhotoImagePost from './PhotoImagePost';
 import IconPost from './IconPost';
@@ -9,7 +9,6 @@ import CommentInputField from './CommentInputField';
 interface PostProps {
   post: PostType & {
     comments?: Comment[];
-    likes?: Like[];
     isSinglePost?: boolean;
   };
 }
@@ -39,7 +38,7 @@ const Post: React.FC<PostProps> = ({ post, post: { id, imageUrl } }) => {
           comments={post.comments ?? []}
           createdAt={post.createdAt}
           isSinglePost={isSinglePost}
-          likes={post.likes ?? []}
+          likeCount={post.likeCount ?? 0}
           caption={post.caption ?? ''}
         />
         <CommentInputField id={id} isSinglePost={isSinglePost} />
@@ -17,18 +17,13 @@ interface PostComment {
   content: string;
 }
 
-interface PostLike {
-  id: number;
-  // Add other like properties as needed
-}
-
 interface PostCommentSectionProps {
   id: number;
   user: PostUser;
   comments: PostComment[];
   createdAt: string;
   isSinglePost: boolean;
-  likes: PostLike[];
+  likeCount: number;
   caption: string;
 }
 
@@ -38,7 +33,7 @@ const PostCommentSection: React.FC<PostCommentSectionProps> = ({
   comments,
   createdAt,
   isSinglePost,
-  likes,
+  likeCount,
   caption,
 }) => {
   function timeSince(timeStamp: string): string {
@@ -71,7 +66,7 @@ const PostCommentSection: React.FC<PostCommentSectionProps> = ({
   return (
     <div className='px-4 pb-4'>
       <div className='font-semibold text-sm border-none p-0 bg-transparent'>
-        {likes.length} likes
+        {likeCount} likes
       </div>
       <Caption userId={userId} username={username} caption={caption} />
 
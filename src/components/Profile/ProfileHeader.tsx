@@ -21,7 +21,7 @@ const ProfileHeader: React.FC<ProfileHeaderProps> = ({ windowSize }) => {
     logout,
     followUser,
     unfollowUser,
-    getFollowing,
+    getRelationships,
     isLoading,
     error,
     clearError,
@@ -33,39 +33,40 @@ const ProfileHeader: React.FC<ProfileHeaderProps> = ({ windowSize }) => {
   const [isEditProfilePicOpen, setIsEditProfilePicOpen] =
     useState<boolean>(false);
 
-  const [currentUserFollowingList, setCurrentUserFollowingList] = useState<
-    number[]
-  >([]);
+  const [isFollowingProfile, setIsFollowingProfile] = useState<boolean>(false);
 
   const { profileData, setProfileData } = useProfile();
+  const displayedUserId = profileData?.id;
 
   // All hooks must be called before conditional returns
   useEffect(() => {
-    if (!currentUser?.id || !profileData) return;
+    setIsFollowingProfile(false);
+    if (!currentUser?.id || !displayedUserId) return;
+    if (currentUser.id === displayedUserId) return;
 
-    const loadFollowing = async () => {
+    // Ask about the displayed user directly; the viewer's follow list is paged
+    const loadRelationship = async () => {
       try {
-        const response = await getFollowing(currentUser.id);
+        const response = await getRelationships({
+          viewerId: currentUser.id,
+          userIds: [displayedUserId],
+        });
 
         if (response.error) {
-          console.error('Failed to load following:', response.error);
+          console.error('Failed to load follow state:', response.error);
           return;
         }
 
-        if (response.data?.follows) {
-          const followingList: number[] = [];
-          response.data.follows.forEach((follow: Follow) => {
-            followingList.push(follow.userFollowedId);
-          });
-          setCurrentUserFollowingList(followingList);
-        }
+        setIsFollowingProfile(
+          response.data?.following.includes(displayedUserId) ?? false
+        );
       } catch (error) {
-        console.error('Error loading following:', error);
+        console.error('Error loading follow state:', error);
       }
     };
 
-    loadFollowing();
-  }, [profileData, currentUser?.id, getFollowing]);
+    loadRelationship();
+  }, [displayedUserId, currentUser?.id, getRelationships]);
 
   if (!profileData) {
     return null;
@@ -76,12 +77,12 @@ const ProfileHeader: React.FC<ProfileHeaderProps> = ({ windowSize }) => {
     bio,
     profileImageUrl: profileImg,
     username,
-    posts: userPosts = [],
     followers: userFollowers = [],
-    following: userFollowing = [],
+    numPosts = 0,
+    followerCount = 0,
+    followingCount = 0,
   } = profileData;
 
-  const numPosts = userPosts?.length ?? 0;
   const fullName = profileData.fullName ?? profileData.username;
 
   const closeEditPicModal = () => {
@@ -149,11 +150,13 @@ const ProfileHeader: React.FC<ProfileHeaderProps> = ({ windowSize }) => {
         return;
       }
 
+      setIsFollowingProfile(true);
       if (response.data?.follow) {
         const updatesList = [...userFollowers, response.data.follow];
         setProfileData({
           ...profileData,
           followers: updatesList,
+          followerCount: followerCount + 1,
         });
       }
     } catch (error) {
@@ -180,12 +183,14 @@ const ProfileHeader: React.FC<ProfileHeaderProps> = ({ windowSize }) => {
         return;
       }
 
+      setIsFollowingProfile(false);
       const filteredList = userFollowers.filter(
         (user: Follow) => user.userId !== currentUser.id
       );
       setProfileData({
         ...profileData,
         followers: filteredList,
+        followerCount: Math.max(followerCount - 1, 0),
       });
     } catch (error) {
       console.error('Error unfollowing user:', error);
@@ -256,7 +261,7 @@ const ProfileHeader: React.FC<ProfileHeaderProps> = ({ windowSize }) => {
                   Edit Profile
                 </button>
               </Link>
-            ) : currentUserFollowingList.includes(profileId) ? (
+            ) : isFollowingProfile ? (
               <button
                 className='w-[85px] h-7.5 bg-transparent px-2 py-1 border border-gray-300 rounded-sm text-sm font-bold hover:bg-gray-50 transition-colors disabled:opacity-50 disabled:cursor-not-allowed'
                 onClick={handleUnfollowUser}
@@ -316,7 +321,7 @@ const ProfileHeader: React.FC<ProfileHeaderProps> = ({ windowSize }) => {
                     Edit Profile
                   </button>
                 </Link>
-              ) : currentUserFollowingList.includes(profileId) ? (
+              ) : isFollowingProfile ? (
                 <button
                   className='px-4 py-1.5 border border-gray-300 rounded text-sm font-medium hover:bg-gray-50 disabled:opacity-50 disabled:cursor-not-allowed'
                   onClick={handleUnfollowUser}
@@ -358,9 +363,7 @@ const ProfileHeader: React.FC<ProfileHeaderProps> = ({ windowSize }) => {
                 role='button'
                 tabIndex={0}
               >
-                <span className='font-semibold'>
-                  {userFollowers?.length ?? 0}
-                </span>{' '}
+                <span className='font-semibold'>{followerCount}</span>{' '}
                 followers
               </div>
               <div
@@ -375,9 +378,7 @@ const ProfileHeader: React.FC<ProfileHeaderProps> = ({ windowSize }) => {
                 role='button'
                 tabIndex={0}
               >
-                <span className='font-semibold'>
-                  {userFollowing?.length ?? 0}
-                </span>{' '}
+                <span className='font-semibold'>{followingCount}</span>{' '}
                 following
               </div>
             </div>
@@ -14,7 +14,11 @@ const ProfileMiddle: React.FC = () => {
     return null;
   }
 
-  const numPosts = profileData.posts?.length ?? 0;
+  const {
+    numPosts = 0,
+    followerCount = 0,
+    followingCount = 0,
+  } = profileData;
 
   const closeFollowersModal = () => {
     setIsFollowersOpen(false);
@@ -60,9 +64,7 @@ const ProfileMiddle: React.FC = () => {
           role='button'
           tabIndex={0}
         >
-          <div className='font-bold text-sm'>
-            {profileData.followers?.length ?? 0}
-          </div>
+          <div className='font-bold text-sm'>{followerCount}</div>
           <div className='text-sm text-gray-400'>followers</div>
         </div>
         <div
@@ -77,9 +79,7 @@ const ProfileMiddle: React.FC = () => {
           role='button'
           tabIndex={0}
         >
-          <div className='font-bold text-sm'>
-            {profileData.following?.length ?? 0}
-          </div>
+          <div className='font-bold text-sm'>{followingCount}</div>
           <div className='text-sm text-gray-400'>following</div>
         </div>
       </section>
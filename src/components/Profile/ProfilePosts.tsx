@@ -1,6 +1,8 @@
 import React from 'react';
+import InfiniteScroll from 'react-infinite-scroll-component';
 import ProfilePost from './ProfilePost';
 import { useProfile } from '../../hooks/useContexts';
+import { useApi } from '../../utils/apiComposable';
 import { Post } from '../../types';
 
 interface ProfilePostsProps {
@@ -8,21 +10,54 @@ interface ProfilePostsProps {
 }
 
 const ProfilePosts: React.FC<ProfilePostsProps> = () => {
-  const { profileData } = useProfile();
+  const { profileData, setProfileData } = useProfile();
+  const { getProfilePosts, isLoading } = useApi();
 
   if (!profileData?.posts) {
     return <div className='text-center py-8 text-gray-500'>No posts yet</div>;
   }
+
+  const { id: profileId, username, postsNextCursor = null } = profileData;
+
+  // The profile payload carries the first page; follow next_cursor for the rest
+  const fetchMore = async () => {
+    if (isLoading || !postsNextCursor) return;
+
+    const response = await getProfilePosts(username, postsNextCursor);
+    if (response.error || !response.data) {
+      console.error('Failed to load more posts:', response.error);
+      return;
+    }
+
+    const { posts, nextCursor } = response.data;
+    setProfileData((current) =>
+      current?.id === profileId
+        ? {
+            ...current,
+            posts: [...(current.posts ?? []), ...posts],
+            postsNextCursor: nextCursor ?? null,
+          }
+        : current
+    );
+  };
+
   return (
-    <section className='grid grid-cols-3 gap-1 sm:gap-6 mt-5 pb-[53px] sm:pb-0 cursor-pointer auto-rows-fr'>
-      {profileData.posts.map((post: Post) => {
-        return (
-          <div key={`post-${post.id}`} className='aspect-square'>
-            <ProfilePost post={post} />
-          </div>
-        );
-      })}
-    </section>
+    <InfiniteScroll
+      dataLength={profileData.posts.length}
+      next={fetchMore}
+      hasMore={postsNextCursor !== null}
+      loader={<div className='text-center py-4'>Loading more posts...</div>}
+    >
+      <section className='grid grid-cols-3 gap-1 sm:gap-6 mt-5 pb-[53px] sm:pb-0 cursor-pointer auto-rows-fr'>
+        {profileData.posts.map((post: Post) => {
+          return (
+            <div key={`post-${post.id}`} className='aspect-square'>
+              <ProfilePost post={post} />
+            </div>
+          );
+        })}
+      </section>
+    </InfiniteScroll>
   );
 };
 
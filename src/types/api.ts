@@ -36,6 +36,11 @@ export interface User {
   posts?: Post[];
   followers?: Follow[];
   following?: Follow[];
+  // ...and the stored counters, which the arrays (first pages only) are not
+  numPosts?: number; // Backend: num_posts
+  followerCount?: number; // Backend: follower_count
+  followingCount?: number; // Backend: following_count
+  postsNextCursor?: string | null; // Backend: posts_next_cursor
 }
 
 export interface UserPublic {
@@ -93,9 +98,42 @@ export interface UserLookupResponse {
 export interface ProfileResponse {
   user: User;
   numPosts: number; // Backend: num_posts
+  followerCount: number; // Backend: follower_count
+  followingCount: number; // Backend: following_count
   posts: Post[];
   followersList: Follow[]; // Backend: followersList
   followingList: Follow[]; // Backend: followingList
+  postsNextCursor: string | null; // Backend: posts_next_cursor
+  followersNextCursor: string | null; // Backend: followers_next_cursor
+  followingNextCursor: string | null; // Backend: following_next_cursor
+}
+
+// Later pages of a profile's grid and follow lists (/api/profile/<username>/...)
+export interface ProfilePostsResponse {
+  posts: Post[];
+  nextCursor: string | null; // Backend: next_cursor
+}
+
+export type ProfileFollowList = 'followers' | 'following';
+
+export interface ProfileFollowsResponse {
+  follows: Follow[]; // Backend: followers / following
+  nextCursor: string | null; // Backend: next_cursor
+}
+
+// Bulk viewer state (POST /api/user/relationships), at most 500 ids per list
+export interface RelationshipsRequest {
+  viewerId: number; // Backend: viewer_id
+  userIds?: number[]; // Backend: user_ids
+  postIds?: number[]; // Backend: post_ids
+  commentIds?: number[]; // Backend: comment_ids
+}
+
+export interface RelationshipsResponse {
+  viewerId: number; // Backend: viewer_id
+  following: number[]; // The requested user ids the viewer follows
+  likedPosts: number[]; // Backend: liked_posts
+  likedComments: number[]; // Backend: liked_comments
 }
 
 export interface UpdateUserResponse {
@@ -128,9 +166,9 @@ export interface Post {
   user?: UserPublic;
   likeCount?: number; // Backend: like_count
   commentCount?: number; // Backend: comment_count
-  // Profile endpoint includes these related arrays
+  viewerHasLiked?: boolean; // Backend: viewer_has_liked (feed and single post)
+  // Feed and single post payloads include comments
   comments?: Comment[];
-  likes?: Like[];
 }
 
 export interface PostWithUser extends Post {
@@ -139,7 +177,8 @@ export interface PostWithUser extends Post {
 
 export interface PostDetail extends PostWithUser {
   comments: Comment[];
-  likes: Like[];
+  likeCount: number;
+  viewerHasLiked: boolean;
 }
 
 // Post API Request Types
@@ -155,6 +194,7 @@ export interface UpdatePostRequest {
 // Post API Response Types
 export interface PostsResponse {
   posts: Post[];
+  nextCursor?: string | null; // Backend: next_cursor (explore); null on the last page
 }
 
 export interface CreatePostResponse {
@@ -344,12 +384,22 @@ export interface APIEndpoints {
       data: UpdateUserRequest
     ) => Promise<APIResponse<UpdateUserResponse>>;
     resetImage: (userId: number) => Promise<APIResponse<ResetImageResponse>>;
+    getProfilePosts: (
+      username: string,
+      cursor?: string | null
+    ) => Promise<APIResponse<ProfilePostsResponse>>;
+    getRelationships: (
+      data: RelationshipsRequest
+    ) => Promise<APIResponse<RelationshipsResponse>>;
   };
 
   // Post endpoints
   post: {
     getPosts: (offset: number) => Promise<APIResponse<PostsResponse>>;
-    getExplorePosts: (offset: number) => Promise<APIResponse<PostsResponse>>;
+    getExplorePosts: (
+      offset: number,
+      cursor?: string | null
+    ) => Promise<APIResponse<PostsResponse>>;
     createPost: (
       data: CreatePostRequest
     ) => Promise<APIResponse<CreatePostResponse>>;
@@ -400,6 +450,11 @@ export interface APIEndpoints {
     getFollowing: (
       userId: number
     ) => Promise<APIResponse<{ follows: Follow[] }>>;
+    getProfileFollows: (
+      username: string,
+      list: ProfileFollowList,
+      cursor?: string | null
+    ) => Promise<APIResponse<ProfileFollowsResponse>>;
   };
 
   // Search endpoints
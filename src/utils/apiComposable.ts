@@ -32,6 +32,11 @@ import {
   Post,
   PostDetail,
   ProfileResponse,
+  ProfilePostsResponse,
+  ProfileFollowList,
+  ProfileFollowsResponse,
+  RelationshipsRequest,
+  RelationshipsResponse,
 } from '../types';
 import { useUser } from '../Contexts/userContext';
 
@@ -229,6 +234,65 @@ export function useApi() {
     [clearError]
   );
 
+  const getProfilePosts = useCallback(
+    async (
+      username: string,
+      cursor?: string | null
+    ): Promise<APIResponse<ProfilePostsResponse>> => {
+      try {
+        setIsLoading(true);
+        clearError();
+
+        const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : '';
+        const response = (await apiCall(
+          `/api/profile/${encodeURIComponent(username)}/posts${query}`,
+          {
+            headers: getAuthHeaders(),
+          }
+        )) as { data?: ProfilePostsResponse };
+
+        return { data: response.data };
+      } catch (err) {
+        const apiError = handleApiError(err);
+        setError(apiError.error);
+        return { error: apiError.error };
+      } finally {
+        setIsLoading(false);
+      }
+    },
+    [clearError]
+  );
+
+  const getRelationships = useCallback(
+    async (
+      data: RelationshipsRequest
+    ): Promise<APIResponse<RelationshipsResponse>> => {
+      try {
+        setIsLoading(true);
+        clearError();
+
+        const response = (await apiCall('/api/user/relationships', {
+          method: 'POST',
+          headers: {
+            // apiFetch converts the body to snake_case only for this key
+            'content-type': 'application/json',
+            ...getAuthHeaders(),
+          },
+          body: JSON.stringify(data),
+        })) as { data?: RelationshipsResponse };
+
+        return { data: response.data };
+      } catch (err) {
+        const apiError = handleApiError(err);
+        setError(apiError.error);
+        return { error: apiError.error };
+      } finally {
+        setIsLoading(false);
+      }
+    },
+    [clearError]
+  );
+
   const updateUser = useCallback(
     async (
       data: UpdateUserRequest
@@ -312,12 +376,16 @@ export function useApi() {
   );
 
   const getExplorePosts = useCallback(
-    async (offset: number): Promise<APIResponse<PostsResponse>> => {
+    async (
+      offset: number,
+      cursor?: string | null
+    ): Promise<APIResponse<PostsResponse>> => {
       try {
         setIsLoading(true);
         clearError();
 
-        const response = (await apiCall(`/api/post/explore/scroll/${offset}`, {
+        const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : '';
+        const response = (await apiCall(`/api/post/explore/${offset}${query}`, {
           headers: getAuthHeaders(),
         })) as { data?: PostsResponse };
 
@@ -674,6 +742,48 @@ export function useApi() {
     [clearError]
   );
 
+  const getProfileFollows = useCallback(
+    async (
+      username: string,
+      list: ProfileFollowList,
+      cursor?: string | null
+    ): Promise<APIResponse<ProfileFollowsResponse>> => {
+      try {
+        setIsLoading(true);
+        clearError();
+
+        const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : '';
+        const response = (await apiCall(
+          `/api/profile/${encodeURIComponent(username)}/${list}${query}`,
+          {
+            headers: getAuthHeaders(),
+          }
+        )) as {
+          data?: Partial<Record<ProfileFollowList, ProfileFollowsResponse['follows']>> & {
+            nextCursor: string | null;
+          };
+        };
+
+        if (!response.data) {
+          return { data: undefined };
+        }
+        return {
+          data: {
+            follows: response.data[list] ?? [],
+            nextCursor: response.data.nextCursor ?? null,
+          },
+        };
+      } catch (err) {
+        const apiError = handleApiError(err);
+        setError(apiError.error);
+        return { error: apiError.error };
+      } finally {
+        setIsLoading(false);
+      }
+    },
+    [clearError]
+  );
+
   const search = useCallback(
     async (query: string): Promise<APIResponse<SearchResponse>> => {
       try {
@@ -709,6 +819,8 @@ export function useApi() {
     // User
     lookupUser,
     getProfile,
+    getProfilePosts,
+    getRelationships,
     updateUser,
     resetUserImage,
 
@@ -734,6 +846,7 @@ export function useApi() {
     unfollowUser,
     getFollowers,
     getFollowing,
+    getProfileFollows,
 
     // Search
     search,